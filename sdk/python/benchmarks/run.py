@@ -0,0 +1,256 @@
+# ruff: noqa: T201
+"""Benchmarks of the experiment tracking stack.
+
+Every case is timed over several rounds on fresh data in a temporary
+directory and reported as the best wall time, which is the least sensitive to
+other load on the machine. Results are compared with
+``baselines.json``; a case slower than its baseline by more than the threshold
+is a regression and makes the run exit with status 1.
+
+    python -m benchmarks.run                      # compare with the baselines
+    python -m benchmarks.run --only span_export   # run some cases
+    python -m benchmarks.run --save               # record new baselines
+
+Baselines depend on the machine, record them on yours before comparing.
+"""
+
+import argparse
+import json
+import sys
+import tarfile
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+from luml.experiments.tracker import ExperimentTracker
+from luml.modelref import ModelReference
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+# a case prepares its data in the given directory and returns the timed callable
+Case = Callable[[Path], Callable[[], object]]
+CASES: dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    def register(fn: Case) -> Case:
+        CASES[name] = fn
+        return fn
+
+    return register
+
+
+def _backend(path: Path, experiment_id: str = "bench", **options: str) -> SQLiteBackend:
+    backend = SQLiteBackend(str(path / "experiments"), **options)
+    backend.initialize_experiment(experiment_id)
+    return backend
+
+
+@case("metric_logging")
+def metric_logging(path: Path) -> Callable[[], object]:
+    """2,000 unbuffered ``log_dynamic`` calls, one write each.
+
+    Uses the "fast" PRAGMA profile, fsync times measure the disk, not the SDK.
+    """
+    backend = _backend(path, pragma_profile="fast")
+
+    def run() -> None:
+        for step in range(2_000):
+            backend.log_dynamic("bench", "loss", 1 / (step + 1), step=step)
+
+    return run
+
+
+@case("metric_logging_buffered")
+def metric_logging_buffered(path: Path) -> Callable[[], object]:
+    """100,000 buffered ``log_dynamic`` calls including the final flush."""
+    backend = _backend(path, buffered="true", flush_size="10000")
+
+    def run() -> None:
+        for step in range(100_000):
+            backend.log_dynamic("bench", "loss", 1 / (step + 1), step=step)
+        backend.flush("bench")
+
+    return run
+
+
+def _readable_spans(count: int) -> list:
+    from opentelemetry.sdk.trace import ReadableSpan
+    from opentelemetry.trace import SpanContext, SpanKind, Status, StatusCode
+
+    spans = []
+    for i in range(count):
+        trace_id, span_number = divmod(i, 10)
+        context = SpanContext(trace_id + 1, i + 1, is_remote=False)
+        parent = None
+        if span_number:
+            parent = SpanContext(trace_id + 1, i + 1 - span_number, is_remote=False)
+        spans.append(
+            ReadableSpan(
+                name="chat",
+                context=context,
+                parent=parent,
+                kind=SpanKind.CLIENT,
+                attributes={
+                    "gen_ai.operation.name": "chat",
+                    "gen_ai.request.model": "bench-model",
+                    "gen_ai.usage.input_tokens": 120,
+                    "gen_ai.usage.output_tokens": 40,
+                    "gen_ai.prompt.0.content": f"question {i} " * 20,
+                },
+                start_time=i * 1_000,
+                end_time=i * 1_000 + 500,
+                status=Status(StatusCode.OK),
+            )
+        )
+    return spans
+
+
+@case("span_export")
+def span_export(path: Path) -> Callable[[], object]:
+    """20,000 spans through ``LumlSpanExporter`` in batches of 512."""
+    from luml.experiments.tracing.span_exporter import LumlSpanExporter
+
+    tracker = ExperimentTracker(f"sqlite://{path / 'experiments'}")
+    tracker.start_experiment("bench")
+    exporter = LumlSpanExporter(
+        log_fn=tracker.log_span, batch_size=512, log_batch_fn=tracker.log_spans
+    )
+    spans = _readable_spans(20_000)
+
+    def run() -> None:
+        for i in range(0, len(spans), 512):
+            exporter.export(spans[i : i + 512])
+
+    return run
+
+
+def _experiment_data_case(points: int) -> Case:
+    calls = 100_000 // points
+
+    def prepare(path: Path) -> Callable[[], object]:
+        backend = _backend(path)
+        for key in ("loss", "accuracy", "lr", "grad_norm"):
+            backend.log_dynamic_series(
+                "bench", key, [i / points for i in range(points)]
+            )
+        backend.log_static_many("bench", {f"param_{i}": i for i in range(50)})
+        # opens the read connection, the case measures warm reads
+        backend.get_experiment_data("bench")
+
+        def run() -> None:
+            for _ in range(calls):
+                backend.get_experiment_data("bench")
+
+        return run
+
+    prepare.__doc__ = (
+        f"{calls} ``get_experiment_data`` calls, 4 metrics of {points:,} points."
+    )
+    return prepare
+
+
+for _points in (1_000, 10_000, 100_000):
+    case(f"get_experiment_data_{_points}")(_experiment_data_case(_points))
+
+
+def _log_attachments(backend: SQLiteBackend, count: int, size: int) -> None:
+    payload = bytes(range(256)) * (size // 256)
+    for i in range(count):
+        backend.log_attachment(
+            "bench", f"files/attachment_{i}.bin", payload, binary=True
+        )
+
+
+@case("attachment_export")
+def attachment_export(path: Path) -> Callable[[], object]:
+    """``export_attachments`` of 200 attachments of 256 KiB."""
+    backend = _backend(path)
+    _log_attachments(backend, 200, 256 * 1024)
+    return lambda: backend.export_attachments("bench")
+
+
+@case("link_to_model")
+def link_to_model(path: Path) -> Callable[[], object]:
+    """``link_to_model`` of 20,000 metric points, 5,000 spans and 50 attachments."""
+    tracker = ExperimentTracker(f"sqlite://{path / 'experiments'}")
+    tracker.start_experiment("bench")
+    tracker.log_dynamic_series("loss", [1 / (i + 1) for i in range(20_000)])
+    tracker.log_spans(
+        {
+            "trace_id": f"{i // 10:032x}",
+            "span_id": f"{i:016x}",
+            "name": "step",
+            "start_time_unix_nano": i,
+            "end_time_unix_nano": i + 1,
+            "attributes": {"gen_ai.prompt.0.content": f"question {i}"},
+        }
+        for i in range(5_000)
+    )
+    _log_attachments(tracker.backend, 50, 256 * 1024)  # type: ignore[arg-type]
+    model_path = path / "model.luml"
+    tarfile.open(model_path, "w").close()
+    return lambda: tracker.link_to_model(ModelReference(str(model_path)))
+
+
+def measure(prepare: Case, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        with tempfile.TemporaryDirectory(prefix="luml-bench-") as tmp:
+            run = prepare(Path(tmp))
+            started = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), metavar="CASE")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown relative to the baseline (default: 0.25 = 25%%)",
+    )
+    parser.add_argument("--save", action="store_true", help="record new baselines")
+    parser.add_argument("--baselines", type=Path, default=BASELINES_PATH)
+    args = parser.parse_args(argv)
+
+    baselines: dict[str, float] = {}
+    if args.baselines.exists():
+        baselines = json.loads(args.baselines.read_text())
+
+    results: dict[str, float] = {}
+    regressions = []
+    for name in args.only or CASES:
+        results[name] = seconds = measure(CASES[name], args.rounds)
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name:<32} {seconds:9.4f}s   (no baseline)")
+            continue
+        change = seconds / baseline - 1
+        regressed = change > args.threshold
+        if regressed:
+            regressions.append(name)
+        marker = "  REGRESSION" if regressed else ""
+        print(f"{name:<32} {seconds:9.4f}s   {change:+7.1%} vs {baseline:.4f}s{marker}")
+
+    if args.save:
+        baselines.update({name: round(t, 4) for name, t in results.items()})
+        args.baselines.write_text(
+            json.dumps(baselines, indent=2, sort_keys=True) + "\n"
+        )
+        print(f"Saved baselines to {args.baselines}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
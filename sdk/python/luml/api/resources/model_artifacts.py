@@ -1,4 +1,5 @@
 import builtins
+import os
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Coroutine, Iterator
 from typing import TYPE_CHECKING, Any
@@ -17,8 +18,13 @@ from luml.api._utils import find_by_value
 from luml.api.resources._listed_resource import ListedResource
 from luml.api.resources._validators import validate_collection
 from luml.api.services.upload_service import AsyncUploadService, UploadService
+from luml.api.utils.base_file_handler import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+)
 from luml.api.utils.model_artifacts import ModelFileHandler
-from luml.api.utils.s3_file_handler import S3FileHandler
+from luml.api.utils.s3_file_handler import AsyncS3FileHandler, S3FileHandler
+from luml.api.utils.upload_journal import UploadJournal
 
 if TYPE_CHECKING:
     from luml.api._client import AsyncLumlClient, LumlClient
@@ -72,6 +78,19 @@ class ModelArtifactResourceBase(ABC):
         tags: builtins.list[str] | None = None,
         *,
         collection_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> ModelArtifact | Coroutine[Any, Any, ModelArtifact]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def resume_upload(
+        self,
+        file_path: str,
+        *,
+        collection_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
     ) -> ModelArtifact | Coroutine[Any, Any, ModelArtifact]:
         raise NotImplementedError()
 
@@ -82,6 +101,7 @@ class ModelArtifactResourceBase(ABC):
         file_path: str | None = None,
         *,
         collection_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None | Coroutine[Any, Any, None]:
         raise NotImplementedError()
 
@@ -498,6 +518,8 @@ class ModelArtifactResource(ModelArtifactResourceBase, ListedResource):
         tags: builtins.list[str] | None = None,
         *,
         collection_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
     ) -> ModelArtifact:
         """Upload model artifact file to the collection.
 
@@ -511,6 +533,11 @@ class ModelArtifactResource(ModelArtifactResourceBase, ListedResource):
             tags: Optional list of tags for organizing models.
             collection_id: ID of the collection to upload to. If not provided,
                 uses the default collection set in the client.
+            max_concurrency: Maximum number of parts uploaded at once
+                in a multipart upload.
+            buffer_size: Bytes read from the file per chunk while streaming.
+                Peak memory of the upload is about
+                ``max_concurrency * buffer_size``.
 
         Returns:
             ModelArtifact: Uploaded model artifact object with
@@ -593,13 +620,16 @@ class ModelArtifactResource(ModelArtifactResourceBase, ListedResource):
         model = created_model_data.model
 
         try:
-            upload_service = UploadService(self._client.bucket_secrets)
+            upload_service = UploadService(
+                self._client.bucket_secrets, max_concurrency, buffer_size
+            )
 
             response = upload_service.upload_file(
                 upload_details=created_model_data.upload_details,
                 file_path=file_path,
                 file_size=model.size,
                 file_name=model.file_name,
+                model_id=model.id,
             )
 
             status = (
@@ -621,6 +651,73 @@ class ModelArtifactResource(ModelArtifactResourceBase, ListedResource):
             collection_id=collection_id,
         )
 
+    @validate_collection
+    def resume_upload(
+        self,
+        file_path: str,
+        *,
+        collection_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> ModelArtifact:
+        """Resume an interrupted multipart upload of a model artifact.
+
+        When a multipart upload started by `upload` fails, the parts already
+        stored in the bucket are kept in a local journal. This method requests
+        fresh upload URLs and sends only the missing parts, then marks the
+        model artifact as uploaded.
+
+        Args:
+            file_path: Path to the local model file passed to `upload`.
+                The file must not have changed since.
+            collection_id: ID of the collection containing the model. If not
+                provided, uses the default collection set in the client.
+            max_concurrency: Maximum number of parts uploaded at once.
+            buffer_size: Bytes read from the file per chunk while streaming.
+
+        Returns:
+            ModelArtifact: Model artifact object with UPLOADED status.
+
+        Raises:
+            FileUploadError: If there is no interrupted upload of the file
+                or the upload fails again.
+            ConfigurationError: If collection_id not provided and
+                no default collection set.
+
+        Example:
+        ```python
+        try:
+            model = luml.model_artifacts.upload(
+                file_path="/path/to/model.luml",
+                model_name="My Model",
+            )
+        except FileUploadError:
+            model = luml.model_artifacts.resume_upload("/path/to/model.luml")
+        ```
+        """
+        journal = UploadJournal.load(file_path)
+        if journal is None or journal.model_id is None:
+            raise FileUploadError(f" No interrupted upload of {file_path} to resume.")
+
+        try:
+            upload_service = UploadService(
+                self._client.bucket_secrets, max_concurrency, buffer_size
+            )
+            upload_service.resume_upload(journal, file_name=os.path.basename(file_path))
+        except FileUploadError as error:
+            self.update(
+                model_id=journal.model_id,
+                status=ModelArtifactStatus.UPLOAD_FAILED,
+                collection_id=collection_id,
+            )
+            raise error
+
+        return self.update(
+            model_id=journal.model_id,
+            status=ModelArtifactStatus.UPLOADED,
+            collection_id=collection_id,
+        )
+
     @validate_collection
     def download(
         self,
@@ -628,11 +725,15 @@ class ModelArtifactResource(ModelArtifactResourceBase, ListedResource):
         file_path: str | None = None,
         *,
         collection_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         """Download model artifact file from the collection.
 
         Downloads the model file to local storage with progress tracking.
-        If collection_id is None, uses the default collection from client.
+        The file is fetched in parts with concurrent range requests, an
+        interrupted download is resumed on the next call with the same
+        file_path. If collection_id is None, uses the default collection
+        from client.
 
         Args:
             model_id: ID of the model artifact to download.
@@ -640,12 +741,15 @@ class ModelArtifactResource(ModelArtifactResourceBase, ListedResource):
                 uses the original file name.
             collection_id: ID of the collection containing the model. If not provided,
                 uses the default collection set in the client.
+            max_concurrency: Maximum number of parts downloaded at once.
 
         Returns:
             None: File is saved to the specified path.
 
         Raises:
             ValueError: If model with specified ID not found.
+            FileDownloadError: If the download fails or the downloaded file
+                does not match the hash of the model artifact.
             ConfigurationError: If collection_id not provided and
                 no default collection set.
 
@@ -668,10 +772,10 @@ class ModelArtifactResource(ModelArtifactResourceBase, ListedResource):
         )
         ```
         """
+        model = self._get_by_id(collection_id=collection_id, model_value=model_id)
+        if model is None:
+            raise ValueError(f"Model with id {model_id} not found")
         if file_path is None:
-            model = self._get_by_id(collection_id=collection_id, model_value=model_id)
-            if model is None:
-                raise ValueError(f"Model with id {model_id} not found")
             file_path = model.file_name
 
         download_info = self.download_url(
@@ -679,11 +783,12 @@ class ModelArtifactResource(ModelArtifactResourceBase, ListedResource):
         )
         download_url = download_info["url"]
 
-        handler = S3FileHandler()
+        handler = S3FileHandler(max_concurrency)
         handler.download_file_with_progress(
             url=download_url,
             file_path=file_path,
             file_name=f'model id="{model_id}"',
+            file_hash=model.file_hash,
         )
 
     @validate_collection
@@ -1362,6 +1467,8 @@ class AsyncModelArtifactResource(ModelArtifactResourceBase, ListedResource):
         tags: builtins.list[str] | None = None,
         *,
         collection_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
     ) -> ModelArtifact:
         """Upload model artifact file to the collection.
 
@@ -1376,6 +1483,11 @@ class AsyncModelArtifactResource(ModelArtifactResourceBase, ListedResource):
             tags: Optional list of tags for organizing models.
             collection_id: ID of the collection to upload to. If not provided,
                 uses the default collection set in the client.
+            max_concurrency: Maximum number of parts uploaded at once
+                in a multipart upload.
+            buffer_size: Bytes read from the file per chunk while streaming.
+                Peak memory of the upload is about
+                ``max_concurrency * buffer_size``.
 
         Returns:
             ModelArtifact: Uploaded model artifact object with
@@ -1449,13 +1561,16 @@ class AsyncModelArtifactResource(ModelArtifactResourceBase, ListedResource):
         model = created_model_data.model
 
         try:
-            upload_service = AsyncUploadService(self._client.bucket_secrets)
+            upload_service = AsyncUploadService(
+                self._client.bucket_secrets, max_concurrency, buffer_size
+            )
 
             response = await upload_service.upload_file(
                 upload_details=created_model_data.upload_details,
                 file_path=file_path,
                 file_size=model.size,
                 file_name=model.file_name,
+                model_id=model.id,
             )
 
             status = (
@@ -1473,6 +1588,75 @@ class AsyncModelArtifactResource(ModelArtifactResourceBase, ListedResource):
 
         return await self.update(model.id, status=status, collection_id=collection_id)
 
+    @validate_collection
+    async def resume_upload(
+        self,
+        file_path: str,
+        *,
+        collection_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> ModelArtifact:
+        """Resume an interrupted multipart upload of a model artifact.
+
+        When a multipart upload started by `upload` fails, the parts already
+        stored in the bucket are kept in a local journal. This method requests
+        fresh upload URLs and sends only the missing parts, then marks the
+        model artifact as uploaded.
+
+        Args:
+            file_path: Path to the local model file passed to `upload`.
+                The file must not have changed since.
+            collection_id: ID of the collection containing the model. If not
+                provided, uses the default collection set in the client.
+            max_concurrency: Maximum number of parts uploaded at once.
+            buffer_size: Bytes read from the file per chunk while streaming.
+
+        Returns:
+            ModelArtifact: Model artifact object with UPLOADED status.
+
+        Raises:
+            FileUploadError: If there is no interrupted upload of the file
+                or the upload fails again.
+            ConfigurationError: If collection_id not provided and
+                no default collection set.
+
+        Example:
+        ```python
+        try:
+            model = await luml.model_artifacts.upload(
+                file_path="/path/to/model.luml",
+                model_name="My Model",
+            )
+        except FileUploadError:
+            model = await luml.model_artifacts.resume_upload("/path/to/model.luml")
+        ```
+        """
+        journal = UploadJournal.load(file_path)
+        if journal is None or journal.model_id is None:
+            raise FileUploadError(f" No interrupted upload of {file_path} to resume.")
+
+        try:
+            upload_service = AsyncUploadService(
+                self._client.bucket_secrets, max_concurrency, buffer_size
+            )
+            await upload_service.resume_upload(
+                journal, file_name=os.path.basename(file_path)
+            )
+        except FileUploadError as error:
+            await self.update(
+                model_id=journal.model_id,
+                status=ModelArtifactStatus.UPLOAD_FAILED,
+                collection_id=collection_id,
+            )
+            raise error
+
+        return await self.update(
+            model_id=journal.model_id,
+            status=ModelArtifactStatus.UPLOADED,
+            collection_id=collection_id,
+        )
+
     @validate_collection
     async def download(
         self,
@@ -1480,12 +1664,16 @@ class AsyncModelArtifactResource(ModelArtifactResourceBase, ListedResource):
         file_path: str | None = None,
         *,
         collection_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         """
         Download model artifact file from the collection.
 
         Downloads the model file to local storage with progress tracking.
-        If collection_id is None, uses the default collection from client.
+        The file is fetched in parts with concurrent range requests, an
+        interrupted download is resumed on the next call with the same
+        file_path. If collection_id is None, uses the default collection
+        from client.
 
         Args:
             model_id: ID of the model artifact to download.
@@ -1493,12 +1681,15 @@ class AsyncModelArtifactResource(ModelArtifactResourceBase, ListedResource):
                 uses the original file name.
             collection_id: ID of the collection containing the model. If not provided,
                 uses the default collection set in the client.
+            max_concurrency: Maximum number of parts downloaded at once.
 
         Returns:
             None: File is saved to the specified path.
 
         Raises:
             ValueError: If model with specified ID not found.
+            FileDownloadError: If the download fails or the downloaded file
+                does not match the hash of the model artifact.
             ConfigurationError: If collection_id not provided and
                 no default collection set.
 
@@ -1528,12 +1719,10 @@ class AsyncModelArtifactResource(ModelArtifactResourceBase, ListedResource):
             )
         ```
         """
+        model = await self._get_by_id(collection_id=collection_id, model_value=model_id)
+        if model is None:
+            raise ValueError(f"Model with id {model_id} not found")
         if file_path is None:
-            model = await self._get_by_id(
-                collection_id=collection_id, model_value=model_id
-            )
-            if model is None:
-                raise ValueError(f"Model with id {model_id} not found")
             file_path = model.file_name
 
         download_info = await self.download_url(
@@ -1541,11 +1730,12 @@ class AsyncModelArtifactResource(ModelArtifactResourceBase, ListedResource):
         )
         download_url = download_info["url"]
 
-        handler = S3FileHandler()
-        handler.download_file_with_progress(
+        handler = AsyncS3FileHandler(max_concurrency)
+        await handler.download_file_with_progress(
             url=download_url,
             file_path=file_path,
             file_name=f'model id="{model_id}"',
+            file_hash=model.file_hash,
         )
 
     @validate_collection
@@ -1,10 +1,19 @@
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import httpx
 
-from luml.api._exceptions import LumlAPIError
-from luml.api._types import UploadDetails
-from luml.api.utils.file_handler_factory import create_file_handler
+from luml.api._exceptions import FileUploadError, LumlAPIError
+from luml.api._types import PartDetails, UploadDetails
+from luml.api.utils.base_file_handler import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+)
+from luml.api.utils.file_handler_factory import (
+    create_async_file_handler,
+    create_file_handler,
+)
+from luml.api.utils.upload_journal import UploadJournal
 
 if TYPE_CHECKING:
     from luml.api.resources.bucket_secrets import (
@@ -13,9 +22,27 @@ if TYPE_CHECKING:
     )
 
 
+def _check_resumable(journal: UploadJournal, parts: list[PartDetails]) -> None:
+    # uploaded parts are only valid if the file is split the same way again
+    if parts and parts[0].part_size != journal.part_size:
+        raise FileUploadError(
+            f" The part size changed from {journal.part_size} to "
+            f"{parts[0].part_size} bytes, the upload can not be resumed."
+        )
+
+
 class UploadService:
-    def __init__(self, bucket_secrets_client: "BucketSecretResource") -> None:
+    def __init__(
+        self,
+        bucket_secrets_client: "BucketSecretResource",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        journal_dir: str | Path | None = None,
+    ) -> None:
         self._bucket_secrets = bucket_secrets_client
+        self._max_concurrency = max_concurrency
+        self._buffer_size = buffer_size
+        self._journal_dir = journal_dir
 
     def upload_file(
         self,
@@ -23,8 +50,11 @@ class UploadService:
         file_path: str,
         file_size: int,
         file_name: str = "",
+        model_id: str | None = None,
     ) -> httpx.Response:
-        handler = create_file_handler(upload_details.type)
+        handler = create_file_handler(
+            upload_details.type, self._max_concurrency, self._buffer_size
+        )
 
         if upload_details.multipart:
             upload_id = handler.initiate_multipart_upload(upload_details.url)
@@ -36,14 +66,25 @@ class UploadService:
                 upload_id,
             )
 
-            return handler.upload_multipart(
+            journal = UploadJournal.start(
+                file_path,
+                upload_details,
+                upload_id,
+                multipart_urls.parts[0].part_size if multipart_urls.parts else 0,
+                model_id=model_id,
+                journal_dir=self._journal_dir,
+            )
+            response = handler.upload_multipart(
                 parts=multipart_urls.parts,
                 complete_url=multipart_urls.complete_url,
                 file_size=file_size,
                 file_path=file_path,
                 file_name=file_name,
                 upload_id=upload_id,
+                journal=journal,
             )
+            journal.remove()
+            return response
         if not upload_details.url:
             raise LumlAPIError("Upload URL is required for simple upload")
         return handler.upload_simple(
@@ -53,10 +94,45 @@ class UploadService:
             file_name=file_name,
         )
 
+    def resume_upload(
+        self, journal: UploadJournal, file_name: str = ""
+    ) -> httpx.Response:
+        handler = create_file_handler(
+            journal.bucket_type, self._max_concurrency, self._buffer_size
+        )
+        multipart_urls = self._bucket_secrets.get_multipart_upload_urls(
+            journal.bucket_secret_id,
+            journal.bucket_location,
+            journal.file_size,
+            journal.upload_id,
+        )
+        _check_resumable(journal, multipart_urls.parts)
+
+        response = handler.upload_multipart(
+            parts=multipart_urls.parts,
+            complete_url=multipart_urls.complete_url,
+            file_size=journal.file_size,
+            file_path=journal.file_path,
+            file_name=file_name,
+            upload_id=journal.upload_id,
+            journal=journal,
+        )
+        journal.remove()
+        return response
+
 
 class AsyncUploadService:
-    def __init__(self, bucket_secrets_client: "AsyncBucketSecretResource") -> None:
+    def __init__(
+        self,
+        bucket_secrets_client: "AsyncBucketSecretResource",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        journal_dir: str | Path | None = None,
+    ) -> None:
         self._bucket_secrets = bucket_secrets_client
+        self._max_concurrency = max_concurrency
+        self._buffer_size = buffer_size
+        self._journal_dir = journal_dir
 
     async def upload_file(
         self,
@@ -64,11 +140,14 @@ class AsyncUploadService:
         file_path: str,
         file_size: int,
         file_name: str = "",
+        model_id: str | None = None,
     ) -> httpx.Response:
-        handler = create_file_handler(upload_details.type)
+        handler = create_async_file_handler(
+            upload_details.type, self._max_concurrency, self._buffer_size
+        )
 
         if upload_details.multipart:
-            upload_id = handler.initiate_multipart_upload(upload_details.url)
+            upload_id = await handler.initiate_multipart_upload(upload_details.url)
 
             multipart_urls = await self._bucket_secrets.get_multipart_upload_urls(
                 upload_details.bucket_secret_id,
@@ -77,19 +156,56 @@ class AsyncUploadService:
                 upload_id,
             )
 
-            return handler.upload_multipart(
+            journal = UploadJournal.start(
+                file_path,
+                upload_details,
+                upload_id,
+                multipart_urls.parts[0].part_size if multipart_urls.parts else 0,
+                model_id=model_id,
+                journal_dir=self._journal_dir,
+            )
+            response = await handler.upload_multipart(
                 parts=multipart_urls.parts,
                 complete_url=multipart_urls.complete_url,
                 file_size=file_size,
                 file_path=file_path,
                 file_name=file_name,
                 upload_id=upload_id,
+                journal=journal,
             )
+            journal.remove()
+            return response
         if not upload_details.url:
             raise LumlAPIError("Upload URL is required for simple upload")
-        return handler.upload_simple(
+        return await handler.upload_simple(
             url=upload_details.url,
             file_path=file_path,
             file_size=file_size,
             file_name=file_name,
         )
+
+    async def resume_upload(
+        self, journal: UploadJournal, file_name: str = ""
+    ) -> httpx.Response:
+        handler = create_async_file_handler(
+            journal.bucket_type, self._max_concurrency, self._buffer_size
+        )
+        multipart_urls = await self._bucket_secrets.get_multipart_upload_urls(
+            journal.bucket_secret_id,
+            journal.bucket_location,
+            journal.file_size,
+            journal.upload_id,
+        )
+        _check_resumable(journal, multipart_urls.parts)
+
+        response = await handler.upload_multipart(
+            parts=multipart_urls.parts,
+            complete_url=multipart_urls.complete_url,
+            file_size=journal.file_size,
+            file_path=journal.file_path,
+            file_name=file_name,
+            upload_id=journal.upload_id,
+            journal=journal,
+        )
+        journal.remove()
+        return response
@@ -1,13 +1,30 @@
+import asyncio
 import base64
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
 
 import httpx
 
 from luml.api._exceptions import FileUploadError
 from luml.api._types import PartDetails
-from luml.api.utils.base_file_handler import BaseFileHandler
+from luml.api.utils.base_file_handler import (
+    AsyncBaseFileHandler,
+    BaseFileHandler,
+    aiter_file_range,
+)
+from luml.api.utils.upload_journal import UploadJournal
+
+_UPLOAD_TIMEOUT = httpx.Timeout(connect=30.0, read=300.0, write=600.0, pool=30.0)
+
+
+def _block_list_xml(block_ids: list[str]) -> str:
+    block_ids.sort()
+
+    xml_blocks = ""
+    for block_id in block_ids:
+        xml_blocks += f"<Latest>{block_id}</Latest>"
+
+    return f'<?xml version="1.0" encoding="utf-8"?><BlockList>{xml_blocks}</BlockList>'
 
 
 class AzureFileHandler(BaseFileHandler):
@@ -23,18 +40,16 @@ class AzureFileHandler(BaseFileHandler):
         try:
             update_progress = self.create_progress_bar(file_size, file_name)
 
-            timeout = httpx.Timeout(connect=30.0, read=300.0, write=600.0, pool=30.0)
-
             response = httpx.put(
                 url,
                 content=self.create_file_generator(
-                    file_path, file_size, update_progress
+                    file_path, file_size, update_progress, self.buffer_size
                 ),
                 headers={
                     "Content-Length": str(file_size),
                     "x-ms-blob-type": "BlockBlob",
                 },
-                timeout=timeout,
+                timeout=_UPLOAD_TIMEOUT,
             )
 
             self.finish_progress()
@@ -52,29 +67,32 @@ class AzureFileHandler(BaseFileHandler):
         file_path: str,
         file_name: str = "",
         upload_id: str | None = None,
+        journal: UploadJournal | None = None,
     ) -> httpx.Response:
         try:
             update_progress = self.create_progress_bar(file_size, file_name)
-            block_ids = []
-            progress_lock = Lock()
-
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                future_to_part = {
+            pending = self._pending_parts(parts, file_size, journal, update_progress)
+            block_ids = list(journal.completed_parts.values()) if journal else []
+
+            with (
+                httpx.Client(timeout=300, limits=self._client_limits()) as client,
+                ThreadPoolExecutor(max_workers=self.max_concurrency) as executor,
+            ):
+                futures = [
                     executor.submit(
                         self._upload_single_block,
+                        client,
                         part,
                         file_path,
-                        progress_lock,
+                        file_size,
                         update_progress,
-                    ): part
-                    for part in parts
-                }
-
-                for future in as_completed(future_to_part):
-                    block_id = future.result()
-                    block_ids.append(block_id)
+                        journal,
+                    )
+                    for part in pending
+                ]
+                block_ids.extend(future.result() for future in as_completed(futures))
 
-            return self._commit_block_list(complete_url, block_ids)
+                return self._commit_block_list(client, complete_url, block_ids)
 
         except Exception as error:
             raise FileUploadError(f"Multipart upload failed: {error}") from error
@@ -83,57 +101,147 @@ class AzureFileHandler(BaseFileHandler):
     def _get_block_id(part_number: int) -> str:
         return base64.b64encode(f"block-{part_number:08d}".encode()).decode()
 
-    @staticmethod
     def _upload_single_block(
+        self,
+        client: httpx.Client,
         part: PartDetails,
         file_path: str,
-        progress_lock: Lock,
+        file_size: int,
         update_progress: Callable[[int], None],
+        journal: UploadJournal | None,
     ) -> str:
-        part_size = part.end_byte - part.start_byte + 1
-
-        with open(file_path, "rb") as f:
-            f.seek(part.start_byte)
-            part_data = f.read(part_size)
-            actual_size = len(part_data)
+        self._put_part(
+            client,
+            part,
+            file_path,
+            file_size,
+            update_progress,
+            headers={"x-ms-blob-type": "BlockBlob"},
+        )
+        block_id = self._get_block_id(part.part_number)
+        if journal is not None:
+            journal.record_part(part.part_number, block_id)
+        return block_id
 
-        with httpx.Client(timeout=300) as client:
-            response = client.put(
-                part.url,
-                content=part_data,
-                headers={
-                    "Content-Length": str(actual_size),
-                    "x-ms-blob-type": "BlockBlob",
-                },
-            )
-            response.raise_for_status()
+    def _commit_block_list(
+        self, client: httpx.Client, url: str, block_ids: list[str]
+    ) -> httpx.Response:
+        response = client.put(
+            url=url,
+            content=_block_list_xml(block_ids),
+            headers={"Content-Type": "application/xml"},
+        )
+        response.raise_for_status()
 
-        with progress_lock:
-            update_progress(actual_size)
+        self.finish_progress()
 
-        return AzureFileHandler._get_block_id(part.part_number)
+        return response
 
-    def _commit_block_list(self, url: str, block_ids: list[str]) -> httpx.Response:
-        block_ids.sort()
 
-        xml_blocks = ""
-        for block_id in block_ids:
-            xml_blocks += f"<Latest>{block_id}</Latest>"
+class AsyncAzureFileHandler(AsyncBaseFileHandler):
+    """Async file handler for Azure Blob Storage."""
 
-        block_list_xml = (
-            f'<?xml version="1.0" encoding="utf-8"?><BlockList>{xml_blocks}</BlockList>'
-        )
+    async def upload_simple(
+        self,
+        url: str,
+        file_path: str,
+        file_size: int,
+        file_name: str = "",
+    ) -> httpx.Response:
+        try:
+            update_progress = self.create_progress_bar(file_size, file_name)
 
-        with httpx.Client(timeout=300) as client:
-            response = client.put(
-                url=url,
-                content=block_list_xml,
-                headers={"Content-Type": "application/xml"},
-            )
+            async with httpx.AsyncClient(timeout=_UPLOAD_TIMEOUT) as client:
+                response = await client.put(
+                    url,
+                    content=aiter_file_range(
+                        file_path, 0, file_size, self.buffer_size, update_progress
+                    ),
+                    headers={
+                        "Content-Length": str(file_size),
+                        "x-ms-blob-type": "BlockBlob",
+                    },
+                )
 
+            self.finish_progress()
             response.raise_for_status()
-            result = response
+            return response
+        except Exception as error:
+            self.finish_progress()
+            raise FileUploadError(f"Upload failed: {error}") from error
 
-        self.finish_progress()
+    async def upload_multipart(
+        self,
+        parts: list[PartDetails],
+        complete_url: str,
+        file_size: int,
+        file_path: str,
+        file_name: str = "",
+        upload_id: str | None = None,
+        journal: UploadJournal | None = None,
+    ) -> httpx.Response:
+        try:
+            update_progress = self.create_progress_bar(file_size, file_name)
+            pending = self._pending_parts(parts, file_size, journal, update_progress)
+            # read before the tasks run, they add the blocks they upload
+            block_ids = list(journal.completed_parts.values()) if journal else []
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async with httpx.AsyncClient(
+                timeout=300, limits=self._client_limits()
+            ) as client:
+                async with asyncio.TaskGroup() as group:
+                    tasks = [
+                        group.create_task(
+                            self._upload_single_block(
+                                client,
+                                semaphore,
+                                part,
+                                file_path,
+                                file_size,
+                                update_progress,
+                                journal,
+                            )
+                        )
+                        for part in pending
+                    ]
+                block_ids.extend(t.result() for t in tasks)
+                response = await client.put(
+                    url=complete_url,
+                    content=_block_list_xml(block_ids),
+                    headers={"Content-Type": "application/xml"},
+                )
+                response.raise_for_status()
+
+            self.finish_progress()
+            return response
+        except Exception as error:
+            self.finish_progress()
+            if isinstance(error, ExceptionGroup):
+                error = error.exceptions[0]
+            raise FileUploadError(f"Multipart upload failed: {error}") from error
+
+    async def _upload_single_block(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        part: PartDetails,
+        file_path: str,
+        file_size: int,
+        update_progress: Callable[[int], None],
+        journal: UploadJournal | None,
+    ) -> str:
+        async with semaphore:
+            await self._put_part(
+                client,
+                part,
+                file_path,
+                file_size,
+                update_progress,
+                headers={"x-ms-blob-type": "BlockBlob"},
+            )
 
-        return result
+        block_id = AzureFileHandler._get_block_id(part.part_number)
+        if journal is not None:
+            await asyncio.to_thread(journal.record_part, part.part_number, block_id)
+        return block_id
@@ -1,14 +1,186 @@
+import asyncio
+import contextlib
+import hashlib
+import os
+import random
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Lock
 
 import httpx
 
 from luml.api._exceptions import FileDownloadError
 from luml.api._types import PartDetails
+from luml.api.utils.download_journal import DownloadJournal
+from luml.api.utils.upload_journal import UploadJournal
 
+_DOWNLOAD_TIMEOUT = httpx.Timeout(connect=30.0, read=300.0, write=60.0, pool=30.0)
+
+DEFAULT_MAX_CONCURRENCY = 5
+DEFAULT_BUFFER_SIZE = 1048576  # 1mb
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_DOWNLOAD_PART_SIZE = 16777216  # 16mb
+_RETRY_BACKOFF = 0.5
+_RETRY_BACKOFF_MAX = 30.0
+_RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def iter_file_range(
+    file_path: str,
+    start: int,
+    size: int,
+    buffer_size: int,
+    update_progress: Callable[[int], None] | None = None,
+) -> Generator[bytes, None, None]:
+    """Yields ``size`` bytes of the file from ``start`` in ``buffer_size`` chunks."""
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        while size > 0:
+            chunk = f.read(min(buffer_size, size))
+            if not chunk:
+                break
+            size -= len(chunk)
+            if update_progress is not None:
+                update_progress(len(chunk))
+            yield chunk
+
+
+async def aiter_file_range(
+    file_path: str,
+    start: int,
+    size: int,
+    buffer_size: int,
+    update_progress: Callable[[int], None] | None = None,
+) -> AsyncGenerator[bytes, None]:
+    chunks = iter_file_range(file_path, start, size, buffer_size, update_progress)
+    while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+        yield chunk
+
+
+def file_sha256(file_path: str) -> str:
+    hash_sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(8388608), b""):  # 8mb
+            hash_sha256.update(chunk)
+    return hash_sha256.hexdigest()
+
+
+def _ranged_size(response: httpx.Response) -> int | None:
+    # "Content-Range: bytes 0-0/<size>" when the server honours range requests,
+    # no range of an empty file is satisfiable: 416 with "bytes */0"
+    if response.status_code == 416:
+        return 0 if response.headers.get("content-range") == "bytes */0" else None
+    if response.status_code != 206:
+        return None
+    total = response.headers.get("content-range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+class _RangeNotSupportedError(Exception):
+    """A part request was answered without the requested range."""
+
+
+def _check_part_response(response: httpx.Response, start: int, end: int) -> None:
+    content_range = response.headers.get("content-range", "")
+    if response.status_code != 206 or not content_range.startswith(
+        f"bytes {start}-{end}/"
+    ):
+        raise _RangeNotSupportedError
+
+
+def _replace_partial(file_path: str, file_hash: str | None) -> None:
+    partial_path = DownloadJournal.partial_path(file_path)
+    if file_hash and file_sha256(partial_path) != file_hash:
+        os.remove(partial_path)
+        raise FileDownloadError(" Downloaded file does not match its hash.")
+    os.replace(partial_path, file_path)
+
+
+def _discard_download(journal: DownloadJournal, file_path: str) -> None:
+    journal.remove()
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(DownloadJournal.partial_path(file_path))
 
-class BaseFileHandler(ABC):
-    """Abstract base class for file upload/download handlers."""
+
+def _finish_download(journal: DownloadJournal, file_path: str) -> None:
+    try:
+        _replace_partial(file_path, journal.file_hash)
+    finally:
+        journal.remove()
+
+
+class _FileHandlerMixin:
+    """Helpers shared by the sync and async file handlers.
+
+    Uploads stream from disk through a buffer of ``buffer_size`` bytes per
+    request, with at most ``max_concurrency`` multipart requests in flight on
+    one pooled client, so peak memory is about ``max_concurrency * buffer_size``
+    whatever the size of the file and of its parts.
+
+    A part failing with a network error or a transient status is retried up to
+    ``max_retries`` times with exponential backoff and full jitter.
+
+    Downloads fetch parts of ``download_part_size`` bytes with concurrent range
+    requests into a preallocated ``.partial`` file, which is resumed if a
+    previous download of the same file was interrupted. When the server does
+    not answer with the requested ranges the file is fetched with one plain GET.
+    """
+
+    download_part_size = DEFAULT_DOWNLOAD_PART_SIZE
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self.max_concurrency = max_concurrency
+        self.buffer_size = buffer_size
+        self.max_retries = max_retries
+
+    def _should_retry(self, error: httpx.HTTPError, attempt: int) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in _RETRYABLE_STATUS_CODES
+        return isinstance(error, httpx.TransportError)
+
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        return random.uniform(0, min(_RETRY_BACKOFF_MAX, _RETRY_BACKOFF * 2**attempt))
+
+    def _pending_parts(
+        self,
+        parts: list[PartDetails],
+        file_size: int,
+        journal: UploadJournal | None,
+        update_progress: Callable[[int], None],
+    ) -> list[PartDetails]:
+        if journal is None:
+            return parts
+        done = [p for p in parts if p.part_number in journal.completed_parts]
+        if done:
+            update_progress(sum(self._part_size(p, file_size) for p in done))
+        return [p for p in parts if p.part_number not in journal.completed_parts]
+
+    @staticmethod
+    def _part_size(part: PartDetails, file_size: int) -> int:
+        # the last part may be announced larger than what is left of the file
+        return max(0, min(part.end_byte + 1, file_size) - part.start_byte)
+
+    def _client_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
 
     @staticmethod
     def _calculate_optimal_chunk_size(file_size: int) -> int:
@@ -32,8 +204,14 @@ class BaseFileHandler(ABC):
     ) -> Callable[[int], None]:
         uploaded = 0
         description_shown = False
+        # parts of multipart transfers report progress from several threads
+        lock = Lock()
 
         def update_progress(chunk_size: int) -> None:
+            with lock:
+                _update_progress(chunk_size)
+
+        def _update_progress(chunk_size: int) -> None:
             nonlocal uploaded, description_shown
             uploaded += chunk_size
 
@@ -75,6 +253,10 @@ class BaseFileHandler(ABC):
                 update_progress(len(chunk))
                 yield chunk
 
+
+class BaseFileHandler(_FileHandlerMixin, ABC):
+    """Abstract base class for file upload/download handlers."""
+
     @abstractmethod
     def upload_simple(
         self,
@@ -94,33 +276,415 @@ class BaseFileHandler(ABC):
         file_path: str,
         file_name: str = "",
         upload_id: str | None = None,
+        journal: UploadJournal | None = None,
     ) -> httpx.Response:
         pass
 
     def initiate_multipart_upload(self, initiate_url: str | None) -> str | None:
         return None
 
+    def _put_part(
+        self,
+        client: httpx.Client,
+        part: PartDetails,
+        file_path: str,
+        file_size: int,
+        update_progress: Callable[[int], None],
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        part_size = self._part_size(part, file_size)
+        attempt = 0
+        while True:
+            sent = 0
+
+            def track(chunk_size: int) -> None:
+                nonlocal sent
+                sent += chunk_size
+                update_progress(chunk_size)
+
+            try:
+                response = client.put(
+                    part.url,
+                    content=iter_file_range(
+                        file_path, part.start_byte, part_size, self.buffer_size, track
+                    ),
+                    headers={"Content-Length": str(part_size), **(headers or {})},
+                )
+                response.raise_for_status()
+                return response
+            except httpx.HTTPError as error:
+                update_progress(-sent)
+                if not self._should_retry(error, attempt):
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                attempt += 1
+
     def download_file_with_progress(
-        self, url: str, file_path: str, file_name: str = ""
+        self,
+        url: str,
+        file_path: str,
+        file_name: str = "",
+        file_hash: str | None = None,
     ) -> str:
+        """Download a file, verifying it against ``file_hash`` when given."""
         try:
-            timeout = httpx.Timeout(connect=30.0, read=300.0, write=60.0, pool=30.0)
+            with httpx.Client(
+                timeout=_DOWNLOAD_TIMEOUT, limits=self._client_limits()
+            ) as client:
+                with client.stream(
+                    "GET", url, headers={"Range": "bytes=0-0"}
+                ) as response:
+                    if response.status_code != 416:
+                        response.raise_for_status()
+                    file_size = _ranged_size(response)
 
-            with httpx.stream("GET", url, timeout=timeout) as response:
+                if file_size is None:
+                    self._download_stream(client, url, file_path, file_name, file_hash)
+                else:
+                    self._download_ranges(
+                        client, url, file_path, file_size, file_name, file_hash
+                    )
+
+            self.finish_progress()
+            return file_path
+        except FileDownloadError:
+            self.finish_progress()
+            raise
+        except Exception as error:
+            self.finish_progress()
+            raise FileDownloadError(f" Error: {error}") from error
+
+    def _download_stream(
+        self,
+        client: httpx.Client,
+        url: str,
+        file_path: str,
+        file_name: str,
+        file_hash: str | None,
+    ) -> None:
+        # the server ignores ranges: one plain GET, which can not be resumed
+        partial_path = DownloadJournal.partial_path(file_path)
+        try:
+            with client.stream("GET", url) as response:
                 response.raise_for_status()
 
                 total_size = int(response.headers.get("content-length", 0))
                 update_progress = self.create_progress_bar(total_size, file_name)
 
-                chunk_size = self._calculate_optimal_chunk_size(total_size)
+                with open(partial_path, "wb") as f:
+                    for chunk in response.iter_bytes(chunk_size=self.buffer_size):
+                        f.write(chunk)
+                        update_progress(len(chunk))
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+        _replace_partial(file_path, file_hash)
+
+    def _download_ranges(
+        self,
+        client: httpx.Client,
+        url: str,
+        file_path: str,
+        file_size: int,
+        file_name: str,
+        file_hash: str | None,
+    ) -> None:
+        journal = DownloadJournal.start_or_resume(
+            file_path, file_size, self.download_part_size, file_hash
+        )
+        update_progress = self.create_progress_bar(file_size, file_name)
+        update_progress(journal.downloaded_size())
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = [
+                    executor.submit(
+                        self._download_range,
+                        client,
+                        url,
+                        file_path,
+                        part,
+                        update_progress,
+                        journal,
+                    )
+                    for part in journal.part_ranges()
+                ]
+                for future in as_completed(futures):
+                    future.result()
+        except _RangeNotSupportedError:
+            # only the probe got a ranged answer, download the file in one GET
+            _discard_download(journal, file_path)
+            self._download_stream(client, url, file_path, file_name, file_hash)
+            return
 
-                with open(file_path, "wb") as f:
-                    for chunk in response.iter_bytes(chunk_size=chunk_size):
+        _finish_download(journal, file_path)
+
+    def _download_range(
+        self,
+        client: httpx.Client,
+        url: str,
+        file_path: str,
+        part: tuple[int, int, int],
+        update_progress: Callable[[int], None],
+        journal: DownloadJournal,
+    ) -> None:
+        index, start, end = part
+        attempt = 0
+        while True:
+            received = 0
+            try:
+                with (
+                    client.stream(
+                        "GET", url, headers={"Range": f"bytes={start}-{end}"}
+                    ) as response,
+                    open(DownloadJournal.partial_path(file_path), "r+b") as f,
+                ):
+                    response.raise_for_status()
+                    _check_part_response(response, start, end)
+                    f.seek(start)
+                    for chunk in response.iter_bytes(chunk_size=self.buffer_size):
+                        chunk = chunk[: end - start + 1 - received]
                         f.write(chunk)
+                        received += len(chunk)
                         update_progress(len(chunk))
+                        if received > end - start:
+                            break
+                if received != end - start + 1:
+                    raise httpx.RemoteProtocolError(
+                        f"Received {received} bytes of range {start}-{end}"
+                    )
+                journal.record_part(index)
+                return
+            except httpx.HTTPError as error:
+                update_progress(-received)
+                if not self._should_retry(error, attempt):
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                attempt += 1
+
+
+class AsyncBaseFileHandler(_FileHandlerMixin, ABC):
+    """Abstract base class for async file upload/download handlers.
+
+    Network I/O runs on ``httpx.AsyncClient`` and file I/O in worker threads, so
+    transfers never block the event loop.
+    """
+
+    @abstractmethod
+    async def upload_simple(
+        self,
+        url: str,
+        file_path: str,
+        file_size: int,
+        file_name: str = "",
+    ) -> httpx.Response:
+        pass
+
+    @abstractmethod
+    async def upload_multipart(
+        self,
+        parts: list[PartDetails],
+        complete_url: str,
+        file_size: int,
+        file_path: str,
+        file_name: str = "",
+        upload_id: str | None = None,
+        journal: UploadJournal | None = None,
+    ) -> httpx.Response:
+        pass
+
+    async def initiate_multipart_upload(self, initiate_url: str | None) -> str | None:
+        return None
+
+    async def _put_part(
+        self,
+        client: httpx.AsyncClient,
+        part: PartDetails,
+        file_path: str,
+        file_size: int,
+        update_progress: Callable[[int], None],
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        part_size = self._part_size(part, file_size)
+        attempt = 0
+        while True:
+            sent = 0
 
-                self.finish_progress()
+            def track(chunk_size: int) -> None:
+                nonlocal sent
+                sent += chunk_size
+                update_progress(chunk_size)
+
+            try:
+                response = await client.put(
+                    part.url,
+                    content=aiter_file_range(
+                        file_path, part.start_byte, part_size, self.buffer_size, track
+                    ),
+                    headers={"Content-Length": str(part_size), **(headers or {})},
+                )
+                response.raise_for_status()
+                return response
+            except httpx.HTTPError as error:
+                update_progress(-sent)
+                if not self._should_retry(error, attempt):
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+                attempt += 1
+
+    async def download_file_with_progress(
+        self,
+        url: str,
+        file_path: str,
+        file_name: str = "",
+        file_hash: str | None = None,
+    ) -> str:
+        """Download a file, verifying it against ``file_hash`` when given."""
+        try:
+            async with httpx.AsyncClient(
+                timeout=_DOWNLOAD_TIMEOUT, limits=self._client_limits()
+            ) as client:
+                async with client.stream(
+                    "GET", url, headers={"Range": "bytes=0-0"}
+                ) as response:
+                    if response.status_code != 416:
+                        response.raise_for_status()
+                    file_size = _ranged_size(response)
+
+                if file_size is None:
+                    await self._download_stream(
+                        client, url, file_path, file_name, file_hash
+                    )
+                else:
+                    await self._download_ranges(
+                        client, url, file_path, file_size, file_name, file_hash
+                    )
+
+            self.finish_progress()
             return file_path
         except Exception as error:
             self.finish_progress()
+            if isinstance(error, ExceptionGroup):
+                error = error.exceptions[0]
+            if isinstance(error, FileDownloadError):
+                raise error from None
             raise FileDownloadError(f" Error: {error}") from error
+
+    async def _download_stream(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        file_path: str,
+        file_name: str,
+        file_hash: str | None,
+    ) -> None:
+        partial_path = DownloadJournal.partial_path(file_path)
+        try:
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+
+                total_size = int(response.headers.get("content-length", 0))
+                update_progress = self.create_progress_bar(total_size, file_name)
+
+                with open(partial_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(
+                        chunk_size=self.buffer_size
+                    ):
+                        await asyncio.to_thread(f.write, chunk)
+                        update_progress(len(chunk))
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+        await asyncio.to_thread(_replace_partial, file_path, file_hash)
+
+    async def _download_ranges(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        file_path: str,
+        file_size: int,
+        file_name: str,
+        file_hash: str | None,
+    ) -> None:
+        journal = await asyncio.to_thread(
+            DownloadJournal.start_or_resume,
+            file_path,
+            file_size,
+            self.download_part_size,
+            file_hash,
+        )
+        update_progress = self.create_progress_bar(file_size, file_name)
+        update_progress(journal.downloaded_size())
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        ranged = True
+        try:
+            async with asyncio.TaskGroup() as group:
+                for part in journal.part_ranges():
+                    group.create_task(
+                        self._download_range(
+                            client,
+                            semaphore,
+                            url,
+                            file_path,
+                            part,
+                            update_progress,
+                            journal,
+                        )
+                    )
+        except* _RangeNotSupportedError:
+            ranged = False
+
+        if ranged:
+            await asyncio.to_thread(_finish_download, journal, file_path)
+        else:
+            # only the probe got a ranged answer, download the file in one GET
+            await asyncio.to_thread(_discard_download, journal, file_path)
+            await self._download_stream(client, url, file_path, file_name, file_hash)
+
+    async def _download_range(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        file_path: str,
+        part: tuple[int, int, int],
+        update_progress: Callable[[int], None],
+        journal: DownloadJournal,
+    ) -> None:
+        index, start, end = part
+        attempt = 0
+        async with semaphore:
+            while True:
+                received = 0
+                try:
+                    async with client.stream(
+                        "GET", url, headers={"Range": f"bytes={start}-{end}"}
+                    ) as response:
+                        response.raise_for_status()
+                        _check_part_response(response, start, end)
+                        with open(DownloadJournal.partial_path(file_path), "r+b") as f:
+                            f.seek(start)
+                            async for chunk in response.aiter_bytes(
+                                chunk_size=self.buffer_size
+                            ):
+                                chunk = chunk[: end - start + 1 - received]
+                                await asyncio.to_thread(f.write, chunk)
+                                received += len(chunk)
+                                update_progress(len(chunk))
+                                if received > end - start:
+                                    break
+                    if received != end - start + 1:
+                        raise httpx.RemoteProtocolError(
+                            f"Received {received} bytes of range {start}-{end}"
+                        )
+                    await asyncio.to_thread(journal.record_part, index)
+                    return
+                except httpx.HTTPError as error:
+                    update_progress(-received)
+                    if not self._should_retry(error, attempt):
+                        raise
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    attempt += 1
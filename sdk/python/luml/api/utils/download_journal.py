@@ -0,0 +1,83 @@
+import os
+from pathlib import Path
+from threading import Lock
+
+from pydantic import BaseModel, PrivateAttr
+
+
+class DownloadJournal(BaseModel):
+    """Progress of a ranged download, used to resume it after a failure.
+
+    The data is written to ``<file_path>.partial`` and the journal is kept next
+    to it. A journal is only reused for a download of the same size, part size
+    and hash; the partial file is renamed to ``file_path`` once complete.
+    """
+
+    file_size: int
+    part_size: int
+    file_hash: str | None = None
+    completed_parts: set[int] = set()
+
+    _path: Path = PrivateAttr()
+    _lock: Lock = PrivateAttr(default_factory=Lock)
+
+    @staticmethod
+    def partial_path(file_path: str) -> str:
+        return f"{file_path}.partial"
+
+    @classmethod
+    def start_or_resume(
+        cls,
+        file_path: str,
+        file_size: int,
+        part_size: int,
+        file_hash: str | None = None,
+    ) -> "DownloadJournal":
+        """Loads the journal of an interrupted download or starts a new one.
+
+        A new journal preallocates the partial file at its full size.
+        """
+        partial_path = cls.partial_path(file_path)
+        path = Path(f"{partial_path}.json")
+        if path.exists() and os.path.exists(partial_path):
+            journal = cls.model_validate_json(path.read_text())
+            if (journal.file_size, journal.part_size, journal.file_hash) == (
+                file_size,
+                part_size,
+                file_hash,
+            ):
+                journal._path = path
+                return journal
+
+        with open(partial_path, "wb") as f:
+            f.truncate(file_size)
+        journal = cls(file_size=file_size, part_size=part_size, file_hash=file_hash)
+        journal._path = path
+        journal.save()
+        return journal
+
+    def part_ranges(self) -> list[tuple[int, int, int]]:
+        """Returns ``(index, start, end)`` of the parts still to download."""
+        return [
+            (index, start, min(start + self.part_size, self.file_size) - 1)
+            for index, start in enumerate(range(0, self.file_size, self.part_size))
+            if index not in self.completed_parts
+        ]
+
+    def downloaded_size(self) -> int:
+        return self.file_size - sum(
+            end - start + 1 for _, start, end in self.part_ranges()
+        )
+
+    def record_part(self, index: int) -> None:
+        with self._lock:
+            self.completed_parts.add(index)
+            self.save()
+
+    def save(self) -> None:
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_text(self.model_dump_json())
+        os.replace(tmp_path, self._path)
+
+    def remove(self) -> None:
+        self._path.unlink(missing_ok=True)
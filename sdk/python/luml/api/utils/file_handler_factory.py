@@ -1,14 +1,38 @@
 from luml.api._types import BucketType
-from luml.api.utils.azure_file_handler import AzureFileHandler
-from luml.api.utils.base_file_handler import BaseFileHandler
-from luml.api.utils.s3_file_handler import S3FileHandler
+from luml.api.utils.azure_file_handler import AsyncAzureFileHandler, AzureFileHandler
+from luml.api.utils.base_file_handler import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    AsyncBaseFileHandler,
+    BaseFileHandler,
+)
+from luml.api.utils.s3_file_handler import AsyncS3FileHandler, S3FileHandler
 
 
-def create_file_handler(bucket_type: BucketType) -> BaseFileHandler:
+def create_file_handler(
+    bucket_type: BucketType,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> BaseFileHandler:
     if bucket_type == BucketType.S3:
-        return S3FileHandler()
+        return S3FileHandler(max_concurrency, buffer_size)
     if bucket_type == BucketType.AZURE:
-        return AzureFileHandler()
+        return AzureFileHandler(max_concurrency, buffer_size)
+    raise ValueError(
+        f"Unsupported bucket type: {bucket_type}. "
+        f"Supported types: {[t.value for t in BucketType]}"
+    )
+
+
+def create_async_file_handler(
+    bucket_type: BucketType,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> AsyncBaseFileHandler:
+    if bucket_type == BucketType.S3:
+        return AsyncS3FileHandler(max_concurrency, buffer_size)
+    if bucket_type == BucketType.AZURE:
+        return AsyncAzureFileHandler(max_concurrency, buffer_size)
     raise ValueError(
         f"Unsupported bucket type: {bucket_type}. "
         f"Supported types: {[t.value for t in BucketType]}"
@@ -1,10 +1,56 @@
 import hashlib
+import io
 import json
 import os
 import tarfile
 
 from luml.api._types import ModelDetails
 
+_READ_SIZE = 8388608  # 8mb
+
+
+class _HashingReader:
+    """Read-only file wrapper hashing every byte that passes through it.
+
+    Seeking only moves forward, reading and hashing the skipped bytes, so the
+    digest covers the whole file however it is navigated.
+    """
+
+    def __init__(self, fileobj: io.BufferedReader) -> None:
+        self._fileobj = fileobj
+        self._position = 0
+        self._buffer = memoryview(bytearray(_READ_SIZE))
+        self.sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self._position += len(data)
+        self.sha256.update(data)
+        return data
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET or offset < self._position:
+            raise io.UnsupportedOperation("can only seek forward")
+        self._skip(offset - self._position)
+        return self._position
+
+    def _skip(self, size: int) -> None:
+        while size > 0:
+            read = self._fileobj.readinto(self._buffer[: min(size, _READ_SIZE)])
+            if not read:
+                break
+            self.sha256.update(self._buffer[:read])
+            self._position += read
+            size -= read
+
+    def drain(self) -> None:
+        self._skip(os.fstat(self._fileobj.fileno()).st_size - self._position)
+
 
 class ModelFileHandler:
     _tabular_producer_tags = [
@@ -20,6 +66,10 @@ class ModelFileHandler:
         self._file_path = file_path
         self._metadata: list[dict] | None = None
         self._manifest: dict | None = None
+        self._file_hash: str | None = None
+        self._file_index: dict[str, tuple[int, int]] | None = None
+        self._manifest_content: bytes | None = None
+        self._scan_error: Exception | None = None
 
     def _get_type_tag(self, producer_tags: list[str]) -> str | None:
         for tag in producer_tags:
@@ -48,26 +98,56 @@ class ModelFileHandler:
     def get_size(self) -> int:
         return os.path.getsize(self._file_path)
 
-    def get_file_hash(self) -> str:
-        hash_sha256 = hashlib.sha256()
+    def _scan(self) -> None:
+        """Reads the file once, collecting everything the upload needs.
+
+        The tar is read through a hashing reader that only moves forward, so the
+        sha256, the offset index of the members, the manifest and the metadata
+        all come from a single sequential pass over the file.
+        """
+        manifest: bytes | None = None
+        metadata: bytes | None = None
+        file_index = {}
         with open(self._file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8388608), b""):  # 8mb
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+            reader = _HashingReader(f)
+            try:
+                with tarfile.open(
+                    fileobj=reader,  # type: ignore[call-overload]
+                    mode="r:",
+                ) as tar:
+                    for member in tar:
+                        if not member.isfile():
+                            continue
+                        file_index[member.name] = (member.offset_data, member.size)
+                        if member.name in ("manifest.json", "meta.json"):
+                            extracted = tar.extractfile(member)
+                            content = extracted.read() if extracted else None
+                            if member.name == "manifest.json":
+                                manifest = content
+                            else:
+                                metadata = content
+            except Exception as error:
+                self._scan_error = error
+            # the tar end-of-archive padding is part of the hash too
+            reader.drain()
+
+        self._file_hash = reader.sha256.hexdigest()
+        self._file_index = file_index
+        try:
+            self._metadata = json.loads(metadata.decode("utf-8")) if metadata else []
+        except Exception:
+            self._metadata = []
+        self._manifest_content = manifest
+
+    def get_file_hash(self) -> str:
+        if self._file_hash is None:
+            self._scan()
+        return self._file_hash  # type: ignore[return-value]
 
     def get_metadata(self) -> list[dict]:
         if self._metadata is None:
-            try:
-                with tarfile.open(self._file_path, "r") as tar:
-                    meta_file = tar.extractfile(tar.getmember("meta.json"))
-                    self._metadata = (
-                        json.loads(meta_file.read().decode("utf-8"))
-                        if meta_file
-                        else []
-                    )
-            except (Exception, KeyError):
-                self._metadata = []
-        return self._metadata
+            self._scan()
+        return self._metadata  # type: ignore[return-value]
 
     def get_metrics(self) -> dict:
         manifest = self.get_manifest()
@@ -93,22 +173,21 @@ class ModelFileHandler:
 
     def get_manifest(self) -> dict:
         if self._manifest is None:
-            with tarfile.open(self._file_path, "r") as tar:
-                manifest_file = tar.extractfile(tar.getmember("manifest.json"))
-                self._manifest = (
-                    json.loads(manifest_file.read().decode("utf-8"))
-                    if manifest_file
-                    else {}
-                )
+            if self._file_hash is None:
+                self._scan()
+            if self._scan_error is not None:
+                raise self._scan_error
+            if self._manifest_content is None:
+                raise KeyError("filename 'manifest.json' not found")
+            self._manifest = json.loads(self._manifest_content.decode("utf-8"))
         return self._manifest
 
     def get_file_index(self) -> dict[str, tuple[int, int]]:
-        file_index = {}
-        with tarfile.open(self._file_path, "r") as tar:
-            for member in tar.getmembers():
-                if member.isfile():
-                    file_index[member.name] = (member.offset_data, member.size)
-        return file_index
+        if self._file_index is None:
+            self._scan()
+        if self._scan_error is not None:
+            raise self._scan_error
+        return self._file_index  # type: ignore[return-value]
 
     def model_details(self) -> ModelDetails:
         return ModelDetails(
@@ -1,13 +1,48 @@
+import asyncio
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
 from xml.etree import ElementTree as ET
 
 import httpx
 
 from luml.api._exceptions import FileUploadError, LumlAPIError
 from luml.api._types import PartDetails
-from luml.api.utils.base_file_handler import BaseFileHandler
+from luml.api.utils.base_file_handler import (
+    AsyncBaseFileHandler,
+    BaseFileHandler,
+    aiter_file_range,
+)
+from luml.api.utils.upload_journal import UploadJournal
+
+_UPLOAD_TIMEOUT = httpx.Timeout(connect=30.0, read=300.0, write=600.0, pool=30.0)
+_S3_NAMESPACE = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+
+
+def _complete_multipart_xml(parts_complete: list[dict[str, int | str]]) -> str:
+    parts_complete.sort(key=lambda x: x["part_number"])
+    parts_xml = ""
+    for part in parts_complete:
+        parts_xml += f"<Part><PartNumber>{part['part_number']}</PartNumber><ETag>{part['etag']}</ETag></Part>"  # noqa: E501
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+        <CompleteMultipartUpload>
+        {parts_xml}
+        </CompleteMultipartUpload>"""
+
+
+def _journaled_parts(journal: UploadJournal | None) -> list[dict[str, int | str]]:
+    if journal is None:
+        return []
+    return [
+        {"part_number": number, "etag": etag}
+        for number, etag in journal.completed_parts.items()
+    ]
+
+
+def _parse_upload_id(content: bytes) -> str | None:
+    upload_id = ET.fromstring(content).find(f".//{_S3_NAMESPACE}UploadId")
+    if upload_id is None:
+        raise LumlAPIError("UploadId not found in S3 response")
+    return upload_id.text
 
 
 class S3FileHandler(BaseFileHandler):
@@ -24,15 +59,13 @@ class S3FileHandler(BaseFileHandler):
         try:
             update_progress = self.create_progress_bar(file_size, file_name)
 
-            timeout = httpx.Timeout(connect=30.0, read=300.0, write=600.0, pool=30.0)
-
             response = httpx.put(
                 url,
                 content=self.create_file_generator(
-                    file_path, file_size, update_progress
+                    file_path, file_size, update_progress, self.buffer_size
                 ),
                 headers={"Content-Length": str(file_size)},
-                timeout=timeout,
+                timeout=_UPLOAD_TIMEOUT,
             )
 
             self.finish_progress()
@@ -50,94 +83,85 @@ class S3FileHandler(BaseFileHandler):
         file_path: str,
         file_name: str = "",
         upload_id: str | None = None,
+        journal: UploadJournal | None = None,
     ) -> httpx.Response:
-        """Upload a file using S3 multipart upload."""
+        """Upload a file using S3 multipart upload.
+
+        Parts recorded in ``journal`` are skipped and every part uploaded is
+        added to it, so a failed upload can be resumed.
+        """
 
         if upload_id is None:
             raise ValueError("upload_id is required for S3 multipart uploads")
 
         try:
             update_progress = self.create_progress_bar(file_size, file_name)
-            parts_complete = []
-            progress_lock = Lock()
-
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                future_to_part = {
+            pending = self._pending_parts(parts, file_size, journal, update_progress)
+            parts_complete = _journaled_parts(journal)
+
+            with (
+                httpx.Client(timeout=300, limits=self._client_limits()) as client,
+                ThreadPoolExecutor(max_workers=self.max_concurrency) as executor,
+            ):
+                futures = [
                     executor.submit(
                         self._upload_single_part,
+                        client,
                         part,
                         file_path,
-                        progress_lock,
+                        file_size,
                         update_progress,
-                    ): part
-                    for part in parts
-                }
-
-                for future in as_completed(future_to_part):
-                    part_result = future.result()
-                    parts_complete.append(part_result)
+                        journal,
+                    )
+                    for part in pending
+                ]
+                parts_complete.extend(
+                    future.result() for future in as_completed(futures)
+                )
 
-            return self._complete_multipart_upload(complete_url, parts_complete)
+                return self._complete_multipart_upload(
+                    client, complete_url, parts_complete
+                )
 
         except Exception as error:
             raise FileUploadError(f"Multipart upload failed: {error}") from error
 
-    @staticmethod
     def _upload_single_part(
+        self,
+        client: httpx.Client,
         part: PartDetails,
         file_path: str,
-        progress_lock: Lock,
+        file_size: int,
         update_progress: Callable[[int], None],
+        journal: UploadJournal | None,
     ) -> dict[str, int | str]:
         """Upload a single part of multipart upload."""
 
-        part_size = part.end_byte - part.start_byte + 1
-
-        with open(file_path, "rb") as f:
-            f.seek(part.start_byte)
-            part_data = f.read(part_size)
-            actual_size = len(part_data)
-
-        with httpx.Client(timeout=300) as client:
-            response = client.put(
-                part.url,
-                content=part_data,
-                headers={"Content-Length": str(actual_size)},
-            )
-            response.raise_for_status()
-            etag = response.headers.get("ETag", "").strip('"')
-
-        with progress_lock:
-            update_progress(actual_size)
+        response = self._put_part(client, part, file_path, file_size, update_progress)
+        etag = response.headers.get("ETag", "").strip('"')
+        if journal is not None:
+            journal.record_part(part.part_number, etag)
 
         return {"part_number": part.part_number, "etag": etag}
 
     def _complete_multipart_upload(
-        self, url: str, parts_complete: list[dict[str, int | str]]
+        self,
+        client: httpx.Client,
+        url: str,
+        parts_complete: list[dict[str, int | str]],
     ) -> httpx.Response:
         """Complete S3 multipart upload."""
 
-        parts_complete.sort(key=lambda x: x["part_number"])
-        parts_xml = ""
-        for part in parts_complete:
-            parts_xml += f"<Part><PartNumber>{part['part_number']}</PartNumber><ETag>{part['etag']}</ETag></Part>"  # noqa: E501
-        complete_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-        <CompleteMultipartUpload>
-        {parts_xml}
-        </CompleteMultipartUpload>"""
-        with httpx.Client(timeout=300) as client:
-            response = client.post(
-                url=url,
-                content=complete_xml,
-                headers={"Content-Type": "application/xml"},
-            )
-
-            response.raise_for_status()
-            result = response
+        response = client.post(
+            url=url,
+            content=_complete_multipart_xml(parts_complete),
+            headers={"Content-Type": "application/xml"},
+        )
+        response.raise_for_status()
 
         self.finish_progress()
 
-        return result
+        return response
 
     def initiate_multipart_upload(self, initiate_url: str | None) -> str | None:
         if not initiate_url:
@@ -149,16 +173,137 @@ class S3FileHandler(BaseFileHandler):
             with httpx.Client(timeout=300) as client:
                 response = client.post(initiate_url)
                 response.raise_for_status()
+                return _parse_upload_id(response.content)
+
+        except Exception as error:
+            raise LumlAPIError(
+                f"Failed to initiate multipart upload: {error}"
+            ) from error
+
+
+class AsyncS3FileHandler(AsyncBaseFileHandler):
+    """Async file handler for S3-compatible storage."""
+
+    async def upload_simple(
+        self,
+        url: str,
+        file_path: str,
+        file_size: int,
+        file_name: str = "",
+    ) -> httpx.Response:
+        """Upload a file using simple PUT request."""
+        try:
+            update_progress = self.create_progress_bar(file_size, file_name)
+
+            async with httpx.AsyncClient(timeout=_UPLOAD_TIMEOUT) as client:
+                response = await client.put(
+                    url,
+                    content=aiter_file_range(
+                        file_path, 0, file_size, self.buffer_size, update_progress
+                    ),
+                    headers={"Content-Length": str(file_size)},
+                )
 
-                root = ET.fromstring(response.content)
+            self.finish_progress()
+            response.raise_for_status()
+            return response
+        except Exception as error:
+            self.finish_progress()
+            raise FileUploadError(f"Upload failed: {error}") from error
+
+    async def upload_multipart(
+        self,
+        parts: list[PartDetails],
+        complete_url: str,
+        file_size: int,
+        file_path: str,
+        file_name: str = "",
+        upload_id: str | None = None,
+        journal: UploadJournal | None = None,
+    ) -> httpx.Response:
+        """Upload a file using S3 multipart upload.
+
+        Parts recorded in ``journal`` are skipped and every part uploaded is
+        added to it, so a failed upload can be resumed.
+        """
+
+        if upload_id is None:
+            raise ValueError("upload_id is required for S3 multipart uploads")
 
-                upload_id = root.find(
-                    ".//{http://s3.amazonaws.com/doc/2006-03-01/}UploadId"
+        try:
+            update_progress = self.create_progress_bar(file_size, file_name)
+            pending = self._pending_parts(parts, file_size, journal, update_progress)
+            # read before the tasks run, they add the parts they upload
+            parts_complete = _journaled_parts(journal)
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async with httpx.AsyncClient(
+                timeout=300, limits=self._client_limits()
+            ) as client:
+                async with asyncio.TaskGroup() as group:
+                    tasks = [
+                        group.create_task(
+                            self._upload_single_part(
+                                client,
+                                semaphore,
+                                part,
+                                file_path,
+                                file_size,
+                                update_progress,
+                                journal,
+                            )
+                        )
+                        for part in pending
+                    ]
+                parts_complete.extend(t.result() for t in tasks)
+                response = await client.post(
+                    url=complete_url,
+                    content=_complete_multipart_xml(parts_complete),
+                    headers={"Content-Type": "application/xml"},
                 )
-                if upload_id is None:
-                    raise LumlAPIError("UploadId not found in S3 response")
+                response.raise_for_status()
 
-                return upload_id.text
+            self.finish_progress()
+            return response
+        except Exception as error:
+            self.finish_progress()
+            if isinstance(error, ExceptionGroup):
+                error = error.exceptions[0]
+            raise FileUploadError(f"Multipart upload failed: {error}") from error
+
+    async def _upload_single_part(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        part: PartDetails,
+        file_path: str,
+        file_size: int,
+        update_progress: Callable[[int], None],
+        journal: UploadJournal | None,
+    ) -> dict[str, int | str]:
+        """Upload a single part of multipart upload."""
+
+        async with semaphore:
+            response = await self._put_part(
+                client, part, file_path, file_size, update_progress
+            )
+
+        etag = response.headers.get("ETag", "").strip('"')
+        if journal is not None:
+            await asyncio.to_thread(journal.record_part, part.part_number, etag)
+        return {"part_number": part.part_number, "etag": etag}
+
+    async def initiate_multipart_upload(self, initiate_url: str | None) -> str | None:
+        if not initiate_url:
+            raise LumlAPIError(
+                "Upload URL is required for S3 multipart upload initialization"
+            )
+
+        try:
+            async with httpx.AsyncClient(timeout=300) as client:
+                response = await client.post(initiate_url)
+                response.raise_for_status()
+                return _parse_upload_id(response.content)
 
         except Exception as error:
             raise LumlAPIError(
@@ -0,0 +1,97 @@
+import hashlib
+import os
+from pathlib import Path
+from threading import Lock
+
+from pydantic import BaseModel, PrivateAttr
+
+from luml.api._types import BucketType, UploadDetails
+
+DEFAULT_JOURNAL_DIR = Path.home() / ".luml" / "uploads"
+
+
+class UploadJournal(BaseModel):
+    """Local record of a multipart upload, used to resume it after a failure.
+
+    The journal is keyed by the absolute path, size and modification time of the
+    file, so a file changed since the upload started is never resumed. It is
+    rewritten after every completed part and removed once the upload completes.
+    """
+
+    file_path: str
+    file_size: int
+    file_mtime_ns: int
+    bucket_type: BucketType
+    bucket_secret_id: str
+    bucket_location: str
+    upload_id: str | None = None
+    part_size: int
+    model_id: str | None = None
+    # part number -> ETag (S3) or block ID (Azure)
+    completed_parts: dict[int, str] = {}
+
+    _path: Path = PrivateAttr()
+    _lock: Lock = PrivateAttr(default_factory=Lock)
+
+    @staticmethod
+    def journal_path(file_path: str, journal_dir: str | Path | None = None) -> Path:
+        stat = os.stat(file_path)
+        key = f"{os.path.abspath(file_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+        name = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return Path(journal_dir or DEFAULT_JOURNAL_DIR) / f"{name}.json"
+
+    @classmethod
+    def start(
+        cls,
+        file_path: str,
+        upload_details: UploadDetails,
+        upload_id: str | None,
+        part_size: int,
+        model_id: str | None = None,
+        journal_dir: str | Path | None = None,
+    ) -> "UploadJournal":
+        stat = os.stat(file_path)
+        journal = cls(
+            file_path=os.path.abspath(file_path),
+            file_size=stat.st_size,
+            file_mtime_ns=stat.st_mtime_ns,
+            bucket_type=upload_details.type,
+            bucket_secret_id=upload_details.bucket_secret_id,
+            bucket_location=upload_details.bucket_location,
+            upload_id=upload_id,
+            part_size=part_size,
+            model_id=model_id,
+        )
+        journal._path = cls.journal_path(file_path, journal_dir)
+        journal.save()
+        return journal
+
+    @classmethod
+    def load(
+        cls, file_path: str, journal_dir: str | Path | None = None
+    ) -> "UploadJournal | None":
+        path = cls.journal_path(file_path, journal_dir)
+        if not path.exists():
+            return None
+        journal = cls.model_validate_json(path.read_text())
+        journal._path = path
+        return journal
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record_part(self, part_number: int, etag: str) -> None:
+        with self._lock:
+            self.completed_parts[part_number] = etag
+            self.save()
+
+    def save(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # write and rename, a crash mid-write must not corrupt the journal
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_text(self.model_dump_json())
+        os.replace(tmp_path, self._path)
+
+    def remove(self) -> None:
+        self._path.unlink(missing_ok=True)
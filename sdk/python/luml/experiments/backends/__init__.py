@@ -1,5 +1,9 @@
+import inspect
+from urllib.parse import parse_qsl
+
 from luml.experiments.backends._base import Backend
 from luml.experiments.backends.sqlite import SQLiteBackend
+from luml.experiments.backends.sqlite_mp import MultiProcessSQLiteBackend
 
 
 class BackendRegistry:
@@ -17,5 +21,28 @@ class BackendRegistry:
             raise ValueError(f"Backend type '{backend_type}' is not registered.")
         return cls.backends[backend_type]
 
+    @classmethod
+    def from_connection_string(cls, connection_string: str) -> Backend:
+        """Creates a backend from ``backend://config?option=value&...``.
+
+        Query parameters are passed to the backend as keyword arguments.
+        """
+        if "://" not in connection_string:
+            raise ValueError("Invalid connection string format. Use 'backend://config'")
+
+        backend_type, config = connection_string.split("://", 1)
+        config, _, query = config.partition("?")
+        options = dict(parse_qsl(query, strict_parsing=bool(query)))
+
+        backend_class = cls.get_backend(backend_type)
+        try:
+            inspect.signature(backend_class).bind(config, **options)
+        except TypeError as e:
+            raise ValueError(
+                f"Invalid options for backend '{backend_type}': {e}"
+            ) from e
+        return backend_class(config, **options)
+
 
 BackendRegistry.register("sqlite", SQLiteBackend)
+BackendRegistry.register("sqlite-mp", MultiProcessSQLiteBackend)
@@ -1,6 +1,11 @@
+import mmap
+import os
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import IO, Any
 
+from luml.experiments.utils import SpanType
 from luml.modelref import _BaseArtifact
 
 
@@ -29,6 +34,29 @@ class Backend(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    def log_static_many(self, experiment_id: str, params: dict[str, Any]) -> None:  # noqa: ANN401
+        pass
+
+    @abstractmethod
+    def log_dynamic_many(
+        self,
+        experiment_id: str,
+        metrics: dict[str, int | float],
+        step: int | None = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def log_dynamic_series(
+        self,
+        experiment_id: str,
+        key: str,
+        values: Sequence[int | float] | Any,  # noqa: ANN401
+        steps: Sequence[int] | Any | None = None,  # noqa: ANN401
+    ) -> None:
+        pass
+
     @abstractmethod
     def log_attachment(
         self,
@@ -39,6 +67,15 @@ class Backend(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    def log_attachment_file(
+        self,
+        experiment_id: str,
+        name: str,
+        source: str | os.PathLike[str] | IO[Any],  # noqa: ANN401
+    ) -> None:
+        pass
+
     @abstractmethod
     def log_span(
         self,
@@ -59,6 +96,14 @@ class Backend(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    def log_spans(
+        self,
+        experiment_id: str,
+        spans: Iterable[dict[str, Any]],  # noqa: ANN401
+    ) -> None:
+        pass
+
     @abstractmethod
     def log_eval_sample(
         self,
@@ -73,6 +118,14 @@ class Backend(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    def log_eval_samples(
+        self,
+        experiment_id: str,
+        samples: Iterable[dict[str, Any]],  # noqa: ANN401
+    ) -> None:
+        pass
+
     @abstractmethod
     def link_eval_sample_to_trace(
         self,
@@ -87,12 +140,123 @@ class Backend(ABC):
     def get_experiment_data(self, experiment_id: str) -> dict[str, Any]:  # noqa: ANN401
         pass
 
+    @abstractmethod
+    def get_metric_arrays(
+        self,
+        experiment_id: str,
+        keys: Sequence[str] | None = None,
+        step_range: tuple[int, int] | None = None,
+        max_points: int | None = None,
+    ) -> dict[str, dict[str, Any]]:  # noqa: ANN401
+        pass
+
+    @abstractmethod
+    def get_metrics_since(
+        self, experiment_id: str, since: dict[str, int] | None = None
+    ) -> dict[str, Any]:  # noqa: ANN401
+        pass
+
+    @abstractmethod
+    def get_spans_since(
+        self, experiment_id: str, since: int | None = None, limit: int = 1000
+    ) -> dict[str, Any]:  # noqa: ANN401
+        pass
+
+    @abstractmethod
+    def get_evals_since(
+        self,
+        experiment_id: str,
+        since: int | None = None,
+        dataset_id: str | None = None,
+        limit: int = 1000,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        pass
+
+    @abstractmethod
+    def materialize_eval_scores(self, experiment_id: str, keys: Sequence[str]) -> None:
+        pass
+
+    @abstractmethod
+    def aggregate_evals(
+        self,
+        experiment_id: str,
+        dataset_id: str | None = None,
+        score_keys: Sequence[str] | None = None,
+        percentiles: Sequence[float] = (50, 90, 99),
+    ) -> dict[str, dict[str, dict[str, float]]]:
+        pass
+
+    @abstractmethod
+    def query_spans(
+        self,
+        experiment_id: str,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        span_type: SpanType | int | None = None,
+        status_code: int | None = None,
+        start_time_from: int | None = None,
+        start_time_to: int | None = None,
+        limit: int = 100,
+        start_after: str | None = None,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        pass
+
+    @abstractmethod
+    def search_spans(
+        self,
+        experiment_id: str,
+        query: str,
+        trace_id: str | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:  # noqa: ANN401
+        pass
+
+    @abstractmethod
+    def get_trace(self, experiment_id: str, trace_id: str) -> dict[str, Any]:  # noqa: ANN401
+        pass
+
+    @abstractmethod
+    def list_traces(
+        self,
+        experiment_id: str,
+        span_type: SpanType | int | None = None,
+        status_code: int | None = None,
+        start_time_from: int | None = None,
+        start_time_to: int | None = None,
+        limit: int = 50,
+        start_after: str | None = None,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        pass
+
     @abstractmethod
     def get_attachment(self, experiment_id: str, name: str) -> Any:  # noqa: ANN401
         pass
 
     @abstractmethod
-    def list_experiments(self) -> list[dict[str, Any]]:  # noqa: ANN401
+    def get_attachment_path(self, experiment_id: str, name: str) -> Path:
+        pass
+
+    @abstractmethod
+    def open_attachment(self, experiment_id: str, name: str) -> IO[bytes]:
+        pass
+
+    @abstractmethod
+    def map_attachment(self, experiment_id: str, name: str) -> mmap.mmap:
+        pass
+
+    @abstractmethod
+    def list_experiments(
+        self,
+        group: str | None = None,
+        tags: list[str] | None = None,
+        status: str | None = None,
+        order_by: str = "created_at",
+        order_by_metric: str | None = None,
+        metric_summary: str = "last",
+        descending: bool = False,
+        limit: int | None = None,
+        start_after: str | None = None,
+    ) -> list[dict[str, Any]]:  # noqa: ANN401
         pass
 
     @abstractmethod
@@ -107,14 +271,28 @@ class Backend(ABC):
     def list_groups(self) -> list[dict[str, Any]]:  # noqa: ANN401
         pass
 
+    @abstractmethod
+    def flush(self, experiment_id: str | None = None) -> None:
+        pass
+
     @abstractmethod
     def end_experiment(self, experiment_id: str) -> None:
         pass
 
+    @abstractmethod
+    def apply_retention(self, experiment_id: str) -> int:
+        pass
+
     @abstractmethod
     def export_experiment_db(self, experiment_id: str) -> _BaseArtifact:
         pass
 
+    @abstractmethod
+    def snapshot_experiment_db(
+        self, experiment_id: str, target: str | Path
+    ) -> _BaseArtifact:
+        pass
+
     @abstractmethod
     def export_attachments(
         self, experiment_id: str
@@ -0,0 +1,74 @@
+import contextlib
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import IO, Any
+
+
+class BlobStore:
+    """Content-addressed file store shared by all experiments of a backend.
+
+    Payloads are streamed in chunks into ``<root>/<sha256[:2]>/<sha256>`` while
+    being hashed, so identical content is stored once. Experiments reference a
+    blob through a hardlink, which makes the blob's link count its reference
+    count; filesystems without hardlinks fall back to a plain copy.
+    """
+
+    def __init__(self, root: str | Path, chunk_size: int = 1024 * 1024) -> None:
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, source: IO[Any]) -> tuple[str, int]:  # noqa: ANN401
+        self.root.mkdir(parents=True, exist_ok=True)
+        sha256 = hashlib.sha256()
+        size = 0
+        # the temporary file lives under root so the final rename stays atomic
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                while chunk := source.read(self.chunk_size):
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    sha256.update(chunk)
+                    tmp.write(chunk)
+                    size += len(chunk)
+            digest = sha256.hexdigest()
+            blob_path = self.path(digest)
+            with self._lock:
+                if blob_path.exists():
+                    os.unlink(tmp_name)
+                else:
+                    blob_path.parent.mkdir(exist_ok=True)
+                    os.replace(tmp_name, blob_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_name)
+            raise
+        return digest, size
+
+    def link(self, digest: str, dest: Path) -> None:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            with contextlib.suppress(FileNotFoundError):
+                dest.unlink()
+            try:
+                os.link(self.path(digest), dest)
+            except OSError:
+                shutil.copyfile(self.path(digest), dest)
+
+    def release(self, digests: Iterable[str]) -> None:
+        """Removes blobs no experiment links to any more."""
+        with self._lock:
+            for digest in set(digests):
+                blob_path = self.path(digest)
+                with contextlib.suppress(FileNotFoundError):
+                    if blob_path.stat().st_nlink <= 1:
+                        blob_path.unlink()
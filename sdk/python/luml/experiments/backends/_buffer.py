@@ -0,0 +1,119 @@
+import threading
+from collections.abc import Callable
+
+MetricRow = tuple[str, float, int]
+
+
+class MetricBuffer:
+    """Write-behind buffer for dynamic metrics.
+
+    Rows are accumulated per experiment and handed to ``flush_fn`` as one batch
+    when ``flush_size`` rows are pending, every ``flush_interval`` seconds, or
+    when ``flush`` is called explicitly. The rows of a batch that fails to
+    write stay pending and the error is raised from the flush, after the
+    batches of the other experiments have been written.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[str, list[MetricRow]], None],
+        flush_size: int = 1000,
+        flush_interval: float = 1.0,
+    ) -> None:
+        if flush_size < 1:
+            raise ValueError("flush_size must be a positive integer")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+
+        self.flush_fn = flush_fn
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self._pending: dict[str, list[MetricRow]] = {}
+        self._pending_count = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def add(self, experiment_id: str, key: str, value: float, step: int) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Metric buffer is closed")
+            self._pending.setdefault(experiment_id, []).append((key, value, step))
+            self._pending_count += 1
+            should_flush = self._pending_count >= self.flush_size
+            if self._thread is None:
+                self._start_flusher()
+
+        if should_flush:
+            self.flush()
+
+    def pending(self, experiment_id: str | None = None) -> int:
+        with self._lock:
+            if experiment_id is None:
+                return self._pending_count
+            return len(self._pending.get(experiment_id, []))
+
+    def flush(self, experiment_id: str | None = None) -> None:
+        # _flush_lock keeps batches of the same experiment in submission order
+        with self._flush_lock:
+            errors = []
+            for exp_id, rows in self._take(experiment_id).items():
+                try:
+                    self.flush_fn(exp_id, rows)
+                except Exception as e:
+                    self._restore(exp_id, rows)
+                    errors.append(e)
+            if errors:
+                raise errors[0]
+
+    def discard(self, experiment_id: str) -> None:
+        with self._lock:
+            rows = self._pending.pop(experiment_id, [])
+            self._pending_count -= len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+
+    def _take(self, experiment_id: str | None) -> dict[str, list[MetricRow]]:
+        with self._lock:
+            if experiment_id is None:
+                batches = self._pending
+                self._pending = {}
+                self._pending_count = 0
+                return batches
+            rows = self._pending.pop(experiment_id, [])
+            self._pending_count -= len(rows)
+            return {experiment_id: rows} if rows else {}
+
+    def _restore(self, experiment_id: str, rows: list[MetricRow]) -> None:
+        # failed rows go back in front of those added since they were taken
+        with self._lock:
+            self._pending[experiment_id] = rows + self._pending.get(experiment_id, [])
+            self._pending_count += len(rows)
+
+    def _start_flusher(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="luml-metric-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            if self._closed:
+                return
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Failed to flush buffered metrics: {e}")  # noqa: T201
@@ -0,0 +1,63 @@
+import json
+import threading
+from typing import Any
+
+# JSON shorter than this is kept as text, zstd frames would barely shrink it
+_COMPRESS_MIN_SIZE = 256
+
+_local = threading.local()
+
+
+def _zstandard() -> Any:  # noqa: ANN401
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError as e:
+        msg = (
+            "zstandard is required for compressed span storage. "
+            "Install with: pip install zstandard"
+        )
+        raise ImportError(msg) from e
+    return zstandard
+
+
+def _compressor() -> Any:  # noqa: ANN401
+    # zstandard contexts must not be shared between threads
+    if not hasattr(_local, "compressor"):
+        _local.compressor = _zstandard().ZstdCompressor(level=3)
+    return _local.compressor
+
+
+def _decompressor() -> Any:  # noqa: ANN401
+    if not hasattr(_local, "decompressor"):
+        _local.decompressor = _zstandard().ZstdDecompressor()
+    return _local.decompressor
+
+
+def check_compression_available() -> None:
+    _zstandard()
+
+
+def encode_json(value: Any, compress: bool = False) -> str | bytes | None:  # noqa: ANN401
+    """Serializes ``value`` to JSON text, or to a zstd frame when compressing.
+
+    Empty values are stored as NULL. Compressed values are stored as BLOBs, so
+    a column may mix both encodings and readers tell them apart by type.
+    """
+    if not value:
+        return None
+    text = json.dumps(value)
+    if not compress or len(text) < _COMPRESS_MIN_SIZE:
+        return text
+    return _compressor().compress(text.encode())
+
+
+def json_text(value: str | bytes | None) -> str | None:
+    if isinstance(value, bytes):
+        return _decompressor().decompress(value).decode()
+    return value
+
+
+def decode_json(value: str | bytes | None, default: Any = None) -> Any:  # noqa: ANN401
+    if not value:
+        return default
+    return json.loads(json_text(value))  # type: ignore[arg-type]
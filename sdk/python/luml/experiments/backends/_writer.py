@@ -0,0 +1,185 @@
+import contextlib
+import queue
+import sqlite3
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+WriteFn = Callable[[sqlite3.Connection], Any]
+
+
+@dataclass
+class _WriteOp:
+    fn: WriteFn
+    transactional: bool = True
+    future: Future = field(default_factory=Future)
+
+
+class SQLiteWriter:
+    """Single writer thread owning the only write connection of one database.
+
+    Callers from any thread submit functions that receive the connection. The
+    thread drains the queue in groups and runs every group in one transaction,
+    giving each operation its own savepoint so a failing operation is rolled
+    back and reported to its caller without affecting the rest of the group.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        configure: Callable[[sqlite3.Connection], None] | None = None,
+        max_group_size: int = 256,
+    ) -> None:
+        self.db_path = str(db_path)
+        self.max_group_size = max_group_size
+        self._configure = configure
+        self._queue: queue.SimpleQueue[_WriteOp | None] = queue.SimpleQueue()
+        self._closed = False
+        self._failed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"luml-sqlite-writer:{self.db_path}", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, fn: WriteFn, transactional: bool = True) -> Future:
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Cannot submit a write from inside a write operation")
+        op = _WriteOp(fn, transactional)
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError(f"Writer for {self.db_path} is closed")
+            self._queue.put(op)
+        return op.future
+
+    def execute(self, fn: WriteFn, transactional: bool = True) -> Any:  # noqa: ANN401
+        return self.submit(fn, transactional).result()
+
+    def close(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        # only takes effect while the database has no tables yet
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        if self._configure is not None:
+            self._configure(conn)
+        return conn
+
+    def _next_group(self) -> tuple[list[_WriteOp], bool]:
+        op = self._queue.get()
+        if op is None:
+            return [], True
+        group = [op]
+        while len(group) < self.max_group_size:
+            try:
+                next_op = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if next_op is None:
+                return group, True
+            group.append(next_op)
+        return group, False
+
+    def _run(self) -> None:
+        conn: sqlite3.Connection | None = None
+        stop = False
+        while not stop:
+            # the previous group is released before blocking on the queue, its
+            # operations may hold the last references to whoever submitted them
+            group: list[_WriteOp] = []
+            group, stop = self._next_group()
+            if not group:
+                break
+
+            if conn is not None and self._failed:
+                conn = self._check_connection(conn)
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except Exception as e:
+                    self._fail_group(group, e)
+                    continue
+            self._run_group(conn, group)
+
+        if conn is not None:
+            with contextlib.suppress(sqlite3.Error):
+                conn.close()
+
+    @staticmethod
+    def _fail_group(group: list[_WriteOp], error: Exception) -> None:
+        for op in group:
+            op.future.set_exception(error)
+
+    def _check_connection(self, conn: sqlite3.Connection) -> sqlite3.Connection | None:
+        # only probed after a transaction failed, not before every group
+        self._failed = False
+        try:
+            conn.execute("SELECT 1")
+            return conn
+        except sqlite3.Error:
+            with contextlib.suppress(sqlite3.Error):
+                conn.close()
+            return None
+
+    def _run_group(self, conn: sqlite3.Connection, group: list[_WriteOp]) -> None:
+        transaction: list[_WriteOp] = []
+        for op in group:
+            if op.transactional:
+                transaction.append(op)
+                continue
+            self._run_transaction(conn, transaction)
+            transaction = []
+            try:
+                op.future.set_result(op.fn(conn))
+            except Exception as e:
+                op.future.set_exception(e)
+        self._run_transaction(conn, transaction)
+
+    @staticmethod
+    def _run_savepoint(
+        conn: sqlite3.Connection, op: _WriteOp
+    ) -> tuple[Any, Exception | None]:  # noqa: ANN401
+        conn.execute("SAVEPOINT luml_write")
+        try:
+            result = op.fn(conn)
+        except Exception as e:
+            conn.execute("ROLLBACK TO luml_write")
+            conn.execute("RELEASE luml_write")
+            return None, e
+        conn.execute("RELEASE luml_write")
+        return result, None
+
+    def _run_transaction(self, conn: sqlite3.Connection, ops: list[_WriteOp]) -> None:
+        if not ops:
+            return
+
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            outcomes = [(op, *self._run_savepoint(conn, op)) for op in ops]
+            conn.execute("COMMIT")
+        except Exception as e:
+            self._failed = True
+            if conn.in_transaction:
+                with contextlib.suppress(sqlite3.Error):
+                    conn.execute("ROLLBACK")
+            for op in ops:
+                op.future.set_exception(e)
+            return
+
+        for op, result, error in outcomes:
+            if error is not None:
+                op.future.set_exception(error)
+            else:
+                op.future.set_result(result)
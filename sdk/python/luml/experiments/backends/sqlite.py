@@ -1,16 +1,37 @@
 # flake8: noqa: E501
 import atexit
 import contextlib
+import functools
+import io
 import json
+import math
+import mmap
+import os
+import re
 import sqlite3
 import threading
+import time
 import uuid
 import weakref
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from luml.experiments.backends._base import Backend
-from luml.experiments.utils import guess_span_type
+from luml.experiments.backends._blobs import BlobStore
+from luml.experiments.backends._buffer import MetricBuffer, MetricRow
+from luml.experiments.backends._codec import (
+    check_compression_available,
+    decode_json,
+    encode_json,
+    json_text,
+)
+from luml.experiments.backends._writer import SQLiteWriter, WriteFn
+from luml.experiments.utils import SpanType, guess_span_type
 from luml.modelref import DiskArtifact, _BaseArtifact
 from luml.utils.tar import create_and_index_tar
 
@@ -32,6 +53,31 @@ _DDL_META_CREATE_GROUPS = """
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 )
 """
+_DDL_META_CREATE_METRIC_SUMMARIES = """
+    CREATE TABLE IF NOT EXISTS metric_summaries (
+        experiment_id TEXT NOT NULL,
+        key TEXT NOT NULL,
+        last_value REAL,
+        last_step INTEGER,
+        min_value REAL,
+        max_value REAL,
+        PRIMARY KEY (experiment_id, key)
+    )
+"""
+
+# listing filters and orders by these with the experiment id as the keyset tiebreaker
+_DDL_META_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_experiments_created ON experiments (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_experiments_group ON experiments (group_name, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_experiments_status ON experiments (status, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_metric_summaries_last ON metric_summaries (key, last_value, experiment_id)",
+    "CREATE INDEX IF NOT EXISTS idx_metric_summaries_min ON metric_summaries (key, min_value, experiment_id)",
+    "CREATE INDEX IF NOT EXISTS idx_metric_summaries_max ON metric_summaries (key, max_value, experiment_id)",
+)
+
+_METRIC_SUMMARY_COLUMNS = {"last": "last_value", "min": "min_value", "max": "max_value"}
+_EXPERIMENT_ORDER_COLUMNS = {"created_at": "e.created_at", "name": "e.name"}
+
 _DDL_EXPERIMENT_CREATE_STATIC = """
     CREATE TABLE IF NOT EXISTS static_params (
         key TEXT PRIMARY KEY,
@@ -53,9 +99,13 @@ _DDL_EXPERIMENT_CREATE_ATTACHMENTS = """
         id TEXT PRIMARY KEY,
         name TEXT NOT NULL,
         file_path TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        sha256 TEXT,
+        size INTEGER
     )
 """
+# experiment databases created before attachments were content-addressed
+_ATTACHMENT_MIGRATION_COLUMNS = {"sha256": "TEXT", "size": "INTEGER"}
 
 _DDL_EXPERIMENT_CREATE_SPANS = """
     CREATE TABLE IF NOT EXISTS spans (
@@ -89,6 +139,116 @@ _DDL_EXPERIMENT_CREATE_SPANS = """
     );
 """
 
+# every index ends with the (start_time, trace_id, span_id) keyset used for paging
+_DDL_EXPERIMENT_CREATE_SPANS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_spans_parent ON spans (parent_span_id, start_time_unix_nano, trace_id, span_id)",
+    "CREATE INDEX IF NOT EXISTS idx_spans_start_time ON spans (start_time_unix_nano, trace_id, span_id)",
+    "CREATE INDEX IF NOT EXISTS idx_spans_type ON spans (dfs_span_type, start_time_unix_nano, trace_id, span_id)",
+    "CREATE INDEX IF NOT EXISTS idx_spans_status ON spans (status_code, start_time_unix_nano, trace_id, span_id)",
+)
+
+# per-trace rollups maintained while spans are ingested
+_DDL_EXPERIMENT_CREATE_TRACE_SUMMARIES = """
+    CREATE TABLE IF NOT EXISTS trace_summaries (
+        trace_id TEXT PRIMARY KEY,
+        root_span_id TEXT,
+        name TEXT,
+        dfs_span_type INTEGER,
+        status_code INTEGER,
+        start_time_unix_nano BIGINT NOT NULL,
+        end_time_unix_nano BIGINT NOT NULL,
+        span_count INTEGER NOT NULL,
+        error_count INTEGER NOT NULL,
+        prompt_tokens INTEGER NOT NULL DEFAULT 0,
+        completion_tokens INTEGER NOT NULL DEFAULT 0
+    )
+"""
+_DDL_EXPERIMENT_CREATE_TRACE_TOKEN_USAGE = """
+    CREATE TABLE IF NOT EXISTS trace_token_usage (
+        trace_id TEXT NOT NULL,
+        model TEXT NOT NULL,  -- '' when the span names no model
+        prompt_tokens INTEGER NOT NULL,
+        completion_tokens INTEGER NOT NULL,
+        PRIMARY KEY (trace_id, model)
+    )
+"""
+_DDL_EXPERIMENT_CREATE_TRACE_SUMMARIES_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_trace_summaries_start_time ON trace_summaries (start_time_unix_nano, trace_id)",
+)
+
+# OTEL gen_ai attributes, current semantic convention names first
+_MODEL_ATTRIBUTES = ("gen_ai.response.model", "gen_ai.request.model")
+_PROMPT_TOKENS_ATTRIBUTES = ("gen_ai.usage.input_tokens", "gen_ai.usage.prompt_tokens")
+_COMPLETION_TOKENS_ATTRIBUTES = (
+    "gen_ai.usage.output_tokens",
+    "gen_ai.usage.completion_tokens",
+)
+_SPAN_STATUS_ERROR = 2
+
+# rows per statement when binding lists, below SQLite's parameter limit
+_SQL_CHUNK_SIZE = 400
+
+
+def _json_sql(column: str) -> str:
+    # compressed span columns are BLOBs, decoded by a function on write connections
+    return f"CASE typeof({column}) WHEN 'blob' THEN luml_json_text({column}) ELSE {column} END"
+
+
+def _attribute_sql(names: Sequence[str]) -> str:
+    attributes = _json_sql("attributes")
+    return "COALESCE({})".format(
+        ", ".join(f"json_extract({attributes}, '$.\"{name}\"')" for name in names)
+    )
+
+
+# attribute keys (GLOB patterns) whose values are indexed for span search,
+# looked up on the span itself and on its events
+_SEARCHABLE_ATTRIBUTES = (
+    "gen_ai.prompt*",
+    "gen_ai.completion*",
+    "gen_ai.input.messages",
+    "gen_ai.output.messages",
+    "gen_ai.system_instructions",
+    "gen_ai.tool.name",
+    "gen_ai.tool.call.arguments",
+    "gen_ai.tool.call.result",
+    "exception.type",
+    "exception.message",
+    "input.value",
+    "output.value",
+)
+
+
+def _span_search_content_sql(row: str) -> str:
+    keys = " OR ".join(f"a.key GLOB '{pattern}'" for pattern in _SEARCHABLE_ATTRIBUTES)
+    return f"""
+        COALESCE({row}.status_message, '') || ' ' || COALESCE(
+            (SELECT group_concat(a.value, ' ') FROM json_each({_json_sql(f"{row}.attributes")}) AS a
+                WHERE {keys}),
+            ''
+        ) || ' ' || COALESCE(
+            (SELECT group_concat(a.value, ' ')
+                FROM json_each({_json_sql(f"{row}.events")}) AS e,
+                    json_each(e.value, '$.attributes') AS a
+                WHERE {keys}),
+            ''
+        )
+    """
+
+
+# the index shares rowids with spans and is maintained in bulk by the code that
+# writes spans, as FTS5 flushes its pending terms after every statement run
+# from a trigger
+_DDL_EXPERIMENT_CREATE_SPAN_SEARCH = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS span_search USING fts5(name, content)",
+)
+
+_SPAN_COLUMNS = """
+    trace_id, span_id, parent_span_id, name, kind, dfs_span_type,
+    start_time_unix_nano, end_time_unix_nano, status_code, status_message,
+    attributes, events, links, trace_flags
+"""
+
 _DDL_EXPERIMENT_CREATE_EVALS = """
     CREATE TABLE IF NOT EXISTS evals (
         id TEXT NOT NULL,
@@ -114,112 +274,593 @@ _DDL_EXPERIMENT_CREATE_EVAL_TRACES_BRIDGE = """
     )
 """
 
+# scores keys materialized as generated columns of evals, see materialize_eval_scores
+_DDL_EXPERIMENT_CREATE_EVAL_SCORE_COLUMNS = """
+    CREATE TABLE IF NOT EXISTS eval_score_columns (
+        key TEXT PRIMARY KEY,
+        column_name TEXT NOT NULL
+    )
+"""
+
+# highest rowid handed out per table, see _next_rowids
+_DDL_EXPERIMENT_CREATE_ROWID_SEQUENCES = """
+    CREATE TABLE IF NOT EXISTS rowid_sequences (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    )
+"""
+
+
+# PRAGMAs applied to every connection, trading durability for write throughput
+_PRAGMA_PROFILES: dict[str, dict[str, str | int]] = {
+    # SQLite defaults: every commit is fsynced
+    "durable": {
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "temp_store": "DEFAULT",
+        "mmap_size": 0,
+    },
+    # a commit may be lost on power failure but the database stays consistent
+    "fast": {
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "temp_store": "MEMORY",
+        "mmap_size": 256 * 1024 * 1024,
+    },
+    # no fsync at all, for one-off imports that can be rerun after a crash
+    "bulk-import": {
+        "synchronous": "OFF",
+        "cache_size": -256000,
+        "temp_store": "MEMORY",
+        "mmap_size": 1024 * 1024 * 1024,
+        "wal_autocheckpoint": 10000,
+    },
+}
+
+
+def _apply_pragmas(conn: sqlite3.Connection, pragmas: dict[str, str | int]) -> None:
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+
+
+def _configure_writer(conn: sqlite3.Connection, pragmas: dict[str, str | int]) -> None:
+    _apply_pragmas(conn, pragmas)
+    conn.create_function("luml_json_text", 1, json_text, deterministic=True)
+    conn.create_function("luml_sample", 2, _sample_trace, deterministic=True)
+
+
+def _sample_trace(trace_id: str, rate: float) -> bool:
+    # stable across processes, unlike hash()
+    return zlib.crc32(trace_id.encode()) < rate * 2**32
+
+
+@dataclass
+class RetentionPolicy:
+    """Which traces an experiment keeps, enforced while spans are logged.
+
+    Traces are pruned as a whole. ``max_age`` (seconds) drops traces that
+    ended longer ago, ``success_sample_rate`` keeps that fraction of completed
+    traces without errors, and ``max_spans`` then drops the oldest traces
+    until the experiment holds at most that many spans. A pass runs at most
+    every ``interval`` seconds per experiment.
+    """
+
+    max_age: float | None = None
+    max_spans: int | None = None
+    success_sample_rate: float = 1.0
+    interval: float = 60.0
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.max_age is not None
+            or self.max_spans is not None
+            or self.success_sample_rate < 1.0
+        )
+
+
+class _ReadConnection(sqlite3.Connection):
+    """Read connection that remembers whether a query on it has failed."""
+
+    failed = False
+
+    def execute(self, *args: Any, **kwargs: Any) -> sqlite3.Cursor:  # noqa: ANN401
+        try:
+            return super().execute(*args, **kwargs)
+        except sqlite3.Error:
+            self.failed = True
+            raise
+
+    def cursor(self, *args: Any, **kwargs: Any) -> sqlite3.Cursor:  # noqa: ANN401
+        return super().cursor(_ReadCursor, *args, **kwargs)
+
+
+class _ReadCursor(sqlite3.Cursor):
+    def execute(self, *args: Any, **kwargs: Any) -> sqlite3.Cursor:  # noqa: ANN401
+        try:
+            return super().execute(*args, **kwargs)
+        except sqlite3.Error:
+            self.connection.failed = True  # type: ignore[attr-defined]
+            raise
+
+
+@dataclass
+class _PoolEntry:
+    reader: _ReadConnection | None = None
+    writer: SQLiteWriter | None = None
+
 
 class ConnectionPool:
-    def __init__(self, max_connections: int = 10) -> None:
+    """LRU pool of per-database read connections and single writers.
+
+    Every database gets one ``SQLiteWriter`` that owns its only write connection
+    and one read-only connection shared by readers. When ``max_connections``
+    databases are open, the least recently used one that is not pinned (the
+    meta database and active experiments) is closed; if every open database is
+    pinned the pool grows past its limit instead. Read connections are only
+    checked for liveness after a query on them has failed.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        pragmas: dict[str, str | int] | None = None,
+    ) -> None:
         self.max_connections = max_connections
-        self._connections: dict[str, sqlite3.Connection] = {}
+        self.pragmas = pragmas or {}
+        self._entries: OrderedDict[str, _PoolEntry] = OrderedDict()
+        self._pinned: set[str] = set()
         self._lock = threading.RLock()
-        self._active_experiments: set[str] = set()
         atexit.register(self.close_all)
 
     def get_connection(self, db_path: str | Path) -> sqlite3.Connection:
         db_path = str(db_path)
 
         with self._lock:
-            if db_path in self._connections:
-                conn = self._connections[db_path]
+            entry = self._checkout_unsafe(db_path)
+            if entry.reader is not None and entry.reader.failed:
                 try:
-                    conn.execute("SELECT 1")
-                    return conn
+                    entry.reader.execute("SELECT 1")
+                    entry.reader.failed = False
                 except sqlite3.Error:
-                    self._close_connection_unsafe(db_path)
-
-            if len(self._connections) >= self.max_connections:
-                self._evict_inactive_connection()
-
-            conn = sqlite3.Connection(db_path, check_same_thread=False)
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
-
-            self._connections[db_path] = conn
-            return conn
+                    self._close_reader_unsafe(entry)
+
+            if entry.reader is None:
+                conn = sqlite3.connect(
+                    f"{Path(db_path).resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                    factory=_ReadConnection,
+                )
+                _apply_pragmas(conn, self.pragmas)
+                entry.reader = conn
+            return entry.reader
+
+    def get_writer(self, db_path: str | Path) -> SQLiteWriter:
+        db_path = str(db_path)
 
-    def mark_experiment_active(self, experiment_id: str) -> None:
         with self._lock:
-            self._active_experiments.add(experiment_id)
+            entry = self._checkout_unsafe(db_path)
+            if entry.writer is None:
+                entry.writer = SQLiteWriter(
+                    db_path,
+                    configure=lambda conn: _configure_writer(conn, self.pragmas),
+                )
+            return entry.writer
+
+    def pin(self, db_path: str | Path) -> None:
+        """Keeps the database open until ``unpin`` regardless of LRU order."""
+        with self._lock:
+            self._pinned.add(str(db_path))
 
-    def mark_experiment_inactive(self, experiment_id: str) -> None:
+    def unpin(self, db_path: str | Path) -> None:
         with self._lock:
-            self._active_experiments.discard(experiment_id)
-            exp_db_pattern = f"{experiment_id}/exp.db"
-            for db_path in list(self._connections.keys()):
-                if db_path.endswith(exp_db_pattern):
-                    self._close_connection_unsafe(db_path)
-
-    def _evict_inactive_connection(self) -> None:
-        if not self._connections:
-            return
+            self._pinned.discard(str(db_path))
+            self._close_connection_unsafe(str(db_path))
 
-        for db_path in list(self._connections.keys()):
-            if not any(
-                f"{exp_id}/exp.db" in db_path for exp_id in self._active_experiments
-            ) and not db_path.endswith("meta.db"):
+    def _checkout_unsafe(self, db_path: str) -> _PoolEntry:
+        entry = self._entries.get(db_path)
+        if entry is not None:
+            self._entries.move_to_end(db_path)
+            return entry
+
+        if len(self._entries) >= self.max_connections:
+            self._evict_unsafe()
+        entry = self._entries[db_path] = _PoolEntry()
+        return entry
+
+    def _evict_unsafe(self) -> None:
+        # pinned databases are never closed, with more active experiments than
+        # max_connections the pool grows past its limit until they are unpinned
+        for db_path in self._entries:
+            if db_path not in self._pinned:
                 self._close_connection_unsafe(db_path)
                 return
 
-        inactive_paths = [p for p in self._connections if not p.endswith("meta.db")]
-        if inactive_paths:
-            self._close_connection_unsafe(inactive_paths[0])
+    @staticmethod
+    def _close_reader_unsafe(entry: _PoolEntry) -> None:
+        if entry.reader is not None:
+            with contextlib.suppress(sqlite3.Error):
+                entry.reader.close()
+            entry.reader = None
 
     def _close_connection_unsafe(self, db_path: str) -> None:
-        if db_path in self._connections:
-            with contextlib.suppress(sqlite3.Error):
-                self._connections[db_path].close()
-            del self._connections[db_path]
+        entry = self._entries.pop(db_path, None)
+        if entry is None:
+            return
+        self._close_reader_unsafe(entry)
+        if entry.writer is not None:
+            entry.writer.close()
 
-    def close_connection(self, db_path: str) -> None:
+    def close_connection(self, db_path: str | Path) -> None:
         with self._lock:
             self._close_connection_unsafe(str(db_path))
 
     def close_all(self) -> None:
         with self._lock:
-            for db_path in list(self._connections.keys()):
+            for db_path in list(self._entries):
                 self._close_connection_unsafe(db_path)
 
     def get_stats(self) -> dict[str, Any]:  # noqa: ANN401
         with self._lock:
             return {
-                "total_connections": len(self._connections),
+                "total_connections": len(self._entries),
                 "max_connections": self.max_connections,
-                "active_experiments": len(self._active_experiments),
-                "connections": list(self._connections.keys()),
-                "active_experiment_ids": list(self._active_experiments),
+                "pinned": len(self._pinned),
+                "connections": list(self._entries),
+                "writers": [p for p, e in self._entries.items() if e.writer],
+                "pinned_paths": list(self._pinned),
             }
 
 
+def _experiment_db_path(base_path: Path, experiment_id: str) -> Path:
+    return base_path / experiment_id / "exp.db"
+
+
+_SQL_INSERT_DYNAMIC_METRICS = """
+    INSERT OR REPLACE INTO dynamic_metrics (key, value, step)
+    VALUES (?, ?, ?)
+"""
+_SQL_MERGE_METRIC_SUMMARIES = """
+    INSERT INTO metric_summaries (
+        experiment_id, key, last_value, last_step, min_value, max_value
+    ) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (experiment_id, key) DO UPDATE SET
+        last_value = CASE WHEN excluded.last_step >= last_step
+            THEN excluded.last_value ELSE last_value END,
+        last_step = MAX(last_step, excluded.last_step),
+        min_value = MIN(min_value, excluded.min_value),
+        max_value = MAX(max_value, excluded.max_value)
+"""
+_SQL_REPLACE_METRIC_SUMMARIES = """
+    INSERT OR REPLACE INTO metric_summaries (
+        experiment_id, key, last_value, last_step, min_value, max_value
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _next_rowids(conn: sqlite3.Connection, table: str, count: int) -> range:
+    """Reserves ``count`` rowids of ``table`` above any it has handed out.
+
+    SQLite gives a new row the highest rowid in the table plus one, so once the
+    newest rows are deleted, e.g. by retention, their rowids are handed out
+    again and fall behind the cursors of ``get_spans_since``/``get_evals_since``.
+    """
+    (last,) = conn.execute(
+        f"""
+        SELECT MAX(
+            COALESCE((SELECT value FROM rowid_sequences WHERE name = ?), 0),
+            COALESCE((SELECT MAX(rowid) FROM {table}), 0)
+        )
+        """,
+        (table,),
+    ).fetchone()
+    conn.execute(
+        "INSERT OR REPLACE INTO rowid_sequences (name, value) VALUES (?, ?)",
+        (table, last + count),
+    )
+    return range(last + 1, last + count + 1)
+
+
+def _summarise_metric_rows(
+    rows: Iterable[MetricRow],
+) -> tuple[dict[str, list[float | int]], dict[str, int]]:
+    """Returns the last, min and max of every key and its first step."""
+    summaries: dict[str, list[float | int]] = {}
+    first_steps: dict[str, int] = {}
+    for key, value, step in rows:
+        first_steps[key] = min(step, first_steps.get(key, step))
+        summary = summaries.get(key)
+        if summary is None:
+            summaries[key] = [value, step, value, value]
+            continue
+        if step >= summary[1]:
+            summary[0], summary[1] = value, step
+        summary[2] = min(summary[2], value)
+        summary[3] = max(summary[3], value)
+    return summaries, first_steps
+
+
+def _write_metric_rows(
+    conn: sqlite3.Connection,
+    meta_writer: SQLiteWriter,
+    summary_errors: list[BaseException],
+    experiment_id: str,
+    rows: Sequence[MetricRow],
+) -> None:
+    """Inserts metric rows from inside the experiment's writer.
+
+    The update of their summaries is queued on the meta.db writer without
+    waiting for it, so logging a metric commits only the experiment database;
+    its failures are kept in ``summary_errors``. Rows appended past the last
+    step of a key are merged into the stored summary, a key with an overwritten
+    step is summarised again from the table since the replaced value may have
+    been its min or max.
+    """
+    summaries, first_steps = _summarise_metric_rows(rows)
+    if not summaries:
+        return
+
+    overwritten = set()
+    for key, first_step in first_steps.items():
+        (last_step,) = conn.execute(
+            "SELECT MAX(step) FROM dynamic_metrics WHERE key = ?", (key,)
+        ).fetchone()
+        if last_step is not None and first_step <= last_step:
+            overwritten.add(key)
+
+    conn.executemany(_SQL_INSERT_DYNAMIC_METRICS, rows)
+    for key in overwritten:
+        summaries[key] = [
+            *conn.execute(
+                """
+                SELECT value, step FROM dynamic_metrics
+                WHERE key = ? ORDER BY step DESC LIMIT 1
+            """,
+                (key,),
+            ).fetchone(),
+            *conn.execute(
+                "SELECT MIN(value), MAX(value) FROM dynamic_metrics WHERE key = ?",
+                (key,),
+            ).fetchone(),
+        ]
+
+    merged = [
+        (experiment_id, key, *summary)
+        for key, summary in summaries.items()
+        if key not in overwritten
+    ]
+    replaced = [(experiment_id, key, *summaries[key]) for key in overwritten]
+
+    def update_summaries(meta_conn: sqlite3.Connection) -> None:
+        meta_conn.executemany(_SQL_MERGE_METRIC_SUMMARIES, merged)
+        meta_conn.executemany(_SQL_REPLACE_METRIC_SUMMARIES, replaced)
+
+    def record_error(future: Future) -> None:
+        if future.exception() is not None:
+            summary_errors.append(future.exception())  # type: ignore[arg-type]
+
+    meta_writer.submit(update_summaries).add_done_callback(record_error)
+
+
+# a module function so the metric buffer, whose flusher thread outlives any
+# reference to the backend, does not keep the backend alive
+def _write_metrics(
+    pool: ConnectionPool,
+    base_path: Path,
+    summary_errors: list[BaseException],
+    experiment_id: str,
+    rows: Iterable[MetricRow],
+) -> None:
+    rows = list(rows)
+    # fetched here, the experiment's writer must not wait on the pool lock
+    meta_writer = pool.get_writer(base_path / "meta.db")
+    pool.get_writer(_experiment_db_path(base_path, experiment_id)).execute(
+        lambda conn: _write_metric_rows(
+            conn, meta_writer, summary_errors, experiment_id, rows
+        )
+    )
+
+
+def _has_fts5() -> bool:
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE probe USING fts5(content)")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+    return True
+
+
+def _parse_bool(value: bool | str) -> bool:
+    if isinstance(value, bool):
+        return value
+    if value.lower() in ("1", "true", "yes", "on"):
+        return True
+    if value.lower() in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Invalid boolean value: {value}")
+
+
 class SQLiteBackend(Backend):
+    """SQLite experiment backend.
+
+    The config is a directory path. Options may also be given as query
+    parameters of the connection string, e.g.
+    ``sqlite://./experiments?buffered=true&pragma_profile=fast``.
+
+    Options:
+        buffered: Buffer dynamic metrics in memory and write them in batches.
+        flush_size: Number of pending metrics that triggers a flush.
+        flush_interval: Maximum time in seconds a metric stays in the buffer.
+        pragma_profile: One of "durable" (default), "fast" or "bulk-import".
+        pool_size: Maximum number of databases kept open at once.
+        span_search: Maintain a full-text index of span names, status messages
+            and prompt, completion, tool and exception attributes for
+            ``search_spans``. Requires SQLite built with FTS5.
+        span_compression: Store large span attributes, events and links as
+            zstd-compressed JSON. Requires ``zstandard``; such databases can
+            only be read through the SDK.
+        retention_max_age, retention_max_spans, retention_success_sample_rate,
+        retention_interval: Fields of the ``RetentionPolicy`` applied to spans.
+    """
+
     def __init__(
         self,
         config: str,
+        buffered: bool | str = False,
+        flush_size: int | str = 1000,
+        flush_interval: float | str = 1.0,
+        pragma_profile: str = "durable",
+        pool_size: int | str = 10,
+        span_search: bool | str = False,
+        span_compression: bool | str = False,
+        retention_max_age: float | str | None = None,
+        retention_max_spans: int | str | None = None,
+        retention_success_sample_rate: float | str = 1.0,
+        retention_interval: float | str = 60.0,
     ) -> None:
+        if pragma_profile not in _PRAGMA_PROFILES:
+            raise ValueError(
+                f"Unknown pragma profile {pragma_profile!r}, expected one of "
+                f"{', '.join(_PRAGMA_PROFILES)}"
+            )
+        self.pragma_profile = pragma_profile
+        self.span_search = _parse_bool(span_search)
+        if self.span_search and not _has_fts5():
+            raise RuntimeError("span_search requires SQLite built with FTS5")
+        self.span_compression = _parse_bool(span_compression)
+        if self.span_compression:
+            check_compression_available()
+        self.retention = RetentionPolicy(
+            max_age=None if retention_max_age is None else float(retention_max_age),
+            max_spans=None if retention_max_spans is None else int(retention_max_spans),
+            success_sample_rate=float(retention_success_sample_rate),
+            interval=float(retention_interval),
+        )
+        self._retention_runs: dict[str, float] = {}
+        self._retention_lock = threading.Lock()
+
         self.base_path = Path(config)
         self.base_path.mkdir(exist_ok=True)
         self.meta_db_path = self.base_path / "meta.db"
-
-        self.pool = ConnectionPool(10)
+        self.blobs = BlobStore(self.base_path / "blobs")
+
+        self.pool = ConnectionPool(int(pool_size), _PRAGMA_PROFILES[pragma_profile])
+        self.pool.pin(self.meta_db_path)
+
+        self._known_experiments: set[str] = set()
+        self._steps: dict[tuple[str, str], int] = {}
+        self._steps_lock = threading.Lock()
+        self._summary_errors: list[BaseException] = []
+        self._buffer: MetricBuffer | None = None
+        if _parse_bool(buffered):
+            self._buffer = MetricBuffer(
+                functools.partial(
+                    _write_metrics, self.pool, self.base_path, self._summary_errors
+                ),
+                int(flush_size),
+                float(flush_interval),
+            )
+            atexit.register(self._buffer.close)
 
         self._initialize_meta_db()
-        weakref.finalize(self, self._cleanup)
+        # the callback must not reference the backend or it is never collected
+        weakref.finalize(self, SQLiteBackend._cleanup, self.pool, self._buffer)
+
+    @property
+    def buffered(self) -> bool:
+        return self._buffer is not None
 
-    def _cleanup(self) -> None:
-        if hasattr(self, "pool"):
-            self.pool.close_all()
+    @staticmethod
+    def _cleanup(pool: ConnectionPool, buffer: MetricBuffer | None) -> None:
+        if buffer is not None:
+            atexit.unregister(buffer.close)
+            buffer.close()
+        atexit.unregister(pool.close_all)
+        pool.close_all()
 
     def _ensure_experiment_initialized(self, experiment_id: str) -> None:
+        if experiment_id in self._known_experiments:
+            return
         db_path = self._get_experiment_db_path(experiment_id)
         if not db_path.exists():
             raise ValueError(f"Experiment {experiment_id} not initialized")
+        if self.buffered:
+            self._known_experiments.add(experiment_id)
+
+    def _next_step(self, experiment_id: str, key: str) -> int:
+        with self._steps_lock:
+            counter_key = (experiment_id, key)
+            if counter_key not in self._steps:
+                self._steps[counter_key] = self._get_max_step(experiment_id, key)
+            self._steps[counter_key] += 1
+            return self._steps[counter_key]
+
+    def _advance_step(self, experiment_id: str, key: str, step: int) -> None:
+        with self._steps_lock:
+            counter_key = (experiment_id, key)
+            if counter_key not in self._steps:
+                self._steps[counter_key] = self._get_max_step(experiment_id, key)
+            self._steps[counter_key] = max(self._steps[counter_key], step)
+
+    def _get_max_step(self, experiment_id: str, key: str) -> int:
+        conn = self._get_experiment_connection(experiment_id)
+        cursor = conn.cursor()
+        cursor.execute("SELECT MAX(step) FROM dynamic_metrics WHERE key = ?", (key,))
+        result = cursor.fetchone()
+        return -1 if result[0] is None else result[0]
+
+    def _write_metrics(self, experiment_id: str, rows: Iterable[MetricRow]) -> None:
+        _write_metrics(
+            self.pool, self.base_path, self._summary_errors, experiment_id, rows
+        )
+
+    def _wait_for_summaries(self) -> None:
+        # metric summary updates are queued on the meta.db writer, not waited for
+        self.pool.get_writer(self.meta_db_path).execute(
+            lambda conn: None, transactional=False
+        )
+        errors = list(self._summary_errors)
+        self._summary_errors.clear()
+        if errors:
+            raise errors[0]
+
+    def _forget_experiment(self, experiment_id: str) -> None:
+        self._known_experiments.discard(experiment_id)
+        self._retention_runs.pop(experiment_id, None)
+        with self._steps_lock:
+            for counter_key in [k for k in self._steps if k[0] == experiment_id]:
+                del self._steps[counter_key]
+
+    def _write(
+        self, db_path: str | Path, fn: WriteFn, transactional: bool = True
+    ) -> Any:  # noqa: ANN401
+        return self.pool.get_writer(db_path).execute(fn, transactional)
+
+    def _execute(
+        self,
+        db_path: str | Path,
+        sql: str,
+        params: Sequence[Any] = (),  # noqa: ANN401
+    ) -> None:
+        self._write(db_path, lambda conn: conn.execute(sql, params).rowcount)
+
+    def _executemany(
+        self,
+        db_path: str | Path,
+        sql: str,
+        rows: Iterable[Sequence[Any]],  # noqa: ANN401
+    ) -> None:
+        self._write(db_path, lambda conn: conn.executemany(sql, rows).rowcount)
+
+    def _execute_script(self, db_path: str | Path, statements: Sequence[str]) -> None:
+        def run(conn: sqlite3.Connection) -> None:
+            for statement in statements:
+                conn.execute(statement)
+
+        self._write(db_path, run)
 
     def _get_meta_connection(self) -> sqlite3.Connection:
         return self.pool.get_connection(self.meta_db_path)
@@ -232,19 +873,21 @@ class SQLiteBackend(Backend):
         return self.base_path / experiment_id
 
     def _get_experiment_db_path(self, experiment_id: str) -> Path:
-        return self._get_experiment_dir(experiment_id) / "exp.db"
+        return _experiment_db_path(self.base_path, experiment_id)
 
     def _get_attachments_dir(self, experiment_id: str) -> Path:
         return self._get_experiment_dir(experiment_id) / "attachments"
 
     def _initialize_meta_db(self) -> None:
-        conn = self._get_meta_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(_DDL_META_CREATE_EXPERIMENTS)
-        cursor.execute(_DDL_META_CREATE_GROUPS)
-
-        conn.commit()
+        self._execute_script(
+            self.meta_db_path,
+            [
+                _DDL_META_CREATE_EXPERIMENTS,
+                _DDL_META_CREATE_GROUPS,
+                _DDL_META_CREATE_METRIC_SUMMARIES,
+                *_DDL_META_CREATE_INDEXES,
+            ],
+        )
 
     def _initialize_experiment_db(self, experiment_id: str) -> None:
         exp_dir = self._get_experiment_dir(experiment_id)
@@ -252,17 +895,56 @@ class SQLiteBackend(Backend):
         attachments_dir = self._get_attachments_dir(experiment_id)
         attachments_dir.mkdir(exist_ok=True)
 
-        db_path = self._get_experiment_db_path(experiment_id)
-        conn = self.pool.get_connection(db_path)
-        cursor = conn.cursor()
+        def migrate_attachments(conn: sqlite3.Connection) -> None:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(attachments)")}
+            for column, column_type in _ATTACHMENT_MIGRATION_COLUMNS.items():
+                if column not in columns:
+                    conn.execute(
+                        f"ALTER TABLE attachments ADD COLUMN {column} {column_type}"
+                    )
+
+        self._execute_script(
+            self._get_experiment_db_path(experiment_id),
+            [
+                _DDL_EXPERIMENT_CREATE_STATIC,
+                _DDL_EXPERIMENT_CREATE_DYNAMIC,
+                _DDL_EXPERIMENT_CREATE_ATTACHMENTS,
+                _DDL_EXPERIMENT_CREATE_SPANS,
+                *_DDL_EXPERIMENT_CREATE_SPANS_INDEXES,
+                _DDL_EXPERIMENT_CREATE_TRACE_SUMMARIES,
+                _DDL_EXPERIMENT_CREATE_TRACE_TOKEN_USAGE,
+                *_DDL_EXPERIMENT_CREATE_TRACE_SUMMARIES_INDEXES,
+                _DDL_EXPERIMENT_CREATE_EVALS,
+                _DDL_EXPERIMENT_CREATE_EVAL_TRACES_BRIDGE,
+                _DDL_EXPERIMENT_CREATE_EVAL_SCORE_COLUMNS,
+                _DDL_EXPERIMENT_CREATE_ROWID_SEQUENCES,
+            ],
+        )
 
-        cursor.execute(_DDL_EXPERIMENT_CREATE_STATIC)
-        cursor.execute(_DDL_EXPERIMENT_CREATE_DYNAMIC)
-        cursor.execute(_DDL_EXPERIMENT_CREATE_ATTACHMENTS)
-        cursor.execute(_DDL_EXPERIMENT_CREATE_SPANS)
-        cursor.execute(_DDL_EXPERIMENT_CREATE_EVALS)
-        cursor.execute(_DDL_EXPERIMENT_CREATE_EVAL_TRACES_BRIDGE)
-        conn.commit()
+        def migrate_trace_summaries(conn: sqlite3.Connection) -> None:
+            # databases written before the rollups existed are summarised once
+            has_spans = conn.execute("SELECT 1 FROM spans LIMIT 1").fetchone()
+            has_summaries = conn.execute(
+                "SELECT 1 FROM trace_summaries LIMIT 1"
+            ).fetchone()
+            if has_spans and not has_summaries:
+                self._rebuild_trace_summaries(conn)
+
+        def create_span_search(conn: sqlite3.Connection) -> None:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'span_search'"
+            ).fetchone()
+            for statement in _DDL_EXPERIMENT_CREATE_SPAN_SEARCH:
+                conn.execute(statement)
+            if not exists:
+                self._index_spans(conn)
+
+        self._write(self._get_experiment_db_path(experiment_id), migrate_attachments)
+        if self.span_search:
+            self._write(self._get_experiment_db_path(experiment_id), create_span_search)
+        self._write(
+            self._get_experiment_db_path(experiment_id), migrate_trace_summaries
+        )
 
     def initialize_experiment(
         self,
@@ -271,11 +953,9 @@ class SQLiteBackend(Backend):
         group: str | None = None,
         tags: list[str] | None = None,
     ) -> None:
-        conn = self._get_meta_connection()
-        cursor = conn.cursor()
-
         tags_str = json.dumps(tags) if tags else None
-        cursor.execute(
+        self._execute(
+            self.meta_db_path,
             """
             INSERT OR REPLACE INTO experiments (id, name, group_name, tags)
             VALUES (?, ?, ?, ?)
@@ -283,87 +963,214 @@ class SQLiteBackend(Backend):
             (experiment_id, name or experiment_id, group, tags_str),
         )
 
-        conn.commit()
-
         self._initialize_experiment_db(experiment_id)
-        self.pool.mark_experiment_active(experiment_id)
+        self.pool.pin(self._get_experiment_db_path(experiment_id))
+        if self.buffered:
+            self._known_experiments.add(experiment_id)
+
+    @staticmethod
+    def _encode_static(key: str, value: Any) -> tuple[str, str, str]:  # noqa: ANN401
+        if isinstance(value, str | int | float | bool):
+            return key, str(value), type(value).__name__
+        return key, json.dumps(value), "json"
 
     def log_static(self, experiment_id: str, key: str, value: Any) -> None:  # noqa: ANN401
         self._ensure_experiment_initialized(experiment_id)
 
-        conn = self._get_experiment_connection(experiment_id)
-        cursor = conn.cursor()
+        self._execute(
+            self._get_experiment_db_path(experiment_id),
+            """
+            INSERT OR REPLACE INTO static_params (key, value, value_type)
+            VALUES (?, ?, ?)
+        """,
+            self._encode_static(key, value),
+        )
 
-        if isinstance(value, str | int | float | bool):
-            value_str = str(value)
-            value_type = type(value).__name__
-        else:
-            value_str = json.dumps(value)
-            value_type = "json"
+    def log_static_many(self, experiment_id: str, params: dict[str, Any]) -> None:  # noqa: ANN401
+        self._ensure_experiment_initialized(experiment_id)
 
-        cursor.execute(
+        self._executemany(
+            self._get_experiment_db_path(experiment_id),
             """
             INSERT OR REPLACE INTO static_params (key, value, value_type)
             VALUES (?, ?, ?)
         """,
-            (key, value_str, value_type),
+            [self._encode_static(key, value) for key, value in params.items()],
         )
 
-        conn.commit()
-
     def log_dynamic(
         self, experiment_id: str, key: str, value: int | float, step: int | None = None
     ) -> None:
         self._ensure_experiment_initialized(experiment_id)
-        conn = self._get_experiment_connection(experiment_id)
-        cursor = conn.cursor()
-        if step is None:
-            cursor.execute(
-                "SELECT MAX(step) FROM dynamic_metrics WHERE key = ?", (key,)
+        if self._buffer is not None:
+            if step is None:
+                step = self._next_step(experiment_id, key)
+            else:
+                self._advance_step(experiment_id, key, step)
+            self._buffer.add(experiment_id, key, float(value), step)
+            return
+
+        self.log_dynamic_many(experiment_id, {key: value}, step)
+
+    def log_dynamic_many(
+        self,
+        experiment_id: str,
+        metrics: dict[str, int | float],
+        step: int | None = None,
+    ) -> None:
+        self._ensure_experiment_initialized(experiment_id)
+        if self._buffer is not None:
+            for key, value in metrics.items():
+                self.log_dynamic(experiment_id, key, value, step)
+            return
+
+        if step is not None:
+            self._write_metrics(
+                experiment_id,
+                [(key, float(value), step) for key, value in metrics.items()],
             )
-            result = cursor.fetchone()
-            step = (result[0] or -1) + 1
+            return
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO dynamic_metrics (key, value, step)
-            VALUES (?, ?, ?)
-        """,
-            (key, float(value), step),
-        )
+        meta_writer = self.pool.get_writer(self.meta_db_path)
+
+        # the next step is resolved inside the writer so concurrent callers
+        # logging the same key never get the same step
+        def write_next_steps(conn: sqlite3.Connection) -> None:
+            rows = []
+            for key, value in metrics.items():
+                result = conn.execute(
+                    "SELECT MAX(step) FROM dynamic_metrics WHERE key = ?", (key,)
+                ).fetchone()
+                rows.append(
+                    (key, float(value), 0 if result[0] is None else result[0] + 1)
+                )
+            _write_metric_rows(
+                conn, meta_writer, self._summary_errors, experiment_id, rows
+            )
 
-        conn.commit()
+        self._write(self._get_experiment_db_path(experiment_id), write_next_steps)
 
-    def log_attachment(
-        self, experiment_id: str, name: str, data: bytes | str, binary: bool = False
+    def log_dynamic_series(
+        self,
+        experiment_id: str,
+        key: str,
+        values: Sequence[int | float] | Any,  # noqa: ANN401
+        steps: Sequence[int] | Any | None = None,  # noqa: ANN401
     ) -> None:
         self._ensure_experiment_initialized(experiment_id)
+        # NumPy arrays are converted in C rather than element by element
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        if steps is not None:
+            steps = steps.tolist() if hasattr(steps, "tolist") else list(steps)
+            if len(steps) != len(values):
+                raise ValueError("steps and values must have the same length")
+        if not values:
+            return
 
-        attachments_dir = self._get_attachments_dir(experiment_id)
+        meta_writer = self.pool.get_writer(self.meta_db_path)
+
+        def write_series(conn: sqlite3.Connection) -> Sequence[int]:
+            series_steps = steps
+            if series_steps is None:
+                result = conn.execute(
+                    "SELECT MAX(step) FROM dynamic_metrics WHERE key = ?", (key,)
+                ).fetchone()
+                start = 0 if result[0] is None else result[0] + 1
+                series_steps = range(start, start + len(values))
+            _write_metric_rows(
+                conn,
+                meta_writer,
+                self._summary_errors,
+                experiment_id,
+                [
+                    (key, float(value), step)
+                    for value, step in zip(values, series_steps, strict=True)
+                ],
+            )
+            return series_steps
+
+        # pending buffered rows must land first so they cannot overwrite the series
+        if self._buffer is not None:
+            self._buffer.flush(experiment_id)
+        series_steps = self._write(
+            self._get_experiment_db_path(experiment_id), write_series
+        )
+        if self._buffer is not None:
+            self._advance_step(experiment_id, key, max(series_steps))
 
+    def log_attachment(
+        self, experiment_id: str, name: str, data: bytes | str, binary: bool = False
+    ) -> None:
         if not isinstance(data, bytes | str):
             raise ValueError("Attachment data must be bytes or str")
 
-        file_path = attachments_dir / name
+        payload = data if isinstance(data, bytes) else data.encode()
+        self.log_attachment_file(experiment_id, name, io.BytesIO(payload))
 
-        with file_path.open("wb+" if binary else "w+") as f:
-            f.write(data)
+    def log_attachment_file(
+        self,
+        experiment_id: str,
+        name: str,
+        source: str | os.PathLike[str] | IO[Any],  # noqa: ANN401
+    ) -> None:
+        self._ensure_experiment_initialized(experiment_id)
 
-        conn = self._get_experiment_connection(experiment_id)
-        cursor = conn.cursor()
+        if isinstance(source, str | os.PathLike):
+            with open(source, "rb") as f:
+                digest, size = self.blobs.put(f)
+        else:
+            digest, size = self.blobs.put(source)
 
-        cursor.execute(
+        previous = (
+            self._get_experiment_connection(experiment_id)
+            .execute("SELECT sha256 FROM attachments WHERE id = ?", (name,))
+            .fetchone()
+        )
+        self.blobs.link(digest, self._get_attachments_dir(experiment_id) / name)
+        self._execute(
+            self._get_experiment_db_path(experiment_id),
             """
-            INSERT OR REPLACE INTO attachments (name, file_path)
-            VALUES (?, ?)
+            INSERT OR REPLACE INTO attachments (id, name, file_path, sha256, size)
+            VALUES (?, ?, ?, ?, ?)
         """,
-            (
-                name,
-                str(file_path.relative_to(self._get_attachments_dir(experiment_id))),
-            ),
+            (name, name, name, digest, size),
         )
+        if previous and previous[0] and previous[0] != digest:
+            self.blobs.release([previous[0]])
 
-        conn.commit()
+    @staticmethod
+    def _encode_span(
+        trace_id: str,
+        span_id: str,
+        name: str,
+        start_time_unix_nano: int,
+        end_time_unix_nano: int,
+        parent_span_id: str | None = None,
+        kind: int = 0,
+        status_code: int = 0,
+        status_message: str | None = None,
+        attributes: dict[str, Any] | None = None,  # noqa: ANN401
+        events: list[dict[str, Any]] | None = None,  # noqa: ANN401
+        links: list[dict[str, Any]] | None = None,  # noqa: ANN401
+        trace_flags: int = 0,
+        compress: bool = False,
+    ) -> tuple:
+        return (
+            trace_id,
+            span_id,
+            parent_span_id,
+            name,
+            kind,
+            start_time_unix_nano,
+            end_time_unix_nano,
+            status_code,
+            status_message,
+            encode_json(attributes, compress),
+            encode_json(events, compress),
+            encode_json(links, compress),
+            trace_flags,
+            guess_span_type(attributes).value if attributes else 0,
+        )
 
     def log_span(
         self,
@@ -381,46 +1188,405 @@ class SQLiteBackend(Backend):
         events: list[dict[str, Any]] | None = None,  # noqa: ANN401
         links: list[dict[str, Any]] | None = None,  # noqa: ANN401
         trace_flags: int = 0,
+    ) -> None:
+        self.log_spans(
+            experiment_id,
+            [
+                {
+                    "trace_id": trace_id,
+                    "span_id": span_id,
+                    "name": name,
+                    "start_time_unix_nano": start_time_unix_nano,
+                    "end_time_unix_nano": end_time_unix_nano,
+                    "parent_span_id": parent_span_id,
+                    "kind": kind,
+                    "status_code": status_code,
+                    "status_message": status_message,
+                    "attributes": attributes,
+                    "events": events,
+                    "links": links,
+                    "trace_flags": trace_flags,
+                }
+            ],
+        )
+
+    def log_spans(
+        self,
+        experiment_id: str,
+        spans: Iterable[dict[str, Any]],  # noqa: ANN401
     ) -> None:
         db_path = self._get_experiment_db_path(experiment_id)
         if not db_path.exists():
             raise ValueError(f"Experiment {experiment_id} not initialized")
 
-        conn = self._get_experiment_connection(experiment_id)
-        cursor = conn.cursor()
+        spans = list(spans)
+        rows = [
+            self._encode_span(**span, compress=self.span_compression) for span in spans
+        ]
+
+        def write(conn: sqlite3.Connection) -> None:
+            stored = self._find_stored_spans(conn, rows)
+            searchable = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'span_search'"
+            ).fetchone()
+            if searchable and stored:
+                # REPLACE does not fire delete triggers
+                self._delete_from_span_search(conn, [rowid for rowid, _ in stored])
+            rowids = _next_rowids(conn, "spans", len(rows))
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO spans (
+                    rowid, trace_id, span_id, parent_span_id, name, kind,
+                    start_time_unix_nano, end_time_unix_nano,
+                    status_code, status_message,
+                    attributes, events, links, trace_flags, dfs_span_type
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [(rowid, *row) for rowid, row in zip(rowids, rows, strict=True)],
+            )
+            if searchable:
+                self._index_spans(
+                    conn, [rowid for rowid, _ in self._find_stored_spans(conn, rows)]
+                )
+
+            # re-logged spans would be counted twice by the incremental update,
+            # so their traces are summarised again from the stored spans
+            replaced = {trace_id for _, trace_id in stored}
+            self._update_trace_summaries(
+                conn,
+                [
+                    (span, row)
+                    for span, row in zip(spans, rows, strict=True)
+                    if row[0] not in replaced
+                ],
+            )
+            if replaced:
+                self._rebuild_trace_summaries(conn, replaced)
+
+        self._write(db_path, write)
+        self._maybe_apply_retention(experiment_id)
+
+    @staticmethod
+    def _find_stored_spans(
+        conn: sqlite3.Connection, rows: Sequence[tuple]
+    ) -> list[tuple[int, str]]:
+        """Returns ``(rowid, trace_id)`` of the spans in ``rows`` already stored."""
+        stored: list[tuple[int, str]] = []
+        for i in range(0, len(rows), _SQL_CHUNK_SIZE):
+            chunk = rows[i : i + _SQL_CHUNK_SIZE]
+            values = ", ".join("(?, ?)" for _ in chunk)
+            stored.extend(
+                conn.execute(
+                    f"""
+                    SELECT s.rowid, s.trace_id FROM (VALUES {values}) AS v
+                    JOIN spans AS s
+                        ON s.trace_id = v.column1 AND s.span_id = v.column2
+                    """,
+                    [value for row in chunk for value in row[:2]],
+                )
+            )
+        return stored
+
+    @staticmethod
+    def _index_spans(
+        conn: sqlite3.Connection, rowids: Sequence[int] | None = None
+    ) -> None:
+        content = _span_search_content_sql("spans")
+        if rowids is None:
+            conn.execute(
+                f"""
+                INSERT INTO span_search (rowid, name, content)
+                SELECT rowid, name, {content} FROM spans
+                """
+            )
+            return
+        for i in range(0, len(rowids), _SQL_CHUNK_SIZE):
+            chunk = rowids[i : i + _SQL_CHUNK_SIZE]
+            conn.execute(
+                f"""
+                INSERT INTO span_search (rowid, name, content)
+                SELECT rowid, name, {content} FROM spans
+                WHERE rowid IN ({", ".join("?" * len(chunk))})
+                """,
+                chunk,
+            )
 
-        attributes_json = json.dumps(attributes) if attributes else None
-        events_json = json.dumps(events) if events else None
-        links_json = json.dumps(links) if links else None
+    @staticmethod
+    def _delete_from_span_search(
+        conn: sqlite3.Connection, rowids: Sequence[int]
+    ) -> None:
+        for i in range(0, len(rowids), _SQL_CHUNK_SIZE):
+            chunk = rowids[i : i + _SQL_CHUNK_SIZE]
+            conn.execute(
+                f"DELETE FROM span_search WHERE rowid IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
 
-        cursor.execute(
+    def apply_retention(self, experiment_id: str) -> int:
+        """Prunes traces outside the retention policy and returns their number.
+
+        Pages freed by the deletes are returned to the filesystem with an
+        incremental vacuum in databases created with ``auto_vacuum`` enabled.
+        """
+        self._ensure_experiment_initialized(experiment_id)
+        db_path = self._get_experiment_db_path(experiment_id)
+        policy = self.retention
+
+        def prune(conn: sqlite3.Connection) -> int:
+            pruned = 0
+            if policy.max_age is not None:
+                cutoff = time.time_ns() - int(policy.max_age * 1e9)
+                pruned += self._delete_traces(
+                    conn,
+                    "SELECT trace_id FROM trace_summaries WHERE end_time_unix_nano < ?",
+                    [cutoff],
+                )
+            if policy.success_sample_rate < 1.0:
+                # only completed traces, a later span could still report an error
+                pruned += self._delete_traces(
+                    conn,
+                    """
+                    SELECT trace_id FROM trace_summaries
+                    WHERE error_count = 0 AND root_span_id IS NOT NULL
+                        AND NOT luml_sample(trace_id, ?)
+                    """,
+                    [policy.success_sample_rate],
+                )
+            if policy.max_spans is not None:
+                pruned += self._delete_traces(
+                    conn,
+                    """
+                    SELECT trace_id FROM (
+                        SELECT trace_id, SUM(span_count) OVER (
+                            ORDER BY start_time_unix_nano DESC, trace_id DESC
+                        ) AS kept
+                        FROM trace_summaries
+                    )
+                    WHERE kept > ?
+                    """,
+                    [policy.max_spans],
+                )
+            return pruned
+
+        pruned = self._write(db_path, prune)
+        if pruned:
+            self._write(
+                db_path,
+                lambda conn: conn.execute("PRAGMA incremental_vacuum").fetchall(),
+                transactional=False,
+            )
+        return pruned
+
+    def _maybe_apply_retention(self, experiment_id: str) -> None:
+        if not self.retention.enabled:
+            return
+        with self._retention_lock:
+            now = time.monotonic()
+            last_run = self._retention_runs.get(experiment_id)
+            if last_run is not None and now - last_run < self.retention.interval:
+                return
+            self._retention_runs[experiment_id] = now
+        self.apply_retention(experiment_id)
+
+    @staticmethod
+    def _delete_traces(
+        conn: sqlite3.Connection,
+        select_sql: str,
+        params: Sequence[Any],  # noqa: ANN401
+    ) -> int:
+        trace_ids = [row[0] for row in conn.execute(select_sql, params)]
+        searchable = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'span_search'"
+        ).fetchone()
+        for i in range(0, len(trace_ids), _SQL_CHUNK_SIZE):
+            chunk = trace_ids[i : i + _SQL_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            if searchable:
+                conn.execute(
+                    f"""
+                    DELETE FROM span_search WHERE rowid IN (
+                        SELECT rowid FROM spans WHERE trace_id IN ({placeholders})
+                    )
+                    """,
+                    chunk,
+                )
+            for table in ("spans", "trace_summaries", "trace_token_usage"):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE trace_id IN ({placeholders})", chunk
+                )
+        return len(trace_ids)
+
+    @staticmethod
+    def _update_trace_summaries(
+        conn: sqlite3.Connection,
+        spans: Iterable[tuple[dict[str, Any], tuple]],  # noqa: ANN401
+    ) -> None:
+        summaries: dict[str, list[Any]] = {}
+        usage: dict[tuple[str, str], list[int]] = {}
+        for span, row in spans:
+            trace_id = row[0]
+            summary = summaries.get(trace_id)
+            if summary is None:
+                summary = summaries[trace_id] = [
+                    trace_id,
+                    None,
+                    None,
+                    None,
+                    None,
+                    row[5],
+                    row[6],
+                    0,
+                    0,
+                    0,
+                    0,
+                ]
+            if row[2] is None:
+                summary[1:5] = [row[1], row[3], row[13], row[7]]
+            summary[5] = min(summary[5], row[5])
+            summary[6] = max(summary[6], row[6])
+            summary[7] += 1
+            summary[8] += row[7] == _SPAN_STATUS_ERROR
+
+            attributes = span.get("attributes") or {}
+            prompt = SQLiteBackend._first_attribute(
+                attributes, _PROMPT_TOKENS_ATTRIBUTES
+            )
+            completion = SQLiteBackend._first_attribute(
+                attributes, _COMPLETION_TOKENS_ATTRIBUTES
+            )
+            if prompt is None and completion is None:
+                continue
+            model = SQLiteBackend._first_attribute(attributes, _MODEL_ATTRIBUTES)
+            tokens = usage.setdefault((trace_id, model or ""), [0, 0])
+            tokens[0] += prompt or 0
+            tokens[1] += completion or 0
+            summary[9] += prompt or 0
+            summary[10] += completion or 0
+
+        conn.executemany(
             """
-            INSERT OR REPLACE INTO spans (
-                trace_id, span_id, parent_span_id, name, kind,
+            INSERT INTO trace_summaries (
+                trace_id, root_span_id, name, dfs_span_type, status_code,
                 start_time_unix_nano, end_time_unix_nano,
-                status_code, status_message,
-                attributes, events, links, trace_flags, dfs_span_type
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                span_count, error_count, prompt_tokens, completion_tokens
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (trace_id) DO UPDATE SET
+                root_span_id = COALESCE(excluded.root_span_id, root_span_id),
+                name = CASE WHEN excluded.root_span_id IS NULL
+                    THEN name ELSE excluded.name END,
+                dfs_span_type = CASE WHEN excluded.root_span_id IS NULL
+                    THEN dfs_span_type ELSE excluded.dfs_span_type END,
+                status_code = CASE WHEN excluded.root_span_id IS NULL
+                    THEN status_code ELSE excluded.status_code END,
+                start_time_unix_nano = MIN(
+                    start_time_unix_nano, excluded.start_time_unix_nano
+                ),
+                end_time_unix_nano = MAX(
+                    end_time_unix_nano, excluded.end_time_unix_nano
+                ),
+                span_count = span_count + excluded.span_count,
+                error_count = error_count + excluded.error_count,
+                prompt_tokens = prompt_tokens + excluded.prompt_tokens,
+                completion_tokens = completion_tokens + excluded.completion_tokens
             """,
-            (
-                trace_id,
-                span_id,
-                parent_span_id,
-                name,
-                kind,
-                start_time_unix_nano,
-                end_time_unix_nano,
-                status_code,
-                status_message,
-                attributes_json,
-                events_json,
-                links_json,
-                trace_flags,
-                guess_span_type(attributes).value if attributes else 0,
-            ),
+            summaries.values(),
+        )
+        conn.executemany(
+            """
+            INSERT INTO trace_token_usage (
+                trace_id, model, prompt_tokens, completion_tokens
+            ) VALUES (?, ?, ?, ?)
+            ON CONFLICT (trace_id, model) DO UPDATE SET
+                prompt_tokens = prompt_tokens + excluded.prompt_tokens,
+                completion_tokens = completion_tokens + excluded.completion_tokens
+            """,
+            [(*key, *tokens) for key, tokens in usage.items()],
+        )
+
+    @staticmethod
+    def _rebuild_trace_summaries(
+        conn: sqlite3.Connection, trace_ids: Iterable[str] | None = None
+    ) -> None:
+        params: list[str] = []
+        trace_filter = ""
+        if trace_ids is not None:
+            params = list(trace_ids)
+            trace_filter = f"WHERE trace_id IN ({', '.join('?' * len(params))})"
+        conn.execute(f"DELETE FROM trace_summaries {trace_filter}", params)
+        conn.execute(f"DELETE FROM trace_token_usage {trace_filter}", params)
+
+        prompt = _attribute_sql(_PROMPT_TOKENS_ATTRIBUTES)
+        completion = _attribute_sql(_COMPLETION_TOKENS_ATTRIBUTES)
+        conn.execute(
+            f"""
+            INSERT INTO trace_token_usage (
+                trace_id, model, prompt_tokens, completion_tokens
+            )
+            SELECT trace_id, COALESCE({_attribute_sql(_MODEL_ATTRIBUTES)}, ''),
+                TOTAL({prompt}), TOTAL({completion})
+            FROM spans {trace_filter or "WHERE 1"}
+                AND ({prompt} IS NOT NULL OR {completion} IS NOT NULL)
+            GROUP BY 1, 2
+            """,
+            params,
+        )
+        conn.execute(
+            f"""
+            INSERT INTO trace_summaries (
+                trace_id, root_span_id, name, dfs_span_type, status_code,
+                start_time_unix_nano, end_time_unix_nano,
+                span_count, error_count, prompt_tokens, completion_tokens
+            )
+            WITH traces AS (
+                SELECT trace_id,
+                    MAX(CASE WHEN parent_span_id IS NULL THEN span_id END) AS root,
+                    MIN(start_time_unix_nano) AS start_time_unix_nano,
+                    MAX(end_time_unix_nano) AS end_time_unix_nano,
+                    COUNT(*) AS span_count,
+                    COUNT(*) FILTER (WHERE status_code = ?) AS error_count
+                FROM spans {trace_filter}
+                GROUP BY trace_id
+            )
+            SELECT t.trace_id, t.root, r.name, r.dfs_span_type, r.status_code,
+                t.start_time_unix_nano, t.end_time_unix_nano,
+                t.span_count, t.error_count,
+                COALESCE(SUM(u.prompt_tokens), 0),
+                COALESCE(SUM(u.completion_tokens), 0)
+            FROM traces AS t
+            LEFT JOIN spans AS r ON r.trace_id = t.trace_id AND r.span_id = t.root
+            LEFT JOIN trace_token_usage AS u ON u.trace_id = t.trace_id
+            GROUP BY t.trace_id
+            """,
+            [_SPAN_STATUS_ERROR, *params],
         )
 
-        conn.commit()
+    @staticmethod
+    def _first_attribute(attributes: dict[str, Any], names: Sequence[str]) -> Any:  # noqa: ANN401
+        for name in names:
+            value = attributes.get(name)
+            if value is not None:
+                return value
+        return None
+
+    @staticmethod
+    def _encode_eval_sample(
+        eval_id: str,
+        dataset_id: str,
+        inputs: dict[str, Any],  # noqa: ANN401
+        outputs: dict[str, Any] | None = None,  # noqa: ANN401
+        references: dict[str, Any] | None = None,  # noqa: ANN401
+        scores: dict[str, Any] | None = None,  # noqa: ANN401
+        metadata: dict[str, Any] | None = None,  # noqa: ANN401
+    ) -> tuple[str, str, str, str | None, str | None, str | None, str | None]:
+        return (
+            eval_id,
+            dataset_id,
+            json.dumps(inputs),
+            json.dumps(outputs) if outputs else None,
+            json.dumps(references) if references else None,
+            json.dumps(scores) if scores else None,
+            json.dumps(metadata) if metadata else None,
+        )
 
     def log_eval_sample(
         self,
@@ -432,38 +1598,46 @@ class SQLiteBackend(Backend):
         references: dict[str, Any] | None = None,  # noqa: ANN401
         scores: dict[str, Any] | None = None,  # noqa: ANN401
         metadata: dict[str, Any] | None = None,  # noqa: ANN401
+    ) -> None:
+        self.log_eval_samples(
+            experiment_id,
+            [
+                {
+                    "eval_id": eval_id,
+                    "dataset_id": dataset_id,
+                    "inputs": inputs,
+                    "outputs": outputs,
+                    "references": references,
+                    "scores": scores,
+                    "metadata": metadata,
+                }
+            ],
+        )
+
+    def log_eval_samples(
+        self,
+        experiment_id: str,
+        samples: Iterable[dict[str, Any]],  # noqa: ANN401
     ) -> None:
         db_path = self._get_experiment_db_path(experiment_id)
         if not db_path.exists():
             raise ValueError(f"Experiment {experiment_id} not initialized")
 
-        conn = self._get_experiment_connection(experiment_id)
-        cursor = conn.cursor()
-
-        inputs_json = json.dumps(inputs)
-        outputs_json = json.dumps(outputs) if outputs else None
-        references_json = json.dumps(references) if references else None
-        scores_json = json.dumps(scores) if scores else None
-        metadata_json = json.dumps(metadata) if metadata else None
-
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO evals (
-                id, dataset_id, inputs, outputs, refs, scores, metadata, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """,
-            (
-                eval_id,
-                dataset_id,
-                inputs_json,
-                outputs_json,
-                references_json,
-                scores_json,
-                metadata_json,
-            ),
-        )
+        rows = [self._encode_eval_sample(**sample) for sample in samples]
+
+        def write(conn: sqlite3.Connection) -> None:
+            rowids = _next_rowids(conn, "evals", len(rows))
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO evals (
+                    rowid, id, dataset_id, inputs, outputs, refs, scores, metadata,
+                    updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                [(rowid, *row) for rowid, row in zip(rowids, rows, strict=True)],
+            )
 
-        conn.commit()
+        self._write(db_path, write)
 
     def link_eval_sample_to_trace(
         self,
@@ -476,38 +1650,41 @@ class SQLiteBackend(Backend):
         if not db_path.exists():
             raise ValueError(f"Experiment {experiment_id} not initialized")
 
-        conn = self._get_experiment_connection(experiment_id)
-        cursor = conn.cursor()
+        def link(conn: sqlite3.Connection) -> None:
+            cursor = conn.cursor()
 
-        cursor.execute(
-            "SELECT 1 FROM evals WHERE dataset_id = ? AND id = ?",
-            (eval_dataset_id, eval_id),
-        )
-        if not cursor.fetchone():
-            raise ValueError(f"Eval {eval_id} in dataset {eval_dataset_id} not found")
+            cursor.execute(
+                "SELECT 1 FROM evals WHERE dataset_id = ? AND id = ?",
+                (eval_dataset_id, eval_id),
+            )
+            if not cursor.fetchone():
+                raise ValueError(
+                    f"Eval {eval_id} in dataset {eval_dataset_id} not found"
+                )
 
-        cursor.execute("SELECT 1 FROM spans WHERE trace_id = ?", (trace_id,))
-        if not cursor.fetchone():
-            raise ValueError(f"Trace {trace_id} not found")
+            cursor.execute("SELECT 1 FROM spans WHERE trace_id = ?", (trace_id,))
+            if not cursor.fetchone():
+                raise ValueError(f"Trace {trace_id} not found")
 
-        bridge_id = str(uuid.uuid4())
+            bridge_id = str(uuid.uuid4())
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO eval_traces_bridge (
-                id, eval_dataset_id, eval_id, trace_id
-            ) VALUES (?, ?, ?, ?)
-            """,
-            (bridge_id, eval_dataset_id, eval_id, trace_id),
-        )
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO eval_traces_bridge (
+                    id, eval_dataset_id, eval_id, trace_id
+                ) VALUES (?, ?, ?, ?)
+                """,
+                (bridge_id, eval_dataset_id, eval_id, trace_id),
+            )
 
-        conn.commit()
+        self._write(db_path, link)
 
     def get_experiment_data(self, experiment_id: str) -> dict[str, Any]:  # noqa: ANN401, C901
         db_path = self._get_experiment_db_path(experiment_id)
         if not db_path.exists():
             raise ValueError(f"Experiment {experiment_id} not found")
 
+        self.flush(experiment_id)
         conn = self._get_experiment_connection(experiment_id)
         cursor = conn.cursor()
 
@@ -534,12 +1711,16 @@ class SQLiteBackend(Backend):
                 dynamic_metrics[key] = []
             dynamic_metrics[key].append({"value": value, "step": step})
 
-        cursor.execute("SELECT name, file_path, created_at FROM attachments")
+        cursor.execute(
+            "SELECT name, file_path, created_at, sha256, size FROM attachments"
+        )
         attachments = {}
-        for name, file_path, created_at in cursor.fetchall():
+        for name, file_path, created_at, sha256, size in cursor.fetchall():
             attachments[name] = {
                 "file_path": file_path,
                 "created_at": created_at,
+                "sha256": sha256,
+                "size": size,
             }
 
         meta_conn = self._get_meta_connection()
@@ -568,65 +1749,770 @@ class SQLiteBackend(Backend):
             "attachments": attachments,
         }
 
-    def get_attachment(self, experiment_id: str, name: str) -> Any:  # noqa: ANN401
+    def get_metric_arrays(
+        self,
+        experiment_id: str,
+        keys: Sequence[str] | None = None,
+        step_range: tuple[int, int] | None = None,
+        max_points: int | None = None,
+    ) -> dict[str, dict[str, Any]]:  # noqa: ANN401
+        try:
+            import numpy as np  # type: ignore[import-not-found]
+        except ImportError as e:
+            msg = "numpy is required for metric arrays. Install with: pip install numpy"
+            raise ImportError(msg) from e
+
+        if max_points is not None and max_points < 2:
+            raise ValueError("max_points must be at least 2")
         self._ensure_experiment_initialized(experiment_id)
+        self.flush(experiment_id)
 
-        attachments_dir = self._get_attachments_dir(experiment_id)
-        file_path = attachments_dir / name
+        conn = self._get_experiment_connection(experiment_id)
+        if keys is None:
+            keys = [
+                row[0]
+                for row in conn.execute("SELECT DISTINCT key FROM dynamic_metrics")
+            ]
+        lo, hi = step_range if step_range is not None else (-(2**63), 2**63 - 1)
+
+        result = {}
+        for key in keys:
+            count, first_step, last_step = conn.execute(
+                """
+                SELECT COUNT(*), MIN(step), MAX(step) FROM dynamic_metrics
+                WHERE key = ? AND step >= ? AND step < ?
+                """,
+                (key, lo, hi),
+            ).fetchone()
+
+            if max_points is None or count <= max_points:
+                cursor = conn.execute(
+                    """
+                    SELECT step, value FROM dynamic_metrics
+                    WHERE key = ? AND step >= ? AND step < ?
+                    ORDER BY step
+                    """,
+                    (key, lo, hi),
+                )
+            else:
+                # min/max per bucket keeps spikes visible in the downsampled line;
+                # SQLite returns the step of the row that produced MIN/MAX
+                cursor = conn.execute(
+                    """
+                    WITH buckets AS (
+                        SELECT step, value,
+                            (step - :first) * :buckets / (:last - :first + 1) AS bucket
+                        FROM dynamic_metrics
+                        WHERE key = :key AND step >= :lo AND step < :hi
+                    )
+                    SELECT step, value FROM (
+                        SELECT step, MIN(value) AS value FROM buckets GROUP BY bucket
+                    )
+                    UNION
+                    SELECT step, value FROM (
+                        SELECT step, MAX(value) AS value FROM buckets GROUP BY bucket
+                    )
+                    ORDER BY step
+                    """,
+                    {
+                        "key": key,
+                        "lo": lo,
+                        "hi": hi,
+                        "first": first_step,
+                        "last": last_step,
+                        "buckets": max_points // 2,
+                    },
+                )
+
+            points = np.fromiter(
+                cursor, dtype=[("step", np.int64), ("value", np.float64)]
+            )
+            result[key] = {
+                "steps": np.ascontiguousarray(points["step"]),
+                "values": np.ascontiguousarray(points["value"]),
+            }
+        return result
+
+    def get_metrics_since(
+        self, experiment_id: str, since: dict[str, int] | None = None
+    ) -> dict[str, Any]:  # noqa: ANN401
+        self._ensure_experiment_initialized(experiment_id)
+        self.flush(experiment_id)
+        since = since or {}
+
+        conn = self._get_experiment_connection(experiment_id)
+        # walks the (key, step) primary key one key at a time instead of
+        # scanning every row to find the distinct keys
+        keys = [
+            row[0]
+            for row in conn.execute(
+                """
+                WITH RECURSIVE keys(key) AS (
+                    SELECT MIN(key) FROM dynamic_metrics
+                    UNION ALL
+                    SELECT (SELECT MIN(key) FROM dynamic_metrics WHERE key > keys.key)
+                    FROM keys WHERE keys.key IS NOT NULL
+                )
+                SELECT key FROM keys WHERE key IS NOT NULL
+                """
+            )
+        ]
+
+        metrics: dict[str, list[dict[str, Any]]] = {}
+        watermark = dict(since)
+        for key in keys:
+            rows = conn.execute(
+                """
+                SELECT value, step FROM dynamic_metrics
+                WHERE key = ? AND step > ? ORDER BY step
+                """,
+                (key, since.get(key, -(2**63))),
+            ).fetchall()
+            if rows:
+                metrics[key] = [{"value": value, "step": step} for value, step in rows]
+                watermark[key] = rows[-1][1]
+        return {"items": metrics, "cursor": watermark}
+
+    def get_spans_since(
+        self, experiment_id: str, since: int | None = None, limit: int = 1000
+    ) -> dict[str, Any]:  # noqa: ANN401
+        self._ensure_experiment_initialized(experiment_id)
+
+        # spans are stored when they end, so parents arrive after their children
+        # and start time is not monotonic in ingest order; rowid is, since a
+        # rowid is never handed out twice (see _next_rowids)
+        conn = self._get_experiment_connection(experiment_id)
+        rows = conn.execute(
+            f"""
+            SELECT rowid, {_SPAN_COLUMNS} FROM spans
+            WHERE rowid > ? ORDER BY rowid LIMIT ?
+            """,
+            (since or 0, limit),
+        ).fetchall()
+        return {
+            "items": [self._decode_span(row[1:]) for row in rows],
+            "cursor": rows[-1][0] if rows else since,
+        }
+
+    def get_evals_since(
+        self,
+        experiment_id: str,
+        since: int | None = None,
+        dataset_id: str | None = None,
+        limit: int = 1000,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        self._ensure_experiment_initialized(experiment_id)
+
+        dataset_filter = "AND dataset_id = ?" if dataset_id is not None else ""
+        params = [since or 0, *([dataset_id] if dataset_id is not None else [])]
+        conn = self._get_experiment_connection(experiment_id)
+        rows = conn.execute(
+            f"""
+            SELECT rowid, id, dataset_id, inputs, outputs, refs, scores, metadata,
+                created_at, updated_at
+            FROM evals
+            WHERE rowid > ? {dataset_filter} ORDER BY rowid LIMIT ?
+            """,
+            [*params, limit],
+        ).fetchall()
+        return {
+            "items": [self._decode_eval_sample(row[1:]) for row in rows],
+            "cursor": rows[-1][0] if rows else since,
+        }
+
+    def materialize_eval_scores(self, experiment_id: str, keys: Sequence[str]) -> None:
+        self._ensure_experiment_initialized(experiment_id)
+
+        def materialize(conn: sqlite3.Connection) -> None:
+            existing = dict(
+                conn.execute("SELECT key, column_name FROM eval_score_columns")
+            )
+            for key in keys:
+                if key in existing:
+                    continue
+                if '"' in key:
+                    raise ValueError(f"Score key {key!r} cannot be materialized")
+                column = "score_" + re.sub(r"\W+", "_", key)
+                while column in existing.values():
+                    column += "_"
+                json_path = f'$."{key}"'.replace("'", "''")
+                # virtual generated columns cost nothing on insert; the index
+                # stores the extracted values so aggregates never parse JSON
+                conn.execute(
+                    f"""
+                    ALTER TABLE evals ADD COLUMN {column} REAL
+                    GENERATED ALWAYS AS (json_extract(scores, '{json_path}')) VIRTUAL
+                    """
+                )
+                conn.execute(
+                    f"CREATE INDEX idx_evals_{column} ON evals (dataset_id, {column})"
+                )
+                conn.execute(
+                    "INSERT INTO eval_score_columns (key, column_name) VALUES (?, ?)",
+                    (key, column),
+                )
+                existing[key] = column
+
+        self._write(self._get_experiment_db_path(experiment_id), materialize)
+
+    def aggregate_evals(
+        self,
+        experiment_id: str,
+        dataset_id: str | None = None,
+        score_keys: Sequence[str] | None = None,
+        percentiles: Sequence[float] = (50, 90, 99),
+    ) -> dict[str, dict[str, dict[str, float]]]:
+        self._ensure_experiment_initialized(experiment_id)
+        if any(not 0 < p <= 100 for p in percentiles):
+            raise ValueError("percentiles must be in (0, 100]")
+
+        conn = self._get_experiment_connection(experiment_id)
+        materialized = dict(
+            conn.execute("SELECT key, column_name FROM eval_score_columns")
+        )
+        result: dict[str, dict[str, dict[str, float]]] = {}
+        for key, column in materialized.items():
+            if score_keys is None or key in score_keys:
+                self._aggregate_materialized_evals(
+                    conn, key, column, dataset_id, percentiles, result
+                )
+
+        json_keys = [k for k in score_keys or [] if k not in materialized]
+        if score_keys is None or json_keys:
+            self._aggregate_json_evals(
+                conn,
+                None if score_keys is None else json_keys,
+                dataset_id,
+                percentiles,
+                result,
+            )
+        return {
+            dataset: dict(sorted(stats.items()))
+            for dataset, stats in sorted(result.items())
+        }
+
+    @staticmethod
+    def _aggregate_materialized_evals(
+        conn: sqlite3.Connection,
+        key: str,
+        column: str,
+        dataset_id: str | None,
+        percentiles: Sequence[float],
+        result: dict[str, dict[str, dict[str, float]]],
+    ) -> None:
+        # both queries are answered from idx_evals_<column>: the aggregates by a
+        # covering scan and each percentile by seeking to its rank in the index
+        numeric = f"{column} IS NOT NULL AND typeof({column}) IN ('integer', 'real')"
+        dataset_filter = "" if dataset_id is None else "AND dataset_id = ?"
+        rows = conn.execute(
+            f"""
+            SELECT dataset_id, COUNT(*), AVG({column}), MIN({column}), MAX({column})
+            FROM evals WHERE {numeric} {dataset_filter}
+            GROUP BY dataset_id
+            """,
+            [] if dataset_id is None else [dataset_id],
+        ).fetchall()
+        for dataset, count, mean, minimum, maximum in rows:
+            stats = {"count": count, "mean": mean, "min": minimum, "max": maximum}
+            for p in percentiles:
+                stats[f"p{p:g}"] = conn.execute(
+                    f"""
+                    SELECT {column} FROM evals
+                    WHERE dataset_id = ? AND {numeric}
+                    ORDER BY {column} LIMIT 1 OFFSET ?
+                    """,
+                    (dataset, max(1, math.ceil(p / 100 * count)) - 1),
+                ).fetchone()[0]
+            result.setdefault(dataset, {})[key] = stats
+
+    @staticmethod
+    def _aggregate_json_evals(
+        conn: sqlite3.Connection,
+        keys: Sequence[str] | None,
+        dataset_id: str | None,
+        percentiles: Sequence[float],
+        result: dict[str, dict[str, dict[str, float]]],
+    ) -> None:
+        params: list[Any] = []
+        key_filter = "s.key NOT IN (SELECT key FROM eval_score_columns)"
+        if keys is not None:
+            key_filter = f"s.key IN ({', '.join('?' * len(keys))})"
+            params.extend(keys)
+        dataset_filter = ""
+        if dataset_id is not None:
+            dataset_filter = "AND dataset_id = ?"
+            params.append(dataset_id)
+
+        # nearest-rank percentiles: the value at rank ceil(p * n), spelled as
+        # n - floor(n - p * n) since the math functions are an optional build
+        percentile_columns = [
+            "MAX(CASE WHEN rn = MAX(1, n - CAST(n - ? * n AS INTEGER)) THEN value END)"
+            for _ in percentiles
+        ]
+        rows = conn.execute(
+            f"""
+            WITH vals(dataset_id, key, value) AS (
+                SELECT dataset_id, s.key,
+                    CASE s.type WHEN 'true' THEN 1 WHEN 'false' THEN 0 ELSE s.value END
+                FROM evals, json_each(evals.scores) AS s
+                WHERE s.type IN ('integer', 'real', 'true', 'false')
+                    AND {key_filter} {dataset_filter}
+            ),
+            ranked AS (
+                SELECT dataset_id, key, value,
+                    ROW_NUMBER() OVER (PARTITION BY dataset_id, key ORDER BY value) AS rn,
+                    COUNT(*) OVER (PARTITION BY dataset_id, key) AS n
+                FROM vals
+            )
+            SELECT dataset_id, key, COUNT(*), AVG(value), MIN(value), MAX(value),
+                {", ".join(percentile_columns)}
+            FROM ranked
+            GROUP BY dataset_id, key
+            """,
+            [*params, *(p / 100 for p in percentiles)],
+        ).fetchall()
+        for row in rows:
+            stats = {"count": row[2], "mean": row[3], "min": row[4], "max": row[5]}
+            for p, value in zip(percentiles, row[6:], strict=True):
+                stats[f"p{p:g}"] = value
+            result.setdefault(row[0], {})[row[1]] = stats
+
+    @staticmethod
+    def _decode_eval_sample(row: Sequence[Any]) -> dict[str, Any]:  # noqa: ANN401
+        return {
+            "eval_id": row[0],
+            "dataset_id": row[1],
+            "inputs": json.loads(row[2]),
+            "outputs": json.loads(row[3]) if row[3] else None,
+            "references": json.loads(row[4]) if row[4] else None,
+            "scores": json.loads(row[5]) if row[5] else None,
+            "metadata": json.loads(row[6]) if row[6] else None,
+            "created_at": row[7],
+            "updated_at": row[8],
+        }
+
+    @staticmethod
+    def _decode_span(row: Sequence[Any]) -> dict[str, Any]:  # noqa: ANN401
+        return {
+            "trace_id": row[0],
+            "span_id": row[1],
+            "parent_span_id": row[2],
+            "name": row[3],
+            "kind": row[4],
+            "dfs_span_type": row[5],
+            "start_time_unix_nano": row[6],
+            "end_time_unix_nano": row[7],
+            "status_code": row[8],
+            "status_message": row[9],
+            "attributes": decode_json(row[10], {}),
+            "events": decode_json(row[11], []),
+            "links": decode_json(row[12], []),
+            "trace_flags": row[13],
+        }
+
+    def query_spans(
+        self,
+        experiment_id: str,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        span_type: SpanType | int | None = None,
+        status_code: int | None = None,
+        start_time_from: int | None = None,
+        start_time_to: int | None = None,
+        limit: int = 100,
+        start_after: str | None = None,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        self._ensure_experiment_initialized(experiment_id)
+
+        filters: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("trace_id", trace_id),
+            ("parent_span_id", parent_span_id),
+            (
+                "dfs_span_type",
+                SpanType(span_type).value if span_type is not None else None,
+            ),
+            ("status_code", status_code),
+        ):
+            if value is not None:
+                filters.append(f"{column} = ?")
+                params.append(value)
+        if start_time_from is not None:
+            filters.append("start_time_unix_nano >= ?")
+            params.append(start_time_from)
+        if start_time_to is not None:
+            filters.append("start_time_unix_nano < ?")
+            params.append(start_time_to)
+        if start_after is not None:
+            start_time, after_trace_id, after_span_id = start_after.split(":")
+            filters.append("(start_time_unix_nano, trace_id, span_id) > (?, ?, ?)")
+            params.extend([int(start_time), after_trace_id, after_span_id])
+
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        conn = self._get_experiment_connection(experiment_id)
+        rows = conn.execute(
+            f"""
+            SELECT {_SPAN_COLUMNS} FROM spans {where}
+            ORDER BY start_time_unix_nano, trace_id, span_id
+            LIMIT ?
+            """,
+            [*params, limit + 1],
+        ).fetchall()
+
+        items = [self._decode_span(row) for row in rows[:limit]]
+        cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            cursor = (
+                f"{last['start_time_unix_nano']}:{last['trace_id']}:{last['span_id']}"
+            )
+        return {"items": items, "cursor": cursor}
+
+    def search_spans(
+        self,
+        experiment_id: str,
+        query: str,
+        trace_id: str | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:  # noqa: ANN401
+        """Returns spans matching an FTS5 ``query``, best matches first.
+
+        Each span carries a ``snippet`` of the matched text.
+        """
+        self._ensure_experiment_initialized(experiment_id)
+
+        conn = self._get_experiment_connection(experiment_id)
+        if not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'span_search'"
+        ).fetchone():
+            raise ValueError(
+                f"Span search is not enabled for experiment {experiment_id}"
+            )
+
+        trace_filter = "" if trace_id is None else "AND s.trace_id = ?"
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT {", ".join(f"s.{c.strip()}" for c in _SPAN_COLUMNS.split(","))},
+                    snippet(span_search, -1, '[', ']', '...', 16)
+                FROM span_search
+                JOIN spans AS s ON s.rowid = span_search.rowid
+                WHERE span_search MATCH ? {trace_filter}
+                ORDER BY span_search.rank
+                LIMIT ?
+                """,
+                [query, *([] if trace_id is None else [trace_id]), limit],
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query {query!r}: {e}") from e
+
+        items = []
+        for row in rows:
+            span = self._decode_span(row[:-1])
+            span["snippet"] = row[-1]
+            items.append(span)
+        return items
+
+    def get_trace(self, experiment_id: str, trace_id: str) -> dict[str, Any]:  # noqa: ANN401
+        self._ensure_experiment_initialized(experiment_id)
+
+        conn = self._get_experiment_connection(experiment_id)
+        rows = conn.execute(
+            f"""
+            SELECT {_SPAN_COLUMNS} FROM spans WHERE trace_id = ?
+            ORDER BY start_time_unix_nano
+            """,
+            (trace_id,),
+        ).fetchall()
+        if not rows:
+            raise ValueError(f"Trace {trace_id} not found")
+
+        spans = {}
+        for row in rows:
+            span = self._decode_span(row)
+            span["children"] = []
+            spans[span["span_id"]] = span
+
+        roots = []
+        for span in spans.values():
+            parent = spans.get(span["parent_span_id"])
+            if parent is None:
+                roots.append(span)
+            else:
+                parent["children"].append(span)
+
+        return {
+            "trace_id": trace_id,
+            "start_time_unix_nano": min(s["start_time_unix_nano"] for s in roots),
+            "end_time_unix_nano": max(s["end_time_unix_nano"] for s in spans.values()),
+            "span_count": len(spans),
+            "spans": roots,
+        }
+
+    def list_traces(
+        self,
+        experiment_id: str,
+        span_type: SpanType | int | None = None,
+        status_code: int | None = None,
+        start_time_from: int | None = None,
+        start_time_to: int | None = None,
+        limit: int = 50,
+        start_after: str | None = None,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        self._ensure_experiment_initialized(experiment_id)
+
+        # traces are listed through their rollups, newest first; a trace shows up
+        # once its root span has been logged
+        filters = ["root_span_id IS NOT NULL"]
+        params: list[Any] = []
+        if span_type is not None:
+            filters.append("dfs_span_type = ?")
+            params.append(SpanType(span_type).value)
+        if status_code is not None:
+            filters.append("status_code = ?")
+            params.append(status_code)
+        if start_time_from is not None:
+            filters.append("start_time_unix_nano >= ?")
+            params.append(start_time_from)
+        if start_time_to is not None:
+            filters.append("start_time_unix_nano < ?")
+            params.append(start_time_to)
+        if start_after is not None:
+            start_time, after_trace_id = start_after.split(":")
+            filters.append("(start_time_unix_nano, trace_id) < (?, ?)")
+            params.extend([int(start_time), after_trace_id])
+
+        conn = self._get_experiment_connection(experiment_id)
+        rows = conn.execute(
+            f"""
+            SELECT trace_id, root_span_id, name, dfs_span_type, status_code,
+                start_time_unix_nano, end_time_unix_nano, span_count, error_count,
+                prompt_tokens, completion_tokens
+            FROM trace_summaries
+            WHERE {" AND ".join(filters)}
+            ORDER BY start_time_unix_nano DESC, trace_id DESC
+            LIMIT ?
+            """,
+            [*params, limit + 1],
+        ).fetchall()
+
+        items = [
+            {
+                "trace_id": row[0],
+                "root_span_id": row[1],
+                "name": row[2],
+                "dfs_span_type": row[3],
+                "status_code": row[4],
+                "start_time_unix_nano": row[5],
+                "end_time_unix_nano": row[6],
+                "duration_nano": row[6] - row[5],
+                "span_count": row[7],
+                "error_count": row[8],
+                "prompt_tokens": row[9],
+                "completion_tokens": row[10],
+                "token_usage": {},
+            }
+            for row in rows[:limit]
+        ]
+        if items:
+            by_trace = {item["trace_id"]: item for item in items}
+            for trace_id, model, prompt, completion in conn.execute(
+                f"""
+                SELECT trace_id, model, prompt_tokens, completion_tokens
+                FROM trace_token_usage
+                WHERE trace_id IN ({", ".join("?" * len(by_trace))})
+                """,
+                list(by_trace),
+            ):
+                by_trace[trace_id]["token_usage"][model or None] = {
+                    "prompt_tokens": prompt,
+                    "completion_tokens": completion,
+                }
+        cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            cursor = f"{last['start_time_unix_nano']}:{last['trace_id']}"
+        return {"items": items, "cursor": cursor}
+
+    def _get_attachment_digests(self, experiment_id: str) -> list[str]:
+        if not self._get_experiment_db_path(experiment_id).exists():
+            return []
+        conn = self._get_experiment_connection(experiment_id)
+        return [
+            row[0]
+            for row in conn.execute(
+                "SELECT sha256 FROM attachments WHERE sha256 IS NOT NULL"
+            )
+        ]
 
-        if not file_path.exists():
+    def get_attachment(self, experiment_id: str, name: str) -> Any:  # noqa: ANN401
+        return self.get_attachment_path(experiment_id, name).read_bytes()
+
+    def get_attachment_path(self, experiment_id: str, name: str) -> Path:
+        self._ensure_experiment_initialized(experiment_id)
+
+        file_path = self._get_attachments_dir(experiment_id) / name
+        if not file_path.is_file():
             raise ValueError(
                 f"Attachment {name} not found in experiment {experiment_id}"
             )
+        return file_path
+
+    def open_attachment(self, experiment_id: str, name: str) -> IO[bytes]:
+        return self.get_attachment_path(experiment_id, name).open("rb")
 
+    def map_attachment(self, experiment_id: str, name: str) -> mmap.mmap:
+        file_path = self.get_attachment_path(experiment_id, name)
+        if file_path.stat().st_size == 0:
+            raise ValueError(f"Attachment {name} is empty and cannot be memory-mapped")
         with file_path.open("rb") as f:
-            return f.read()
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
-    def list_experiments(self) -> list[dict[str, Any]]:  # noqa: ANN401
-        conn = self._get_meta_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT id, name, created_at, status, group_name, tags FROM experiments"
-        )
-        experiments = []
-        for row in cursor.fetchall():
-            experiments.append(
-                {
-                    "id": row[0],
-                    "name": row[1],
-                    "created_at": row[2],
-                    "status": row[3],
-                    "group": row[4],
-                    "tags": json.loads(row[5]) if row[5] else [],
-                }
+    def list_experiments(
+        self,
+        group: str | None = None,
+        tags: list[str] | None = None,
+        status: str | None = None,
+        order_by: str = "created_at",
+        order_by_metric: str | None = None,
+        metric_summary: str = "last",
+        descending: bool = False,
+        limit: int | None = None,
+        start_after: str | None = None,
+    ) -> list[dict[str, Any]]:  # noqa: ANN401
+        filters: list[str] = []
+        params: list[Any] = []
+        if group is not None:
+            filters.append("e.group_name = ?")
+            params.append(group)
+        if status is not None:
+            filters.append("e.status = ?")
+            params.append(status)
+        for tag in tags or []:
+            filters.append("EXISTS (SELECT 1 FROM json_each(e.tags) WHERE value = ?)")
+            params.append(tag)
+
+        join = ""
+        if order_by_metric is not None:
+            if metric_summary not in _METRIC_SUMMARY_COLUMNS:
+                raise ValueError(
+                    f"Unknown metric summary {metric_summary!r}, expected one of "
+                    f"{', '.join(_METRIC_SUMMARY_COLUMNS)}"
+                )
+            # experiments that never logged the metric are left out of the ranking
+            join = (
+                "JOIN metric_summaries AS ms ON ms.experiment_id = e.id AND ms.key = ?"
+            )
+            params.insert(0, order_by_metric)
+            sort_column = f"ms.{_METRIC_SUMMARY_COLUMNS[metric_summary]}"
+            # ties broken on the summary's own id column so the index covers the sort
+            id_column = "ms.experiment_id"
+            anchor = (
+                f"SELECT {_METRIC_SUMMARY_COLUMNS[metric_summary]} "
+                "FROM metric_summaries WHERE experiment_id = ? AND key = ?"
             )
+            anchor_params = [start_after, order_by_metric]
+        else:
+            if order_by not in _EXPERIMENT_ORDER_COLUMNS:
+                raise ValueError(
+                    f"Unknown order_by {order_by!r}, expected one of "
+                    f"{', '.join(_EXPERIMENT_ORDER_COLUMNS)}"
+                )
+            sort_column = _EXPERIMENT_ORDER_COLUMNS[order_by]
+            id_column = "e.id"
+            anchor = f"SELECT {order_by} FROM experiments WHERE id = ?"
+            anchor_params = [start_after]
+
+        if start_after is not None:
+            # keyset on (sort value, id) of the last experiment of the previous page
+            filters.append(
+                f"({sort_column}, {id_column}) {'<' if descending else '>'} (({anchor}), ?)"
+            )
+            params.extend([*anchor_params, start_after])
+
+        direction = "DESC" if descending else "ASC"
+        sql = f"""
+            SELECT e.id, e.name, e.created_at, e.status, e.group_name, e.tags
+            FROM experiments AS e {join}
+            {"WHERE " + " AND ".join(filters) if filters else ""}
+            ORDER BY {sort_column} {direction}, {id_column} {direction}
+        """
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        self._wait_for_summaries()
+        conn = self._get_meta_connection()
+        experiments = [
+            {
+                "id": row[0],
+                "name": row[1],
+                "created_at": row[2],
+                "status": row[3],
+                "group": row[4],
+                "tags": json.loads(row[5]) if row[5] else [],
+                "metrics": {},
+            }
+            for row in conn.execute(sql, params)
+        ]
+        self._attach_metric_summaries(conn, experiments)
         return experiments
 
+    @staticmethod
+    def _attach_metric_summaries(
+        conn: sqlite3.Connection, experiments: list[dict[str, Any]]
+    ) -> None:  # noqa: ANN401
+        if not experiments:
+            return
+
+        by_id = {experiment["id"]: experiment for experiment in experiments}
+        for experiment_id, key, last_value, min_value, max_value in conn.execute(
+            """
+            SELECT experiment_id, key, last_value, min_value, max_value
+            FROM metric_summaries
+            WHERE experiment_id IN (SELECT value FROM json_each(?))
+            """,
+            (json.dumps(list(by_id)),),
+        ):
+            by_id[experiment_id]["metrics"][key] = {
+                "last": last_value,
+                "min": min_value,
+                "max": max_value,
+            }
+
     def delete_experiment(self, experiment_id: str) -> None:
-        conn = self._get_meta_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM experiments WHERE id = ?", (experiment_id,))
-        conn.commit()
+        if self._buffer is not None:
+            self._buffer.discard(experiment_id)
+        self._forget_experiment(experiment_id)
+
+        def delete_meta(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM experiments WHERE id = ?", (experiment_id,))
+            conn.execute(
+                "DELETE FROM metric_summaries WHERE experiment_id = ?", (experiment_id,)
+            )
+
+        self._write(self.meta_db_path, delete_meta)
 
-        self.pool.mark_experiment_inactive(experiment_id)
+        digests = self._get_attachment_digests(experiment_id)
+        self.pool.unpin(self._get_experiment_db_path(experiment_id))
 
         exp_dir = self._get_experiment_dir(experiment_id)
         if exp_dir.exists():
             import shutil
 
             shutil.rmtree(exp_dir)
+            self.blobs.release(digests)
 
     def create_group(self, name: str, description: str | None = None) -> None:
-        conn = self._get_meta_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        self._execute(
+            self.meta_db_path,
             """
             INSERT OR REPLACE INTO experiment_groups (name, description)
             VALUES (?, ?)
         """,
             (name, description),
         )
-        conn.commit()
 
     def list_groups(self) -> list[dict[str, Any]]:  # noqa: ANN401
         conn = self._get_meta_connection()
@@ -637,24 +2523,57 @@ class SQLiteBackend(Backend):
             groups.append({"name": row[0], "description": row[1], "created_at": row[2]})
         return groups
 
+    def flush(self, experiment_id: str | None = None) -> None:
+        if self._buffer is not None:
+            self._buffer.flush(experiment_id)
+        self._wait_for_summaries()
+
     def end_experiment(self, experiment_id: str) -> None:
-        conn = self._get_meta_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE experiments SET status = 'completed' WHERE id = ?", (experiment_id,)
+        self.flush(experiment_id)
+        if self.retention.enabled:
+            self.apply_retention(experiment_id)
+        self._forget_experiment(experiment_id)
+
+        self._execute(
+            self.meta_db_path,
+            "UPDATE experiments SET status = 'completed' WHERE id = ?",
+            (experiment_id,),
         )
-        conn.commit()
 
-        self.pool.mark_experiment_inactive(experiment_id)
+        self.pool.unpin(self._get_experiment_db_path(experiment_id))
 
     def export_experiment_db(self, experiment_id: str) -> DiskArtifact:
         db_path = self._get_experiment_db_path(experiment_id)
         if not db_path.exists():
             raise ValueError(f"Experiment {experiment_id} not found")
-        with sqlite3.connect(db_path, check_same_thread=False) as conn:
-            conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+        self.flush(experiment_id)
+        self._write(
+            db_path,
+            lambda conn: conn.execute("PRAGMA wal_checkpoint(TRUNCATE);").fetchone(),
+            transactional=False,
+        )
         return DiskArtifact(db_path)
 
+    def snapshot_experiment_db(
+        self, experiment_id: str, target: str | Path
+    ) -> DiskArtifact:
+        db_path = self._get_experiment_db_path(experiment_id)
+        if not db_path.exists():
+            raise ValueError(f"Experiment {experiment_id} not found")
+        self.flush(experiment_id)
+
+        target = Path(target)
+        target.unlink(missing_ok=True)
+        # VACUUM INTO copies one consistent read snapshot of the WAL database, so
+        # unlike a checkpoint it never waits for or blocks the writer; a
+        # dedicated connection keeps the shared reader free meanwhile
+        conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            conn.execute("VACUUM INTO ?", (str(target),))
+        finally:
+            conn.close()
+        return DiskArtifact(target)
+
     def export_attachments(
         self, experiment_id: str
     ) -> tuple[_BaseArtifact, _BaseArtifact] | None:
@@ -0,0 +1,571 @@
+import atexit
+import contextlib
+import hashlib
+import io
+import json
+import mmap
+import os
+import pickle
+import secrets
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import IO, Any
+
+from luml.experiments.backends._base import Backend
+from luml.experiments.backends.sqlite import SQLiteBackend
+
+_PendingWrite = tuple[str, tuple[Any, ...], dict[str, Any]]
+
+
+def _collector_paths(base_path: Path) -> tuple[Path, Path, Path]:
+    # AF_UNIX addresses are limited to ~100 bytes, so the socket lives in the
+    # temp dir under a name derived from the experiments directory
+    digest = hashlib.sha256(str(base_path.resolve()).encode()).hexdigest()[:16]
+    prefix = Path(tempfile.gettempdir()) / f"luml-collector-{digest}"
+    return (
+        prefix.with_suffix(".sock"),
+        prefix.with_suffix(".key"),
+        prefix.with_suffix(".lock"),
+    )
+
+
+class _Collector:
+    """Serves one ``SQLiteBackend`` to every process logging to the directory.
+
+    Each client connection gets its own thread. Write batches are applied
+    without a reply and their errors are kept until the client flushes; calls
+    are answered with ``("ok", result)`` or ``("error", exception)``. The
+    collector exits once no client has been connected for ``idle_timeout``.
+    """
+
+    def __init__(
+        self,
+        base_path: Path,
+        backend_options: dict[str, Any],  # noqa: ANN401
+        idle_timeout: float,
+    ) -> None:
+        self.base_path = base_path
+        self.backend_options = backend_options
+        self.backend = SQLiteBackend(str(base_path), **backend_options)
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._clients = 0
+        self._closing = False
+        self._last_activity = time.monotonic()
+
+    def serve(self) -> None:
+        socket_path, key_path, _ = _collector_paths(self.base_path)
+        socket_path.unlink(missing_ok=True)
+        authkey = secrets.token_bytes(32)
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as key_file:
+            key_file.write(authkey)
+
+        listener = Listener(str(socket_path), family="AF_UNIX", authkey=authkey)
+        threading.Thread(target=self._accept, args=(listener,), daemon=True).start()
+        try:
+            while not self._close_if_idle(listener):
+                time.sleep(min(self.idle_timeout, 0.5))
+        finally:
+            listener.close()
+            self.backend.flush()
+            self.backend.pool.close_all()
+            # a successor may already be running, only remove our own key
+            with contextlib.suppress(FileNotFoundError):
+                if key_path.read_bytes() == authkey:
+                    key_path.unlink()
+
+    def _close_if_idle(self, listener: Listener) -> bool:
+        with self._lock:
+            idle_for = time.monotonic() - self._last_activity
+            self._closing = self._clients == 0 and idle_for > self.idle_timeout
+            if self._closing:
+                # closing removes the socket file, which must happen before any
+                # client can see us refuse it and start a successor on that path
+                listener.close()
+            return self._closing
+
+    def _accept(self, listener: Listener) -> None:
+        while True:
+            try:
+                conn = listener.accept()
+            except AuthenticationError:
+                continue
+            except OSError:
+                return
+            with self._lock:
+                if self._closing:
+                    conn.close()
+                    return
+                self._clients += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: Connection) -> None:
+        errors: list[Exception] = []
+        try:
+            while True:
+                message = conn.recv()
+                if message[0] == "write":
+                    self._apply_writes(message[1], errors)
+                else:
+                    _, name, args, kwargs = message
+                    self._reply(conn, self._call(name, args, kwargs, errors))
+        except (EOFError, OSError):
+            pass
+        finally:
+            conn.close()
+            with self._lock:
+                self._clients -= 1
+                self._last_activity = time.monotonic()
+
+    def _apply_writes(
+        self, writes: list[_PendingWrite], errors: list[Exception]
+    ) -> None:
+        for name, args, kwargs in writes:
+            if name not in _WRITE_METHODS:
+                errors.append(ValueError(f"Unknown write method {name!r}"))
+                continue
+            try:
+                getattr(self.backend, name)(*args, **kwargs)
+            except Exception as e:
+                errors.append(e)
+
+    def _call(
+        self,
+        name: str,
+        args: tuple[Any, ...],  # noqa: ANN401
+        kwargs: dict[str, Any],  # noqa: ANN401
+        errors: list[Exception],
+    ) -> tuple[str, Any]:  # noqa: ANN401
+        try:
+            if name == "hello":
+                (options,) = args
+                if options != self.backend_options:
+                    raise ValueError(
+                        f"The collector for {self.base_path} is running with "
+                        f"options {self.backend_options}, not {options}"
+                    )
+                return "ok", os.getpid()
+            if name == "flush":
+                self.backend.flush(*args, **kwargs)
+                failed = errors[:]
+                errors.clear()
+                return "ok", failed
+            if name not in _CALL_METHODS:
+                raise ValueError(f"Unknown method {name!r}")
+            return "ok", getattr(self.backend, name)(*args, **kwargs)
+        except Exception as e:
+            return "error", e
+
+    @staticmethod
+    def _reply(conn: Connection, reply: tuple[str, Any]) -> None:  # noqa: ANN401
+        try:
+            conn.send(reply)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            conn.send(("error", RuntimeError(f"Unpicklable result: {e!r}")))
+
+
+# backends of this process, held weakly for the fork and exit hooks below
+_live_backends: "weakref.WeakSet[MultiProcessSQLiteBackend]" = weakref.WeakSet()
+
+
+def _reset_in_child() -> None:
+    # a forked child must not share the parent's socket, lock or batch
+    for backend in list(_live_backends):
+        backend._reset()
+
+
+def _close_at_exit() -> None:
+    for backend in list(_live_backends):
+        backend.close()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_in_child)
+atexit.register(_close_at_exit)
+
+
+def _write_method(name: str) -> Callable[..., None]:
+    def method(self: "MultiProcessSQLiteBackend", *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        self._enqueue(name, args, kwargs)
+
+    method.__name__ = name
+    return method
+
+
+def _call_method(name: str) -> Callable[..., Any]:
+    def method(self: "MultiProcessSQLiteBackend", *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        return self._call(name, args, kwargs)
+
+    method.__name__ = name
+    return method
+
+
+class MultiProcessSQLiteBackend(Backend):
+    """SQLite backend that many processes can log to at once.
+
+    The first process to connect starts a collector process that owns the
+    ``SQLiteBackend`` of the directory; every process, e.g. each DDP rank or
+    data loader worker, ships its log records to it over a Unix socket. Writes
+    are batched per process and sent without waiting for the collector, so
+    they never contend for the database lock. Errors raised by batched writes
+    are reported by the next ``flush``. Reads are forwarded synchronously after
+    the process's own pending writes.
+
+    Options (``sqlite-mp://./experiments?batch_size=512``):
+        batch_size: Number of pending writes that triggers a send.
+        flush_interval: Maximum time in seconds a write stays pending.
+        idle_timeout: Seconds the collector keeps running without clients.
+        startup_timeout: Seconds to wait for a newly started collector.
+        Any other option is passed to the collector's ``SQLiteBackend``; a
+        process passing other options than the running collector's gets a
+        ``ValueError``.
+    """
+
+    def __init__(
+        self,
+        config: str,
+        batch_size: int | str = 256,
+        flush_interval: float | str = 0.1,
+        idle_timeout: float | str = 30.0,
+        startup_timeout: float | str = 10.0,
+        **backend_options: str,
+    ) -> None:
+        if sys.platform == "win32":
+            raise NotImplementedError("sqlite-mp requires Unix domain sockets")
+
+        self.base_path = Path(config)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.batch_size = int(batch_size)
+        self.flush_interval = float(flush_interval)
+        self.idle_timeout = float(idle_timeout)
+        self.startup_timeout = float(startup_timeout)
+        self.backend_options = backend_options
+
+        self._reset()
+        self._closed = False
+
+        _live_backends.add(self)
+        # holds the instance dict rather than the backend, so an unclosed backend
+        # is still collected; at exit live backends are closed by _close_at_exit
+        self._finalizer = weakref.finalize(
+            self, MultiProcessSQLiteBackend._release, vars(self)
+        )
+        self._finalizer.atexit = False
+
+    def _reset(self) -> None:
+        self._lock = threading.RLock()
+        self._pending: list[_PendingWrite] = []
+        self._conn: Connection | None = None
+        self._wakeup = threading.Event()
+        self._sender: threading.Thread | None = None
+
+    def _connection_unsafe(self) -> Connection:
+        if self._closed:
+            raise RuntimeError("Backend is closed")
+        if self._conn is None:
+            self._conn = self._connect()
+        if self._sender is None:
+            self._sender = threading.Thread(
+                target=MultiProcessSQLiteBackend._run_sender,
+                args=(weakref.ref(self), self._wakeup, self.flush_interval),
+                name="luml-mp-sender",
+                daemon=True,
+            )
+            self._sender.start()
+        return self._conn
+
+    def _connect(self) -> Connection:
+        import fcntl
+
+        socket_path, key_path, lock_path = _collector_paths(self.base_path)
+        # the lock makes sure concurrently starting ranks spawn one collector
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            conn = self._try_connect(socket_path, key_path, self.backend_options)
+            if conn is not None:
+                return conn
+
+            self._spawn_collector()
+            deadline = time.monotonic() + self.startup_timeout
+            while conn is None:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(
+                        f"Experiment collector for {self.base_path} did not start "
+                        f"within {self.startup_timeout}s, see "
+                        f"{self.base_path / 'collector.log'}"
+                    )
+                time.sleep(0.05)
+                conn = self._try_connect(socket_path, key_path, self.backend_options)
+            return conn
+
+    @staticmethod
+    def _try_connect(
+        socket_path: Path,
+        key_path: Path,
+        backend_options: dict[str, Any],  # noqa: ANN401
+    ) -> Connection | None:
+        try:
+            conn = Client(
+                str(socket_path), family="AF_UNIX", authkey=key_path.read_bytes()
+            )
+        except (OSError, EOFError, AuthenticationError):
+            return None
+        # a round trip guarantees the collector counted us and will not exit
+        try:
+            conn.send(("call", "hello", (backend_options,), {}))
+            status, result = conn.recv()
+        except (OSError, EOFError):
+            conn.close()
+            return None
+        if status == "error":
+            conn.close()
+            raise result
+        return conn
+
+    def _spawn_collector(self) -> None:
+        package_root = str(Path(__file__).resolve().parents[3])
+        python_path = os.environ.get("PYTHONPATH")
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(filter(None, [package_root, python_path])),
+        }
+        settings = {"idle_timeout": self.idle_timeout, "options": self.backend_options}
+        with open(self.base_path / "collector.log", "ab") as log:
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "luml.experiments.backends.sqlite_mp",
+                    str(self.base_path),
+                    json.dumps(settings),
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=log,
+                env=env,
+                start_new_session=True,
+            )
+
+    def _send(self, message: tuple) -> None:
+        try:
+            self._connection_unsafe().send(message)
+        except (OSError, EOFError):
+            # the collector went away, e.g. after its idle timeout; start over
+            self._drop_connection_unsafe()
+            self._connection_unsafe().send(message)
+
+    def _drop_connection_unsafe(self) -> None:
+        if self._conn is not None:
+            with contextlib.suppress(OSError):
+                self._conn.close()
+            self._conn = None
+
+    def _send_pending_unsafe(self) -> None:
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self._send(("write", batch))
+
+    def _enqueue(
+        self,
+        name: str,
+        args: tuple[Any, ...],  # noqa: ANN401
+        kwargs: dict[str, Any],  # noqa: ANN401
+    ) -> None:
+        with self._lock:
+            self._connection_unsafe()
+            self._pending.append((name, args, kwargs))
+            if len(self._pending) >= self.batch_size:
+                self._send_pending_unsafe()
+
+    def _call(
+        self,
+        name: str,
+        args: tuple[Any, ...],  # noqa: ANN401
+        kwargs: dict[str, Any],  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        with self._lock:
+            self._send_pending_unsafe()
+            self._send(("call", name, args, kwargs))
+            status, result = self._connection_unsafe().recv()
+        if status == "error":
+            raise result
+        return result
+
+    @staticmethod
+    def _run_sender(
+        ref: "weakref.ref[MultiProcessSQLiteBackend]",
+        wakeup: threading.Event,
+        flush_interval: float,
+    ) -> None:
+        # the backend is only referenced during a send, so it can be collected
+        while True:
+            wakeup.wait(flush_interval)
+            backend = ref()
+            if backend is None or backend._closed:
+                return
+            backend._send_in_background()
+            del backend
+
+    def _send_in_background(self) -> None:
+        with self._lock:
+            if self._closed or self._conn is None:
+                return
+            try:
+                self._send_pending_unsafe()
+            except Exception as e:
+                print(f"Failed to send experiment logs to collector: {e}")  # noqa: T201
+
+    @staticmethod
+    def _release(state: dict[str, Any]) -> None:  # noqa: ANN401
+        # the backend was collected without close(): send the pending batch on
+        # the connection it has, reconnecting would need the backend itself
+        with state["_lock"]:
+            conn = state["_conn"]
+            if conn is not None:
+                with contextlib.suppress(Exception):
+                    if state["_pending"]:
+                        conn.send(("write", state["_pending"]))
+                with contextlib.suppress(OSError):
+                    conn.close()
+        state["_wakeup"].set()
+
+    def flush(self, experiment_id: str | None = None) -> None:
+        errors = self._call("flush", (experiment_id,), {})
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        _live_backends.discard(self)
+        self._finalizer.detach()
+        with self._lock:
+            if self._closed:
+                return
+            with contextlib.suppress(Exception):
+                if self._conn is not None:
+                    self._send_pending_unsafe()
+            self._closed = True
+            self._drop_connection_unsafe()
+        self._wakeup.set()
+
+    def end_experiment(self, experiment_id: str) -> None:
+        self.flush(experiment_id)
+        self._call("end_experiment", (experiment_id,), {})
+
+    def log_spans(self, experiment_id: str, spans: Any) -> None:  # noqa: ANN401
+        self._enqueue("log_spans", (experiment_id, list(spans)), {})
+
+    def log_eval_samples(self, experiment_id: str, samples: Any) -> None:  # noqa: ANN401
+        self._enqueue("log_eval_samples", (experiment_id, list(samples)), {})
+
+    def log_attachment_file(
+        self,
+        experiment_id: str,
+        name: str,
+        source: str | os.PathLike[str] | IO[Any],  # noqa: ANN401
+    ) -> None:
+        # the collector runs on the same host and streams paths itself
+        if not isinstance(source, str | os.PathLike):
+            source = io.BytesIO(source.read())
+        self._call("log_attachment_file", (experiment_id, name, source), {})
+
+    def open_attachment(self, experiment_id: str, name: str) -> IO[bytes]:
+        return self.get_attachment_path(experiment_id, name).open("rb")
+
+    def map_attachment(self, experiment_id: str, name: str) -> mmap.mmap:
+        file_path = self.get_attachment_path(experiment_id, name)
+        if file_path.stat().st_size == 0:
+            raise ValueError(f"Attachment {name} is empty and cannot be memory-mapped")
+        with file_path.open("rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    log_static = _write_method("log_static")
+    log_static_many = _write_method("log_static_many")
+    log_dynamic = _write_method("log_dynamic")
+    log_dynamic_many = _write_method("log_dynamic_many")
+    log_dynamic_series = _write_method("log_dynamic_series")
+    log_attachment = _write_method("log_attachment")
+    log_span = _write_method("log_span")
+    log_eval_sample = _write_method("log_eval_sample")
+    link_eval_sample_to_trace = _write_method("link_eval_sample_to_trace")
+
+    initialize_experiment = _call_method("initialize_experiment")
+    get_experiment_data = _call_method("get_experiment_data")
+    get_metric_arrays = _call_method("get_metric_arrays")
+    get_metrics_since = _call_method("get_metrics_since")
+    get_spans_since = _call_method("get_spans_since")
+    get_evals_since = _call_method("get_evals_since")
+    materialize_eval_scores = _call_method("materialize_eval_scores")
+    aggregate_evals = _call_method("aggregate_evals")
+    query_spans = _call_method("query_spans")
+    search_spans = _call_method("search_spans")
+    get_trace = _call_method("get_trace")
+    list_traces = _call_method("list_traces")
+    get_attachment = _call_method("get_attachment")
+    get_attachment_path = _call_method("get_attachment_path")
+    list_experiments = _call_method("list_experiments")
+    delete_experiment = _call_method("delete_experiment")
+    create_group = _call_method("create_group")
+    list_groups = _call_method("list_groups")
+    export_experiment_db = _call_method("export_experiment_db")
+    snapshot_experiment_db = _call_method("snapshot_experiment_db")
+    export_attachments = _call_method("export_attachments")
+    apply_retention = _call_method("apply_retention")
+
+
+_WRITE_METHODS = frozenset(
+    {
+        "log_static",
+        "log_static_many",
+        "log_dynamic",
+        "log_dynamic_many",
+        "log_dynamic_series",
+        "log_attachment",
+        "log_span",
+        "log_spans",
+        "log_eval_sample",
+        "log_eval_samples",
+        "link_eval_sample_to_trace",
+    }
+)
+_CALL_METHODS = frozenset(
+    {
+        "initialize_experiment",
+        "log_attachment_file",
+        "get_experiment_data",
+        "get_metric_arrays",
+        "get_metrics_since",
+        "get_spans_since",
+        "get_evals_since",
+        "materialize_eval_scores",
+        "aggregate_evals",
+        "query_spans",
+        "search_spans",
+        "get_trace",
+        "list_traces",
+        "get_attachment",
+        "get_attachment_path",
+        "list_experiments",
+        "delete_experiment",
+        "create_group",
+        "list_groups",
+        "end_experiment",
+        "apply_retention",
+        "export_experiment_db",
+        "snapshot_experiment_db",
+        "export_attachments",
+    }
+)
+
+
+if __name__ == "__main__":
+    settings = json.loads(sys.argv[2])
+    _Collector(Path(sys.argv[1]), settings["options"], settings["idle_timeout"]).serve()
@@ -1,20 +1,29 @@
 from collections.abc import Callable
+from typing import Any
 
 from luml.experiments.tracker import ExperimentTracker
 
 
 class TracerManager:
     _log_fn: Callable | None = None
+    _log_batch_fn: Callable | None = None
+    _span_processor: Any = None
 
     @classmethod
     def setup_luml_tracing(
         cls,
+        batching: bool = False,
+        max_queue_size: int = 2048,
+        max_export_batch_size: int = 512,
+        schedule_delay_millis: float = 1000,
+        drop_policy: str = "drop_newest",
     ) -> None:
         from opentelemetry import trace
         from opentelemetry.sdk.resources import Resource
         from opentelemetry.sdk.trace import TracerProvider
         from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 
+        from luml.experiments.tracing.processor import LumlBatchSpanProcessor
         from luml.experiments.tracing.span_exporter import LumlSpanExporter
 
         service_name: str = "luml-sdk"
@@ -24,13 +33,27 @@ class TracerManager:
 
         tracer_provider = TracerProvider(resource=resource)
 
-        exporter = LumlSpanExporter(
-            log_fn=cls._logger,
-        )
-
-        span_processor = SimpleSpanProcessor(span_exporter=exporter)
+        if batching:
+            exporter = LumlSpanExporter(
+                log_fn=cls._logger,
+                batch_size=max_export_batch_size,
+                log_batch_fn=cls._batch_logger,
+            )
+            span_processor = LumlBatchSpanProcessor(
+                span_exporter=exporter,
+                max_queue_size=max_queue_size,
+                max_export_batch_size=max_export_batch_size,
+                schedule_delay_millis=schedule_delay_millis,
+                drop_policy=drop_policy,
+            )
+        else:
+            exporter = LumlSpanExporter(
+                log_fn=cls._logger,
+            )
+            span_processor = SimpleSpanProcessor(span_exporter=exporter)
 
         tracer_provider.add_span_processor(span_processor)
+        cls._span_processor = span_processor
 
         trace.set_tracer_provider(tracer_provider)
 
@@ -41,15 +64,30 @@ class TracerManager:
         else:
             raise ValueError("Log function is not set. Call setup_luml_tracing first.")
 
+    @classmethod
+    def _batch_logger(cls, *args, **kwargs) -> None:
+        if cls._log_batch_fn:
+            cls._log_batch_fn(*args, **kwargs)
+        else:
+            raise ValueError("Log function is not set. Call setup_luml_tracing first.")
+
     @classmethod
     def set_experiment_tracker(cls, tracker: ExperimentTracker) -> None:
         if not isinstance(tracker, ExperimentTracker):
             raise ValueError("tracker must be an instance of ExperimentTracker")
         cls._log_fn = tracker.log_span
+        cls._log_batch_fn = tracker.log_spans
+
+    @classmethod
+    def force_flush(cls, timeout_millis: int = 30000) -> bool:
+        if cls._span_processor is None:
+            return True
+        return cls._span_processor.force_flush(timeout_millis)
 
 
 setup_tracing = TracerManager.setup_luml_tracing
 set_experiment_tracker = TracerManager.set_experiment_tracker
+flush_tracing = TracerManager.force_flush
 
 
 def instrument_openai() -> None:
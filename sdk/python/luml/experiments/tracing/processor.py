@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import deque
+from enum import StrEnum
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter
+
+
+class DropPolicy(StrEnum):
+    """
+    Options: "drop_newest", "drop_oldest", "block".
+    """
+
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+
+class LumlBatchSpanProcessor(SpanProcessor):
+    """Queues finished spans and exports them in batches from a worker thread.
+
+    ``on_end`` only appends the span to a bounded queue, so conversion and the
+    storage write never run on the instrumented thread. When the queue is full
+    the ``drop_policy`` decides whether the new span is dropped, the oldest
+    queued span is dropped, or the caller blocks until there is room.
+    """
+
+    def __init__(
+        self,
+        span_exporter: SpanExporter,
+        max_queue_size: int = 2048,
+        max_export_batch_size: int = 512,
+        schedule_delay_millis: float = 1000,
+        drop_policy: DropPolicy | str = DropPolicy.DROP_NEWEST,
+    ) -> None:
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be a positive integer")
+        if max_export_batch_size < 1:
+            raise ValueError("max_export_batch_size must be a positive integer")
+
+        self.span_exporter = span_exporter
+        self.max_queue_size = max_queue_size
+        self.max_export_batch_size = max_export_batch_size
+        self.schedule_delay = schedule_delay_millis / 1000
+        self.drop_policy = DropPolicy(drop_policy)
+        self.dropped_spans = 0
+
+        self._queue: deque[ReadableSpan] = deque()
+        self._condition = threading.Condition()
+        self._exporting = False
+        self._flush_requested = False
+        self._shutdown = False
+        self._worker = threading.Thread(
+            target=self._run, name="luml-span-processor", daemon=True
+        )
+        self._worker.start()
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        pass
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if not span.context or not span.context.trace_flags.sampled:
+            return
+
+        with self._condition:
+            if self._shutdown:
+                return
+            if len(self._queue) >= self.max_queue_size:
+                if self.drop_policy == DropPolicy.DROP_NEWEST:
+                    self.dropped_spans += 1
+                    return
+                if self.drop_policy == DropPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped_spans += 1
+                else:
+                    self._condition.wait_for(
+                        lambda: len(self._queue) < self.max_queue_size or self._shutdown
+                    )
+                    if self._shutdown:
+                        return
+            self._queue.append(span)
+            if len(self._queue) >= self.max_export_batch_size:
+                self._condition.notify_all()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        deadline = time.monotonic() + timeout_millis / 1000
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            flushed = self._condition.wait_for(
+                lambda: (not self._queue and not self._exporting)
+                or not self._worker.is_alive(),
+                timeout=max(deadline - time.monotonic(), 0),
+            )
+        return flushed and self.span_exporter.force_flush(
+            int(max(deadline - time.monotonic(), 0) * 1000)
+        )
+
+    def shutdown(self) -> None:
+        with self._condition:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            self._condition.notify_all()
+        self._worker.join()
+        self.span_exporter.shutdown()
+
+    def _next_batch(self) -> list[ReadableSpan]:
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._shutdown
+                or self._flush_requested
+                or len(self._queue) >= self.max_export_batch_size,
+                timeout=self.schedule_delay,
+            )
+            count = min(len(self._queue), self.max_export_batch_size)
+            batch = [self._queue.popleft() for _ in range(count)]
+            if not self._queue:
+                self._flush_requested = False
+            self._exporting = bool(batch)
+            self._condition.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch:
+                try:
+                    self.span_exporter.export(batch)
+                except Exception as e:
+                    print(f"Failed to export {len(batch)} spans: {e}")  # noqa: T201
+            with self._condition:
+                self._exporting = False
+                self._condition.notify_all()
+                if self._shutdown and not self._queue:
+                    return
@@ -12,8 +12,10 @@ class LumlSpanExporter(SpanExporter):
         self,
         log_fn: Callable,
         batch_size: int = 100,
+        log_batch_fn: Callable | None = None,
     ) -> None:
         self.log_fn = log_fn
+        self.log_batch_fn = log_batch_fn
         self.batch_size = batch_size
         self._shutdown = False
 
@@ -24,6 +26,9 @@ class LumlSpanExporter(SpanExporter):
         if not spans:
             return SpanExportResult.SUCCESS
 
+        if self.log_batch_fn is not None:
+            return self._export_batch(spans)
+
         try:
             for span in spans:
                 try:
@@ -37,7 +42,26 @@ class LumlSpanExporter(SpanExporter):
         except Exception:
             return SpanExportResult.FAILURE
 
+    def _export_batch(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        converted = []
+        for span in spans:
+            try:
+                converted.append(self._convert_span_to_dict(span))
+            except Exception as e:
+                print(f"Failed to export span {span.name}: {e}")  # noqa: T201
+
+        try:
+            for i in range(0, len(converted), self.batch_size):
+                self.log_batch_fn(spans=converted[i : i + self.batch_size])  # type: ignore[misc]
+            return SpanExportResult.SUCCESS
+        except Exception as e:
+            print(f"Failed to export {len(converted)} spans: {e}")  # noqa: T201
+            return SpanExportResult.FAILURE
+
     def _export_single_span(self, span: ReadableSpan) -> None:
+        self.log_fn(**self._convert_span_to_dict(span))
+
+    def _convert_span_to_dict(self, span: ReadableSpan) -> dict[str, Any]:
         trace_id = f"{span.context.trace_id:032x}"  # type: ignore
         span_id = f"{span.context.span_id:016x}"  # type: ignore
         parent_span_id = None
@@ -55,21 +79,21 @@ class LumlSpanExporter(SpanExporter):
 
         trace_flags = span.context.trace_flags  # type: ignore
 
-        self.log_fn(
-            trace_id=trace_id,
-            span_id=span_id,
-            name=span.name,
-            start_time_unix_nano=span.start_time,
-            end_time_unix_nano=span.end_time,
-            parent_span_id=parent_span_id,
-            kind=kind,
-            status_code=status_code,
-            status_message=status_message,
-            attributes=attributes,
-            events=events,
-            links=links,
-            trace_flags=trace_flags,
-        )
+        return {
+            "trace_id": trace_id,
+            "span_id": span_id,
+            "name": span.name,
+            "start_time_unix_nano": span.start_time,
+            "end_time_unix_nano": span.end_time,
+            "parent_span_id": parent_span_id,
+            "kind": kind,
+            "status_code": status_code,
+            "status_message": status_message,
+            "attributes": attributes,
+            "events": events,
+            "links": links,
+            "trace_flags": trace_flags,
+        }
 
     def _convert_span_kind(self, kind: SpanKind) -> int:
         kind_map = {
@@ -1,25 +1,79 @@
+import asyncio
+import functools
+import mmap
+import os
+import shutil
 import uuid
 import zipfile
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import (
+    Future as ConcurrentFuture,
+    ThreadPoolExecutor,
+)
+from enum import StrEnum
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Any
+from tempfile import TemporaryDirectory
+from typing import IO, Any
 
 from luml.experiments.backends import Backend, BackendRegistry
-from luml.modelref import ArtifactMap, DiskArtifact, ModelReference
+from luml.experiments.utils import SpanType
+from luml.modelref import ArtifactMap, DiskArtifact, ModelReference, _BaseArtifact
+
+
+class SnapshotCompression(StrEnum):
+    """
+    Options: "deflate", "none", "zstd".
+
+    "deflate" and "none" produce ``exp.db.zip``, which the LUML web UI reads;
+    "zstd" produces ``exp.db.zst`` and requires the ``zstandard`` package.
+    """
+
+    DEFLATE = "deflate"
+    NONE = "none"
+    ZSTD = "zstd"
+
+
+def _zip_snapshot(
+    snapshot: _BaseArtifact, target: Path, compression: SnapshotCompression
+) -> DiskArtifact:
+    if compression == SnapshotCompression.NONE:
+        zipf = zipfile.ZipFile(target, "w", zipfile.ZIP_STORED)
+    else:
+        zipf = zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED, compresslevel=1)
+    with (
+        zipf,
+        snapshot.open() as source,
+        zipf.open("exp.db", "w", force_zip64=True) as dest,
+    ):
+        shutil.copyfileobj(source, dest)
+    return DiskArtifact(target)
+
+
+def _compress_zstd(snapshot: _BaseArtifact, target: Path) -> DiskArtifact:
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError as e:
+        msg = (
+            "zstandard is required for zstd experiment snapshots. "
+            "Install with: pip install zstandard"
+        )
+        raise ImportError(msg) from e
+
+    compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+    with snapshot.open() as source, open(target, "wb") as dest:
+        compressor.copy_stream(source, dest)
+    return DiskArtifact(target)
 
 
 class ExperimentTracker:
     def __init__(self, connection_string: str = "sqlite://./experiments") -> None:
         self.backend = self._parse_connection_string(connection_string)
         self.current_experiment_id: str | None = None
+        self._tracing_enabled = False
 
     def _parse_connection_string(self, connection_string: str) -> Backend:
-        if "://" not in connection_string:
-            raise ValueError("Invalid connection string format. Use 'backend://config'")
-
-        backend_type, config = connection_string.split("://", 1)
-
-        return BackendRegistry.get_backend(backend_type)(config)
+        return BackendRegistry.from_connection_string(connection_string)
 
     def start_experiment(
         self,
@@ -40,6 +94,7 @@ class ExperimentTracker:
         if exp_id is None:
             raise ValueError("No active experiment to end.")
 
+        self._flush_tracing()
         self.backend.end_experiment(exp_id)
 
         if exp_id == self.current_experiment_id:
@@ -68,6 +123,39 @@ class ExperimentTracker:
             raise ValueError("No active experiment. Call start_experiment() first.")
         self.backend.log_dynamic(exp_id, key, value, step)
 
+    def log_static_many(
+        self,
+        params: dict[str, Any],  # noqa: ANN401
+        experiment_id: str | None = None,
+    ) -> None:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        self.backend.log_static_many(exp_id, params)
+
+    def log_dynamic_many(
+        self,
+        metrics: dict[str, int | float],
+        step: int | None = None,
+        experiment_id: str | None = None,
+    ) -> None:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        self.backend.log_dynamic_many(exp_id, metrics, step)
+
+    def log_dynamic_series(
+        self,
+        key: str,
+        values: Sequence[int | float] | Any,  # noqa: ANN401
+        steps: Sequence[int] | Any | None = None,  # noqa: ANN401
+        experiment_id: str | None = None,
+    ) -> None:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        self.backend.log_dynamic_series(exp_id, key, values, steps)
+
     def log_span(
         self,
         trace_id: str,
@@ -105,6 +193,16 @@ class ExperimentTracker:
             trace_flags,
         )
 
+    def log_spans(
+        self,
+        spans: Iterable[dict[str, Any]],  # noqa: ANN401
+        experiment_id: str | None = None,
+    ) -> None:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        self.backend.log_spans(exp_id, spans)
+
     def log_eval_sample(
         self,
         eval_id: str,
@@ -130,6 +228,16 @@ class ExperimentTracker:
             metadata,
         )
 
+    def log_eval_samples(
+        self,
+        samples: Iterable[dict[str, Any]],  # noqa: ANN401
+        experiment_id: str | None = None,
+    ) -> None:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        self.backend.log_eval_samples(exp_id, samples)
+
     def link_eval_sample_to_trace(
         self,
         eval_dataset_id: str,
@@ -156,17 +264,218 @@ class ExperimentTracker:
             raise ValueError("No active experiment. Call start_experiment() first.")
         self.backend.log_attachment(exp_id, name, data, binary)
 
+    def log_attachment_file(
+        self,
+        name: str,
+        source: str | os.PathLike[str] | IO[Any],  # noqa: ANN401
+        experiment_id: str | None = None,
+    ) -> None:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        self.backend.log_attachment_file(exp_id, name, source)
+
+    def flush(self, experiment_id: str | None = None) -> None:
+        self._flush_tracing()
+        self.backend.flush(experiment_id)
+
+    def _flush_tracing(self) -> None:
+        if self._tracing_enabled:
+            from luml.experiments.tracing import flush_tracing
+
+            flush_tracing()
+
     def get_experiment(self, experiment_id: str) -> dict[str, Any]:  # noqa: ANN401
         return self.backend.get_experiment_data(experiment_id)
 
+    def get_metric_arrays(
+        self,
+        keys: Sequence[str] | None = None,
+        step_range: tuple[int, int] | None = None,
+        max_points: int | None = None,
+        experiment_id: str | None = None,
+    ) -> dict[str, dict[str, Any]]:  # noqa: ANN401
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.get_metric_arrays(exp_id, keys, step_range, max_points)
+
+    def get_metrics_since(
+        self,
+        since: dict[str, int] | None = None,
+        experiment_id: str | None = None,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.get_metrics_since(exp_id, since)
+
+    def get_spans_since(
+        self,
+        since: int | None = None,
+        limit: int = 1000,
+        experiment_id: str | None = None,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.get_spans_since(exp_id, since, limit)
+
+    def get_evals_since(
+        self,
+        since: int | None = None,
+        dataset_id: str | None = None,
+        limit: int = 1000,
+        experiment_id: str | None = None,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.get_evals_since(exp_id, since, dataset_id, limit)
+
+    def materialize_eval_scores(
+        self, keys: Sequence[str], experiment_id: str | None = None
+    ) -> None:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        self.backend.materialize_eval_scores(exp_id, keys)
+
+    def aggregate_evals(
+        self,
+        dataset_id: str | None = None,
+        score_keys: Sequence[str] | None = None,
+        percentiles: Sequence[float] = (50, 90, 99),
+        experiment_id: str | None = None,
+    ) -> dict[str, dict[str, dict[str, float]]]:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.aggregate_evals(exp_id, dataset_id, score_keys, percentiles)
+
+    def query_spans(
+        self,
+        trace_id: str | None = None,
+        parent_span_id: str | None = None,
+        span_type: SpanType | int | None = None,
+        status_code: int | None = None,
+        start_time_from: int | None = None,
+        start_time_to: int | None = None,
+        limit: int = 100,
+        start_after: str | None = None,
+        experiment_id: str | None = None,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.query_spans(
+            exp_id,
+            trace_id,
+            parent_span_id,
+            span_type,
+            status_code,
+            start_time_from,
+            start_time_to,
+            limit,
+            start_after,
+        )
+
+    def search_spans(
+        self,
+        query: str,
+        trace_id: str | None = None,
+        limit: int = 100,
+        experiment_id: str | None = None,
+    ) -> list[dict[str, Any]]:  # noqa: ANN401
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.search_spans(exp_id, query, trace_id, limit)
+
+    def get_trace(
+        self, trace_id: str, experiment_id: str | None = None
+    ) -> dict[str, Any]:  # noqa: ANN401
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.get_trace(exp_id, trace_id)
+
+    def list_traces(
+        self,
+        span_type: SpanType | int | None = None,
+        status_code: int | None = None,
+        start_time_from: int | None = None,
+        start_time_to: int | None = None,
+        limit: int = 50,
+        start_after: str | None = None,
+        experiment_id: str | None = None,
+    ) -> dict[str, Any]:  # noqa: ANN401
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.list_traces(
+            exp_id,
+            span_type,
+            status_code,
+            start_time_from,
+            start_time_to,
+            limit,
+            start_after,
+        )
+
+    def apply_retention(self, experiment_id: str | None = None) -> int:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.apply_retention(exp_id)
+
     def get_attachment(self, name: str, experiment_id: str | None = None) -> Any:  # noqa: ANN401
         exp_id = experiment_id or self.current_experiment_id
         if exp_id is None:
             raise ValueError("No active experiment. Call start_experiment() first.")
         return self.backend.get_attachment(exp_id, name)
 
-    def list_experiments(self) -> list[dict[str, Any]]:  # noqa: ANN401
-        return self.backend.list_experiments()
+    def get_attachment_path(self, name: str, experiment_id: str | None = None) -> Path:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.get_attachment_path(exp_id, name)
+
+    def open_attachment(self, name: str, experiment_id: str | None = None) -> IO[bytes]:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.open_attachment(exp_id, name)
+
+    def map_attachment(self, name: str, experiment_id: str | None = None) -> mmap.mmap:
+        exp_id = experiment_id or self.current_experiment_id
+        if exp_id is None:
+            raise ValueError("No active experiment. Call start_experiment() first.")
+        return self.backend.map_attachment(exp_id, name)
+
+    def list_experiments(
+        self,
+        group: str | None = None,
+        tags: list[str] | None = None,
+        status: str | None = None,
+        order_by: str = "created_at",
+        order_by_metric: str | None = None,
+        metric_summary: str = "last",
+        descending: bool = False,
+        limit: int | None = None,
+        start_after: str | None = None,
+    ) -> list[dict[str, Any]]:  # noqa: ANN401
+        return self.backend.list_experiments(
+            group=group,
+            tags=tags,
+            status=status,
+            order_by=order_by,
+            order_by_metric=order_by_metric,
+            metric_summary=metric_summary,
+            descending=descending,
+            limit=limit,
+            start_after=start_after,
+        )
 
     def delete_experiment(self, experiment_id: str) -> None:
         self.backend.delete_experiment(experiment_id)
@@ -178,49 +487,246 @@ class ExperimentTracker:
         return self.backend.list_groups()
 
     def link_to_model(
-        self, model_reference: ModelReference, experiment_id: str | None = None
+        self,
+        model_reference: ModelReference,
+        experiment_id: str | None = None,
+        compression: SnapshotCompression | str = SnapshotCompression.DEFLATE,
     ) -> None:
         exp_id = experiment_id or self.current_experiment_id
         if exp_id is None:
             raise ValueError("No active experiment. Call start_experiment() first.")
-        exp_db = self.backend.export_experiment_db(exp_id)
+        compression = SnapshotCompression(compression)
         attachments_result = self.backend.export_attachments(exp_id)
         if attachments_result is None:
             raise ValueError(f"No attachments found for experiment {exp_id}")
         attachments, index = attachments_result
         tag = "dataforce.studio::experiment_snapshot:v1"
-        with NamedTemporaryFile(suffix=".zip", delete=False) as temp_zip:
-            zip_path = temp_zip.name
-
-        if isinstance(exp_db, DiskArtifact):
-            path = exp_db.path
-            with zipfile.ZipFile(
-                zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1
-            ) as zipf:
-                zipf.write(path, "exp.db")
-        else:
-            raise NotImplementedError(
-                "Only DiskArtifact is supported for exp_db at the moment."
-            )
 
-        zipped_exp_db = DiskArtifact(zip_path)
-
-        model_reference._append_metadata(
-            idx=None,
-            tags=[tag],
-            payload={},
-            data=[
-                ArtifactMap(artifact=zipped_exp_db, remote_path="exp.db.zip"),
-                ArtifactMap(artifact=attachments, remote_path="attachments.tar"),
-                ArtifactMap(artifact=index, remote_path="attachments.index.json"),
-            ],
-            prefix=tag,
-        )
+        with TemporaryDirectory() as temp_dir:
+            snapshot = self.backend.snapshot_experiment_db(
+                exp_id, Path(temp_dir) / "exp.db"
+            )
+            if compression == SnapshotCompression.ZSTD:
+                remote_path = "exp.db.zst"
+                exp_db = _compress_zstd(snapshot, Path(temp_dir) / remote_path)
+            else:
+                remote_path = "exp.db.zip"
+                exp_db = _zip_snapshot(
+                    snapshot, Path(temp_dir) / remote_path, compression
+                )
 
-        Path(zip_path).unlink(missing_ok=True)
+            model_reference._append_metadata(
+                idx=None,
+                tags=[tag],
+                payload={},
+                data=[
+                    ArtifactMap(artifact=exp_db, remote_path=remote_path),
+                    ArtifactMap(artifact=attachments, remote_path="attachments.tar"),
+                    ArtifactMap(artifact=index, remote_path="attachments.index.json"),
+                ],
+                prefix=tag,
+            )
 
-    def enable_tracing(self) -> None:
+    def enable_tracing(self, batching: bool = False, **kwargs) -> None:
         from luml.experiments.tracing import setup_tracing, set_experiment_tracker  # noqa: I001
 
-        setup_tracing()
+        setup_tracing(batching=batching, **kwargs)
         set_experiment_tracker(self)
+        self._tracing_enabled = True
+
+
+def _async_write(name: str) -> Callable[..., Awaitable[None]]:
+    sync_method = getattr(ExperimentTracker, name)
+
+    @functools.wraps(sync_method)
+    async def method(self: "AsyncExperimentTracker", *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        await self._submit_write(
+            functools.partial(sync_method, self.tracker, *args, **kwargs)
+        )
+
+    return method
+
+
+def _async_call(name: str) -> Callable[..., Awaitable[Any]]:
+    sync_method = getattr(ExperimentTracker, name)
+
+    @functools.wraps(sync_method)
+    async def method(self: "AsyncExperimentTracker", *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        return await self._call(
+            functools.partial(sync_method, self.tracker, *args, **kwargs)
+        )
+
+    return method
+
+
+def _async_read(name: str) -> Callable[..., Awaitable[Any]]:
+    sync_method = getattr(ExperimentTracker, name)
+
+    @functools.wraps(sync_method)
+    async def method(self: "AsyncExperimentTracker", *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        return await self._read(
+            functools.partial(sync_method, self.tracker, *args, **kwargs)
+        )
+
+    return method
+
+
+class AsyncExperimentTracker:
+    """Asyncio front end of ``ExperimentTracker`` that never blocks the loop.
+
+    ``log_*`` calls are handed to a single background writer thread, which
+    applies them in submission order, and return without waiting for the
+    database; errors they raise are reported by the next ``flush``. Once
+    ``max_pending_writes`` are queued, logging waits for the writer instead of
+    growing the queue. Reads run on a thread pool after the writes queued
+    before them, so they see everything logged so far.
+
+    Methods take the same arguments as their ``ExperimentTracker`` versions.
+    """
+
+    def __init__(
+        self,
+        connection_string: str = "sqlite://./experiments",
+        max_pending_writes: int = 10000,
+        read_workers: int = 4,
+    ) -> None:
+        self.tracker = ExperimentTracker(connection_string)
+        self.max_pending_writes = max_pending_writes
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="luml-async-writer")
+        self._readers = ThreadPoolExecutor(
+            read_workers, thread_name_prefix="luml-async-reader"
+        )
+        self._pending: deque[tuple[ConcurrentFuture, bool]] = deque()
+        self._errors: list[BaseException] = []
+        self._closed = False
+
+    @property
+    def backend(self) -> Backend:
+        return self.tracker.backend
+
+    @property
+    def current_experiment_id(self) -> str | None:
+        return self.tracker.current_experiment_id
+
+    async def __aenter__(self) -> "AsyncExperimentTracker":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def _enqueue(
+        self,
+        fn: Callable[[], Any],  # noqa: ANN401
+        report_errors: bool,
+    ) -> ConcurrentFuture:
+        if self._closed:
+            raise RuntimeError("Tracker is closed")
+        future = self._writer.submit(fn)
+        self._pending.append((future, report_errors))
+        return future
+
+    def _collect_done(self) -> None:
+        while self._pending and self._pending[0][0].done():
+            future, report_errors = self._pending.popleft()
+            if report_errors and future.exception() is not None:
+                self._errors.append(future.exception())  # type: ignore[arg-type]
+
+    async def _submit_write(self, fn: Callable[[], Any]) -> None:  # noqa: ANN401
+        self._collect_done()
+        while len(self._pending) >= self.max_pending_writes:
+            await asyncio.wait([asyncio.wrap_future(self._pending[0][0])])
+            self._collect_done()
+        self._enqueue(fn, report_errors=True)
+
+    async def _call(self, fn: Callable[[], Any]) -> Any:  # noqa: ANN401
+        # the caller gets this error, so flush does not report it again
+        future = self._enqueue(fn, report_errors=False)
+        return await asyncio.wrap_future(future)
+
+    async def _read(self, fn: Callable[[], Any]) -> Any:  # noqa: ANN401
+        await self._wait_for_writes()
+        return await asyncio.get_running_loop().run_in_executor(self._readers, fn)
+
+    async def _wait_for_writes(self) -> None:
+        self._collect_done()
+        if self._pending:
+            last, _ = self._pending[-1]
+            await asyncio.wait([asyncio.wrap_future(last)])
+
+    async def flush(self, experiment_id: str | None = None) -> None:
+        await self._call(functools.partial(self.tracker.flush, experiment_id))
+        self._collect_done()
+        errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        try:
+            await self.flush()
+        finally:
+            self._closed = True
+            self._writer.shutdown(wait=False)
+            self._readers.shutdown(wait=False)
+
+    def enable_tracing(self, batching: bool = False, **kwargs) -> None:
+        # spans are exported from the OpenTelemetry processor, not the loop
+        self.tracker.enable_tracing(batching=batching, **kwargs)
+
+    async def log_spans(
+        self,
+        spans: Iterable[dict[str, Any]],  # noqa: ANN401
+        experiment_id: str | None = None,
+    ) -> None:
+        spans = list(spans)
+        await self._submit_write(
+            functools.partial(self.tracker.log_spans, spans, experiment_id)
+        )
+
+    async def log_eval_samples(
+        self,
+        samples: Iterable[dict[str, Any]],  # noqa: ANN401
+        experiment_id: str | None = None,
+    ) -> None:
+        samples = list(samples)
+        await self._submit_write(
+            functools.partial(self.tracker.log_eval_samples, samples, experiment_id)
+        )
+
+    log_static = _async_write("log_static")
+    log_dynamic = _async_write("log_dynamic")
+    log_static_many = _async_write("log_static_many")
+    log_dynamic_many = _async_write("log_dynamic_many")
+    log_dynamic_series = _async_write("log_dynamic_series")
+    log_span = _async_write("log_span")
+    log_eval_sample = _async_write("log_eval_sample")
+    link_eval_sample_to_trace = _async_write("link_eval_sample_to_trace")
+    log_attachment = _async_write("log_attachment")
+
+    # awaited on the writer, in order with the writes queued before them
+    start_experiment = _async_call("start_experiment")
+    end_experiment = _async_call("end_experiment")
+    log_attachment_file = _async_call("log_attachment_file")
+    materialize_eval_scores = _async_call("materialize_eval_scores")
+    apply_retention = _async_call("apply_retention")
+    delete_experiment = _async_call("delete_experiment")
+    create_group = _async_call("create_group")
+
+    get_experiment = _async_read("get_experiment")
+    get_metric_arrays = _async_read("get_metric_arrays")
+    get_metrics_since = _async_read("get_metrics_since")
+    get_spans_since = _async_read("get_spans_since")
+    get_evals_since = _async_read("get_evals_since")
+    aggregate_evals = _async_read("aggregate_evals")
+    query_spans = _async_read("query_spans")
+    search_spans = _async_read("search_spans")
+    get_trace = _async_read("get_trace")
+    list_traces = _async_read("list_traces")
+    get_attachment = _async_read("get_attachment")
+    get_attachment_path = _async_read("get_attachment_path")
+    open_attachment = _async_read("open_attachment")
+    map_attachment = _async_read("map_attachment")
+    list_experiments = _async_read("list_experiments")
+    list_groups = _async_read("list_groups")
+    link_to_model = _async_read("link_to_model")
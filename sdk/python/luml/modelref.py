@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import tarfile
 import uuid
 import zipfile
@@ -9,7 +10,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 if TYPE_CHECKING:
     from fnnx.extras.reader import Reader
@@ -23,11 +24,21 @@ class PathSeparators(str, Enum):
     ENDTAG = "~~et~~"
 
 
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
 class _BaseArtifact(ABC):
     @abstractmethod
     def get_artifact(self) -> bytes:
         pass
 
+    def open(self) -> BinaryIO:
+        """Returns a binary stream over the artifact's content."""
+        return io.BytesIO(self.get_artifact())
+
+    def size(self) -> int:
+        return len(self.get_artifact())
+
 
 class DiskArtifact(_BaseArtifact):
     def __init__(self, path: str | Path) -> None:
@@ -37,6 +48,12 @@ class DiskArtifact(_BaseArtifact):
         with open(self.path, "rb") as f:
             return f.read()
 
+    def open(self) -> BinaryIO:
+        return open(self.path, "rb")  # noqa: SIM115
+
+    def size(self) -> int:
+        return os.path.getsize(self.path)
+
 
 class MemoryArtifact(_BaseArtifact):
     def __init__(self, data: bytes) -> None:
@@ -45,6 +62,12 @@ class MemoryArtifact(_BaseArtifact):
     def get_artifact(self) -> bytes:
         return self.data
 
+    def open(self) -> BinaryIO:
+        return io.BytesIO(self.data)
+
+    def size(self) -> int:
+        return len(self.data)
+
 
 @dataclass
 class ArtifactMap:
@@ -87,17 +110,18 @@ class ModelReference:
         body_str = json.dumps([body]).encode("utf-8")
         uid = uuid.uuid4().hex
         artifact_path_prefix = f"meta_artifacts/{idx}/"
-        with tarfile.open(self.path, "a") as tar:
+        # artifacts are copied in fixed-size chunks so memory stays flat
+        with tarfile.open(self.path, "a", copybufsize=_COPY_BUFFER_SIZE) as tar:
             info = tarfile.TarInfo(name=f"meta-{uid}.json")
             info.size = len(body_str)
             tar.addfile(info, fileobj=io.BytesIO(body_str))
-            for _, item in enumerate(data):
-                file_content = item.artifact.get_artifact()
+            for item in data:
                 file_info = tarfile.TarInfo(
                     name=f"{artifact_path_prefix}{item.remote_path}"
                 )
-                file_info.size = len(file_content)
-                tar.addfile(file_info, fileobj=io.BytesIO(file_content))
+                file_info.size = item.artifact.size()
+                with item.artifact.open() as stream:
+                    tar.addfile(file_info, fileobj=stream)
 
     def add_model_card(self, html_content: str | ModelCardBuilder) -> None:
         """
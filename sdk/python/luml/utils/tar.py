@@ -1,10 +1,17 @@
+import hashlib
 import json
+import os
 import tarfile
 import tempfile
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import BinaryIO
 
 from luml.modelref import DiskArtifact
 
+_CHUNK_SIZE = 1024 * 1024
+
 
 def generate_index(file: tarfile.TarFile) -> dict[str, tuple[int, int]]:
     index = {}
@@ -15,7 +22,90 @@ def generate_index(file: tarfile.TarFile) -> dict[str, tuple[int, int]]:
     return index
 
 
-def create_and_index_tar(source_dir: str | Path) -> tuple[DiskArtifact, DiskArtifact]:
+def _walk(path: Path) -> Iterator[Path]:
+    # same order as TarFile.add, which recurses into sorted directory listings
+    yield path
+    if path.is_dir():
+        for name in sorted(os.listdir(path)):
+            yield from _walk(path / name)
+
+
+class _HashingReader:
+    """Source file wrapper hashing the chunks ``TarFile.addfile`` copies.
+
+    Each chunk is hashed on ``pool`` while the next one is read and written,
+    waiting for the previous update first so the chunks are hashed in order.
+    """
+
+    def __init__(self, fileobj: BinaryIO, pool: ThreadPoolExecutor) -> None:
+        self._fileobj = fileobj
+        self._pool = pool
+        self._update: Future[None] | None = None
+        self._sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        if self._update is not None:
+            self._update.result()
+        self._update = self._pool.submit(self._sha256.update, data)
+        return data
+
+    def hexdigest(self) -> str:
+        if self._update is not None:
+            self._update.result()
+        return self._sha256.hexdigest()
+
+
+def write_indexed_tar(
+    source_dir: str | Path, tar_path: str | Path, hash_workers: int = 0
+) -> dict[str, tuple]:
+    """Writes ``source_dir`` to ``tar_path`` and returns the index of its files.
+
+    The index maps member names to ``(offset_data, size)``, recorded while the
+    members are written so the archive is never read back. With
+    ``hash_workers`` > 0 every file is also hashed from the chunks copied into
+    the archive, on a thread pool so hashing overlaps the I/O, and its SHA-256
+    is appended to the entry.
+    """
+    source_dir = Path(source_dir)
+    index: dict[str, tuple] = {}
+    pool = ThreadPoolExecutor(hash_workers) if hash_workers > 0 else None
+
+    try:
+        # hardlinked files (e.g. deduplicated attachments) are stored as regular
+        # members so each of them has its own data offset
+        with tarfile.open(
+            tar_path, "w", dereference=True, copybufsize=_CHUNK_SIZE
+        ) as tar:
+            for path in _walk(source_dir):
+                arcname = (
+                    Path(source_dir.name) / path.relative_to(source_dir)
+                ).as_posix()
+                info = tar.gettarinfo(path, arcname)
+                if info is None:
+                    continue
+                if not info.isfile():
+                    tar.addfile(info)
+                    continue
+
+                with open(path, "rb") as f:
+                    reader = None if pool is None else _HashingReader(f, pool)
+                    tar.addfile(info, reader or f)
+                # the data ends at the current offset, padded to a full block
+                padded_size = -(-info.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+                index[info.name] = (tar.offset - padded_size, info.size)
+                if reader is not None:
+                    index[info.name] += (reader.hexdigest(),)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return index
+
+
+def create_and_index_tar(
+    source_dir: str | Path, hash_workers: int = 0
+) -> tuple[DiskArtifact, DiskArtifact]:
     source_dir = Path(source_dir)
     if not source_dir.is_dir():
         raise ValueError(
@@ -25,10 +115,7 @@ def create_and_index_tar(source_dir: str | Path) -> tuple[DiskArtifact, DiskArti
     with tempfile.NamedTemporaryFile(delete=False) as temp_tar:
         tar_path = Path(temp_tar.name)
 
-    with tarfile.open(tar_path, "w") as tar:
-        tar.add(source_dir, arcname=source_dir.name)
-    with tarfile.open(tar_path, "r") as tar:
-        index_data = generate_index(tar)
+    index_data = write_indexed_tar(source_dir, tar_path, hash_workers)
 
     artifact = DiskArtifact(tar_path)
 
@@ -0,0 +1,689 @@
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from luml.api._exceptions import FileDownloadError, FileUploadError
+from luml.api._types import BucketType, PartDetails, UploadDetails
+from luml.api.utils.azure_file_handler import AsyncAzureFileHandler, AzureFileHandler
+from luml.api.utils.base_file_handler import iter_file_range
+from luml.api.utils.file_handler_factory import (
+    create_async_file_handler,
+    create_file_handler,
+)
+from luml.api.utils.s3_file_handler import AsyncS3FileHandler, S3FileHandler
+from luml.api.utils.upload_journal import UploadJournal
+
+PART_SIZE = 1024
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "luml.api.utils.base_file_handler._FileHandlerMixin._retry_delay",
+        staticmethod(lambda attempt: 0),
+    )
+
+
+@pytest.fixture
+def model_file(tmp_path: Path) -> Path:
+    path = tmp_path / "model.luml"
+    path.write_bytes(bytes(range(256)) * 10)
+    return path
+
+
+def _journal(
+    model_file: Path, tmp_path: Path, bucket_type: BucketType
+) -> UploadJournal:
+    return UploadJournal.start(
+        str(model_file),
+        UploadDetails(
+            type=bucket_type,
+            multipart=True,
+            bucket_location="models/model.luml",
+            bucket_secret_id="secret",
+        ),
+        upload_id="upload-1",
+        part_size=PART_SIZE,
+        journal_dir=tmp_path / "journal",
+    )
+
+
+def _parts(file_size: int) -> list[PartDetails]:
+    parts = []
+    for number, start in enumerate(range(0, file_size, PART_SIZE), start=1):
+        end = min(start + PART_SIZE, file_size) - 1
+        parts.append(
+            PartDetails(
+                part_number=number,
+                url=f"https://bucket.test/part/{number}",
+                start_byte=start,
+                end_byte=end,
+                part_size=end - start + 1,
+            )
+        )
+    return parts
+
+
+def test_iter_file_range_reads_bounded_chunks(model_file: Path) -> None:
+    data = model_file.read_bytes()
+    progress: list[int] = []
+
+    chunks = list(iter_file_range(str(model_file), 100, 1000, 300, progress.append))
+
+    assert [len(c) for c in chunks] == [300, 300, 300, 100]
+    assert b"".join(chunks) == data[100:1100]
+    assert sum(progress) == 1000
+    # ranges past the end of the file stop at the end
+    assert b"".join(iter_file_range(str(model_file), 2500, 1000, 300)) == data[2500:]
+
+
+def test_create_file_handler_settings() -> None:
+    handler = create_file_handler(BucketType.S3, max_concurrency=3, buffer_size=4096)
+    assert isinstance(handler, S3FileHandler)
+    assert (handler.max_concurrency, handler.buffer_size) == (3, 4096)
+    with pytest.raises(ValueError, match="buffer_size"):
+        S3FileHandler(buffer_size=0)
+
+
+@respx.mock
+def test_s3_multipart_upload_streams_parts(model_file: Path) -> None:
+    data = model_file.read_bytes()
+    received: dict[int, bytes] = {}
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def upload_part(request: httpx.Request, number: str) -> httpx.Response:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        received[int(number)] = request.read()
+        return httpx.Response(200, headers={"ETag": f'"etag-{number}"'})
+
+    respx.put(url__regex=r"https://bucket.test/part/(?P<number>\d+)").mock(
+        side_effect=upload_part
+    )
+    complete = respx.post("https://bucket.test/complete").respond(200)
+    parts = _parts(len(data))
+    # the last part is announced larger than what is left of the file
+    parts[-1].end_byte += PART_SIZE
+
+    S3FileHandler(max_concurrency=2, buffer_size=100).upload_multipart(
+        parts=parts,
+        complete_url="https://bucket.test/complete",
+        file_size=len(data),
+        file_path=str(model_file),
+        upload_id="upload-1",
+    )
+
+    assert peak == 2
+    assert b"".join(received[n] for n in sorted(received)) == data
+    body = complete.calls.last.request.content.decode()
+    assert body.index("etag-1") < body.index("etag-2") < body.index("etag-3")
+
+
+@respx.mock
+def test_azure_multipart_upload_streams_blocks(model_file: Path) -> None:
+    data = model_file.read_bytes()
+    blocks = respx.put(url__regex=r"https://bucket.test/part/\d+").respond(201)
+    commit = respx.put("https://bucket.test/complete").respond(201)
+
+    AzureFileHandler(buffer_size=100).upload_multipart(
+        parts=_parts(len(data)),
+        complete_url="https://bucket.test/complete",
+        file_size=len(data),
+        file_path=str(model_file),
+    )
+
+    uploaded = sorted(blocks.calls, key=lambda c: str(c.request.url))
+    assert b"".join(c.request.read() for c in uploaded) == data
+    body = commit.calls.last.request.content.decode()
+    for number in (1, 2, 3):
+        assert AzureFileHandler._get_block_id(number) in body
+
+
+@respx.mock
+def test_part_upload_retries_transient_errors(model_file: Path) -> None:
+    data = model_file.read_bytes()
+    attempts = {"count": 0}
+
+    def flaky(request: httpx.Request) -> httpx.Response:
+        attempts["count"] += 1
+        if attempts["count"] == 1:
+            raise httpx.ConnectError("connection reset")
+        if attempts["count"] == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, headers={"ETag": '"etag-1"'})
+
+    route = respx.put("https://bucket.test/part/1").mock(side_effect=flaky)
+    respx.post("https://bucket.test/complete").respond(200)
+
+    S3FileHandler().upload_multipart(
+        parts=_parts(len(data))[:1],
+        complete_url="https://bucket.test/complete",
+        file_size=len(data),
+        file_path=str(model_file),
+        upload_id="upload-1",
+    )
+
+    assert route.call_count == 3
+    assert route.calls.last.request.read() == data[:PART_SIZE]
+
+
+@respx.mock
+def test_part_upload_does_not_retry_client_errors(model_file: Path) -> None:
+    route = respx.put("https://bucket.test/part/1").respond(403)
+
+    with pytest.raises(FileUploadError):
+        S3FileHandler().upload_multipart(
+            parts=_parts(model_file.stat().st_size)[:1],
+            complete_url="https://bucket.test/complete",
+            file_size=model_file.stat().st_size,
+            file_path=str(model_file),
+            upload_id="upload-1",
+        )
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_s3_multipart_upload_resumes_from_journal(
+    model_file: Path, tmp_path: Path
+) -> None:
+    data = model_file.read_bytes()
+    journal = _journal(model_file, tmp_path, BucketType.S3)
+
+    def upload_part(request: httpx.Request, number: str) -> httpx.Response:
+        if number == "2":
+            return httpx.Response(500)
+        return httpx.Response(200, headers={"ETag": f'"etag-{number}"'})
+
+    parts_route = respx.put(url__regex=r"https://bucket.test/part/(?P<number>\d+)")
+    parts_route.mock(side_effect=upload_part)
+    complete = respx.post("https://bucket.test/complete").respond(200)
+    handler = S3FileHandler(max_retries=0)
+
+    with pytest.raises(FileUploadError):
+        handler.upload_multipart(
+            parts=_parts(len(data)),
+            complete_url="https://bucket.test/complete",
+            file_size=len(data),
+            file_path=str(model_file),
+            upload_id="upload-1",
+            journal=journal,
+        )
+    assert not complete.called
+
+    saved = UploadJournal.load(str(model_file), tmp_path / "journal")
+    assert saved is not None
+    assert saved.completed_parts == {1: "etag-1", 3: "etag-3"}
+
+    parts_route.reset()
+    parts_route.respond(200, headers={"ETag": '"etag-2"'})
+    handler.upload_multipart(
+        parts=_parts(len(data)),
+        complete_url="https://bucket.test/complete",
+        file_size=len(data),
+        file_path=str(model_file),
+        upload_id="upload-1",
+        journal=saved,
+    )
+
+    assert [str(c.request.url) for c in parts_route.calls] == [
+        "https://bucket.test/part/2"
+    ]
+    body = complete.calls.last.request.content.decode()
+    assert body.index("etag-1") < body.index("etag-2") < body.index("etag-3")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_azure_multipart_upload_resumes_from_journal(
+    model_file: Path, tmp_path: Path
+) -> None:
+    data = model_file.read_bytes()
+    journal = _journal(model_file, tmp_path, BucketType.AZURE)
+    journal.record_part(1, AzureFileHandler._get_block_id(1))
+    blocks = respx.put(url__regex=r"https://bucket.test/part/\d+").respond(201)
+    commit = respx.put("https://bucket.test/complete").respond(201)
+
+    await AsyncAzureFileHandler().upload_multipart(
+        parts=_parts(len(data)),
+        complete_url="https://bucket.test/complete",
+        file_size=len(data),
+        file_path=str(model_file),
+        journal=journal,
+    )
+
+    assert blocks.call_count == 2
+    assert set(journal.completed_parts) == {1, 2, 3}
+    body = commit.calls.last.request.content.decode()
+    assert re.findall(r"<Latest>(.*?)</Latest>", body) == sorted(
+        AzureFileHandler._get_block_id(number) for number in (1, 2, 3)
+    )
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_s3_multipart_upload_resumes_from_journal(
+    model_file: Path, tmp_path: Path
+) -> None:
+    data = model_file.read_bytes()
+    journal = _journal(model_file, tmp_path, BucketType.S3)
+    journal.record_part(1, "etag-1")
+    parts_route = respx.put(url__regex=r"https://bucket.test/part/(?P<number>\d+)")
+    parts_route.mock(
+        side_effect=lambda request, number: httpx.Response(
+            200, headers={"ETag": f'"etag-{number}"'}
+        )
+    )
+    complete = respx.post("https://bucket.test/complete").respond(200)
+
+    await AsyncS3FileHandler().upload_multipart(
+        parts=_parts(len(data)),
+        complete_url="https://bucket.test/complete",
+        file_size=len(data),
+        file_path=str(model_file),
+        upload_id="upload-1",
+        journal=journal,
+    )
+
+    assert parts_route.call_count == 2
+    body = complete.calls.last.request.content.decode()
+    assert re.findall(r"<PartNumber>(\d+)</PartNumber><ETag>(.*?)</ETag>", body) == [
+        ("1", "etag-1"),
+        ("2", "etag-2"),
+        ("3", "etag-3"),
+    ]
+
+
+def test_create_async_file_handler() -> None:
+    assert isinstance(create_async_file_handler(BucketType.S3), AsyncS3FileHandler)
+    handler = create_async_file_handler(BucketType.AZURE, max_concurrency=2)
+    assert isinstance(handler, AsyncAzureFileHandler)
+    assert handler.max_concurrency == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_s3_simple_upload(model_file: Path) -> None:
+    route = respx.put("https://bucket.test/model").respond(200)
+
+    await AsyncS3FileHandler().upload_simple(
+        "https://bucket.test/model", str(model_file), model_file.stat().st_size
+    )
+
+    assert route.calls.last.request.content == model_file.read_bytes()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_s3_multipart_upload_bounds_concurrency(model_file: Path) -> None:
+    data = model_file.read_bytes()
+    received: dict[int, bytes] = {}
+    in_flight = peak = 0
+
+    async def upload_part(request: httpx.Request, number: str) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        received[int(number)] = request.content
+        return httpx.Response(200, headers={"ETag": f'"etag-{number}"'})
+
+    respx.put(url__regex=r"https://bucket.test/part/(?P<number>\d+)").mock(
+        side_effect=upload_part
+    )
+    complete = respx.post("https://bucket.test/complete").respond(200)
+
+    await AsyncS3FileHandler(max_concurrency=2).upload_multipart(
+        parts=_parts(len(data)),
+        complete_url="https://bucket.test/complete",
+        file_size=len(data),
+        file_path=str(model_file),
+        upload_id="upload-1",
+    )
+
+    assert peak == 2
+    assert b"".join(received[n] for n in sorted(received)) == data
+    body = complete.calls.last.request.content.decode()
+    assert body.index("etag-1") < body.index("etag-2") < body.index("etag-3")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_s3_multipart_upload_failure(model_file: Path) -> None:
+    respx.put(url__regex=r"https://bucket.test/part/\d+").respond(500)
+    complete = respx.post("https://bucket.test/complete").respond(200)
+
+    with pytest.raises(FileUploadError, match="Multipart upload failed"):
+        await AsyncS3FileHandler(max_retries=0).upload_multipart(
+            parts=_parts(model_file.stat().st_size),
+            complete_url="https://bucket.test/complete",
+            file_size=model_file.stat().st_size,
+            file_path=str(model_file),
+            upload_id="upload-1",
+        )
+    assert not complete.called
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_s3_initiate_multipart_upload() -> None:
+    respx.post("https://bucket.test/initiate").respond(
+        200,
+        content=(
+            b'<InitiateMultipartUploadResult xmlns="http://s3.amazonaws.com/doc/'
+            b'2006-03-01/"><UploadId>upload-1</UploadId>'
+            b"</InitiateMultipartUploadResult>"
+        ),
+    )
+
+    upload_id = await AsyncS3FileHandler().initiate_multipart_upload(
+        "https://bucket.test/initiate"
+    )
+
+    assert upload_id == "upload-1"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_azure_multipart_upload_commits_block_list(
+    model_file: Path,
+) -> None:
+    data = model_file.read_bytes()
+    blocks = respx.put(url__regex=r"https://bucket.test/part/\d+").respond(201)
+    commit = respx.put("https://bucket.test/complete").respond(201)
+
+    await AsyncAzureFileHandler().upload_multipart(
+        parts=_parts(len(data)),
+        complete_url="https://bucket.test/complete",
+        file_size=len(data),
+        file_path=str(model_file),
+    )
+
+    assert blocks.call_count == 3
+    assert all(c.request.headers["x-ms-blob-type"] == "BlockBlob" for c in blocks.calls)
+    body = commit.calls.last.request.content.decode()
+    for number in (1, 2, 3):
+        assert AzureFileHandler._get_block_id(number) in body
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_download(tmp_path: Path) -> None:
+    payload = b"model-bytes" * 1000
+    respx.get("https://bucket.test/model").respond(200, content=payload)
+    target = tmp_path / "downloaded.luml"
+
+    result = await AsyncS3FileHandler().download_file_with_progress(
+        "https://bucket.test/model", str(target)
+    )
+
+    assert result == str(target)
+    assert target.read_bytes() == payload
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_download_failure(tmp_path: Path) -> None:
+    respx.get("https://bucket.test/model").respond(404)
+
+    with pytest.raises(FileDownloadError):
+        await AsyncS3FileHandler().download_file_with_progress(
+            "https://bucket.test/model", str(tmp_path / "downloaded.luml")
+        )
+
+
+PAYLOAD = bytes(range(256)) * 41  # 10,496 bytes
+
+
+def _serve_ranges(request: httpx.Request) -> httpx.Response:
+    byte_range = request.headers.get("Range")
+    if byte_range is None:
+        return httpx.Response(200, content=PAYLOAD)
+    start, end = (int(x) for x in byte_range.removeprefix("bytes=").split("-"))
+    end = min(end, len(PAYLOAD) - 1)
+    return httpx.Response(
+        206,
+        content=PAYLOAD[start : end + 1],
+        headers={"Content-Range": f"bytes {start}-{end}/{len(PAYLOAD)}"},
+    )
+
+
+def _ranged_handler() -> S3FileHandler:
+    handler = S3FileHandler(max_concurrency=3, buffer_size=256)
+    handler.download_part_size = 1000
+    return handler
+
+
+@respx.mock
+def test_ranged_download(tmp_path: Path) -> None:
+    route = respx.get("https://bucket.test/model").mock(side_effect=_serve_ranges)
+    target = tmp_path / "model.luml"
+
+    _ranged_handler().download_file_with_progress(
+        "https://bucket.test/model",
+        str(target),
+        file_hash=hashlib.sha256(PAYLOAD).hexdigest(),
+    )
+
+    assert target.read_bytes() == PAYLOAD
+    # the probe plus one request per part
+    assert route.call_count == 1 + 11
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["model.luml"]
+
+
+@respx.mock
+def test_ranged_download_resumes(tmp_path: Path) -> None:
+    failed = {"bytes=3000-3999"}
+
+    def flaky(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("Range") in failed:
+            return httpx.Response(403)
+        return _serve_ranges(request)
+
+    route = respx.get("https://bucket.test/model").mock(side_effect=flaky)
+    target = tmp_path / "model.luml"
+
+    with pytest.raises(FileDownloadError):
+        _ranged_handler().download_file_with_progress(
+            "https://bucket.test/model", str(target)
+        )
+    assert not target.exists()
+    assert (tmp_path / "model.luml.partial").stat().st_size == len(PAYLOAD)
+
+    failed.clear()
+    route.reset()
+    _ranged_handler().download_file_with_progress(
+        "https://bucket.test/model", str(target)
+    )
+
+    assert target.read_bytes() == PAYLOAD
+    assert [c.request.headers["Range"] for c in route.calls] == [
+        "bytes=0-0",
+        "bytes=3000-3999",
+    ]
+
+
+@respx.mock
+def test_ranged_download_verifies_hash(tmp_path: Path) -> None:
+    respx.get("https://bucket.test/model").mock(side_effect=_serve_ranges)
+    target = tmp_path / "model.luml"
+
+    with pytest.raises(FileDownloadError, match="does not match its hash"):
+        _ranged_handler().download_file_with_progress(
+            "https://bucket.test/model", str(target), file_hash="0" * 64
+        )
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_ranged_download(tmp_path: Path) -> None:
+    route = respx.get("https://bucket.test/model").mock(side_effect=_serve_ranges)
+    target = tmp_path / "model.luml"
+    handler = AsyncS3FileHandler(max_concurrency=3, buffer_size=256)
+    handler.download_part_size = 1000
+
+    await handler.download_file_with_progress(
+        "https://bucket.test/model",
+        str(target),
+        file_hash=hashlib.sha256(PAYLOAD).hexdigest(),
+    )
+
+    assert target.read_bytes() == PAYLOAD
+    assert route.call_count == 1 + 11
+
+
+@respx.mock
+def test_download_without_range_support_verifies_hash(tmp_path: Path) -> None:
+    route = respx.get("https://bucket.test/model").respond(200, content=PAYLOAD)
+    target = tmp_path / "model.luml"
+
+    with pytest.raises(FileDownloadError, match="does not match its hash"):
+        _ranged_handler().download_file_with_progress(
+            "https://bucket.test/model", str(target), file_hash="0" * 64
+        )
+    assert list(tmp_path.iterdir()) == []
+
+    _ranged_handler().download_file_with_progress(
+        "https://bucket.test/model",
+        str(target),
+        file_hash=hashlib.sha256(PAYLOAD).hexdigest(),
+    )
+    assert target.read_bytes() == PAYLOAD
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["model.luml"]
+    # the probe and the plain GET, for each download
+    assert route.call_count == 4
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_download_without_range_support_verifies_hash(
+    tmp_path: Path,
+) -> None:
+    respx.get("https://bucket.test/model").respond(200, content=PAYLOAD)
+    target = tmp_path / "model.luml"
+
+    with pytest.raises(FileDownloadError, match="does not match its hash"):
+        await AsyncS3FileHandler().download_file_with_progress(
+            "https://bucket.test/model", str(target), file_hash="0" * 64
+        )
+    assert list(tmp_path.iterdir()) == []
+
+
+def _serve_probe_only(request: httpx.Request) -> httpx.Response:
+    # a CDN that answers the probe with a range but part requests in full
+    if request.headers.get("Range") == "bytes=0-0":
+        return _serve_ranges(request)
+    return httpx.Response(200, content=PAYLOAD)
+
+
+@respx.mock
+def test_ranged_download_falls_back_when_parts_are_not_ranged(
+    tmp_path: Path,
+) -> None:
+    respx.get("https://bucket.test/model").mock(side_effect=_serve_probe_only)
+    target = tmp_path / "model.luml"
+
+    _ranged_handler().download_file_with_progress(
+        "https://bucket.test/model",
+        str(target),
+        file_hash=hashlib.sha256(PAYLOAD).hexdigest(),
+    )
+
+    assert target.read_bytes() == PAYLOAD
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["model.luml"]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_ranged_download_falls_back_when_parts_are_not_ranged(
+    tmp_path: Path,
+) -> None:
+    respx.get("https://bucket.test/model").mock(side_effect=_serve_probe_only)
+    target = tmp_path / "model.luml"
+    handler = AsyncS3FileHandler(max_concurrency=3, buffer_size=256)
+    handler.download_part_size = 1000
+
+    await handler.download_file_with_progress(
+        "https://bucket.test/model",
+        str(target),
+        file_hash=hashlib.sha256(PAYLOAD).hexdigest(),
+    )
+
+    assert target.read_bytes() == PAYLOAD
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["model.luml"]
+
+
+@respx.mock
+def test_ranged_download_ignores_bytes_past_the_range(tmp_path: Path) -> None:
+    def oversized(request: httpx.Request) -> httpx.Response:
+        # the requested range followed by the rest of the file
+        response = _serve_ranges(request)
+        start = int(request.headers["Range"].removeprefix("bytes=").split("-")[0])
+        return httpx.Response(
+            206,
+            content=PAYLOAD[start:],
+            headers={"Content-Range": response.headers["Content-Range"]},
+        )
+
+    respx.get("https://bucket.test/model").mock(side_effect=oversized)
+    target = tmp_path / "model.luml"
+
+    _ranged_handler().download_file_with_progress(
+        "https://bucket.test/model",
+        str(target),
+        file_hash=hashlib.sha256(PAYLOAD).hexdigest(),
+    )
+
+    assert target.read_bytes() == PAYLOAD
+
+
+@respx.mock
+def test_download_empty_file(tmp_path: Path) -> None:
+    route = respx.get("https://bucket.test/model").respond(
+        416, headers={"Content-Range": "bytes */0"}
+    )
+    target = tmp_path / "model.luml"
+
+    _ranged_handler().download_file_with_progress(
+        "https://bucket.test/model",
+        str(target),
+        file_hash=hashlib.sha256(b"").hexdigest(),
+    )
+
+    assert target.read_bytes() == b""
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["model.luml"]
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_download_falls_back_on_unsatisfiable_probe(
+    tmp_path: Path,
+) -> None:
+    def unsatisfiable(request: httpx.Request) -> httpx.Response:
+        if "Range" in request.headers:
+            return httpx.Response(416)
+        return httpx.Response(200, content=b"")
+
+    respx.get("https://bucket.test/model").mock(side_effect=unsatisfiable)
+    target = tmp_path / "model.luml"
+
+    await AsyncS3FileHandler().download_file_with_progress(
+        "https://bucket.test/model", str(target)
+    )
+
+    assert target.read_bytes() == b""
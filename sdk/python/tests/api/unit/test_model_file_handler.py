@@ -0,0 +1,79 @@
+import hashlib
+import io
+import json
+import tarfile
+from pathlib import Path
+from typing import IO, Any
+
+import pytest
+
+from luml.api.utils import model_artifacts
+from luml.api.utils.model_artifacts import ModelFileHandler
+
+MANIFEST = {"variant": "pipeline", "producer_tags": []}
+METADATA = [
+    {
+        "producer_tags": ["dataforce.studio::registry_metrics:v1"],
+        "payload": {"metrics": {"F1": 0.9}},
+    }
+]
+
+
+@pytest.fixture
+def model_file(tmp_path: Path) -> Path:
+    path = tmp_path / "model.luml"
+    with tarfile.open(path, "w") as tar:
+        for name, data in [
+            ("manifest.json", json.dumps(MANIFEST).encode()),
+            ("weights/model.bin", bytes(range(256)) * 40),
+            ("meta.json", json.dumps(METADATA).encode()),
+        ]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return path
+
+
+def test_model_details_are_collected_in_one_read(
+    model_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    opened = []
+
+    def counting_open(path: str, *args: Any, **kwargs: Any) -> IO:  # noqa: ANN401
+        opened.append(path)
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(model_artifacts, "open", counting_open, raising=False)
+
+    details = ModelFileHandler(str(model_file)).model_details()
+
+    assert opened == [str(model_file)]
+    assert details.file_hash == hashlib.sha256(model_file.read_bytes()).hexdigest()
+    assert details.manifest == MANIFEST
+    assert details.metrics == {"F1": 0.9}
+    with tarfile.open(model_file) as tar:
+        assert details.file_index == {
+            m.name: (m.offset_data, m.size) for m in tar.getmembers()
+        }
+
+
+def test_file_that_is_not_a_tar(tmp_path: Path) -> None:
+    path = tmp_path / "model.luml"
+    path.write_bytes(b"not a tar archive" * 100)
+    handler = ModelFileHandler(str(path))
+
+    assert handler.get_file_hash() == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert handler.get_metadata() == []
+    with pytest.raises(tarfile.ReadError):
+        handler.get_manifest()
+
+
+def test_missing_manifest(tmp_path: Path) -> None:
+    path = tmp_path / "model.luml"
+    with tarfile.open(path, "w") as tar:
+        info = tarfile.TarInfo("weights.bin")
+        info.size = 3
+        tar.addfile(info, io.BytesIO(b"abc"))
+
+    with pytest.raises(KeyError, match="manifest.json"):
+        ModelFileHandler(str(path)).get_manifest()
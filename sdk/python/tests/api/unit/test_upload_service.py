@@ -0,0 +1,159 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import respx
+
+from luml.api._exceptions import FileUploadError
+from luml.api._types import (
+    BucketType,
+    MultiPartUploadDetails,
+    PartDetails,
+    UploadDetails,
+)
+from luml.api.services.upload_service import UploadService
+from luml.api.utils.upload_journal import UploadJournal
+
+PART_SIZE = 1024
+INITIATE_RESPONSE = (
+    b'<InitiateMultipartUploadResult xmlns="http://s3.amazonaws.com/doc/'
+    b'2006-03-01/"><UploadId>upload-1</UploadId></InitiateMultipartUploadResult>'
+)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "luml.api.utils.base_file_handler._FileHandlerMixin._retry_delay",
+        staticmethod(lambda attempt: 0),
+    )
+
+
+@pytest.fixture
+def model_file(tmp_path: Path) -> Path:
+    path = tmp_path / "model.luml"
+    path.write_bytes(bytes(range(256)) * 10)
+    return path
+
+
+@pytest.fixture
+def bucket_secrets(model_file: Path) -> Mock:
+    file_size = model_file.stat().st_size
+    parts = [
+        PartDetails(
+            part_number=number,
+            url=f"https://bucket.test/part/{number}",
+            start_byte=start,
+            end_byte=min(start + PART_SIZE, file_size) - 1,
+            part_size=PART_SIZE,
+        )
+        for number, start in enumerate(range(0, file_size, PART_SIZE), start=1)
+    ]
+    mock = Mock()
+    mock.get_multipart_upload_urls.return_value = MultiPartUploadDetails(
+        type=BucketType.S3,
+        upload_id="upload-1",
+        parts=parts,
+        complete_url="https://bucket.test/complete",
+    )
+    return mock
+
+
+UPLOAD_DETAILS = UploadDetails(
+    type=BucketType.S3,
+    url="https://bucket.test/initiate",
+    multipart=True,
+    bucket_location="models/model.luml",
+    bucket_secret_id="secret",
+)
+
+
+def _upload(service: UploadService, model_file: Path) -> httpx.Response:
+    return service.upload_file(
+        upload_details=UPLOAD_DETAILS,
+        file_path=str(model_file),
+        file_size=model_file.stat().st_size,
+        model_id="model-1",
+    )
+
+
+@respx.mock
+def test_failed_multipart_upload_is_resumed(
+    model_file: Path, tmp_path: Path, bucket_secrets: Mock
+) -> None:
+    journal_dir = tmp_path / "journal"
+    respx.post("https://bucket.test/initiate").respond(200, content=INITIATE_RESPONSE)
+    parts = respx.put(url__regex=r"https://bucket.test/part/(?P<number>\d+)")
+    parts.mock(
+        side_effect=lambda request, number: httpx.Response(
+            503 if number == "3" else 200, headers={"ETag": f'"etag-{number}"'}
+        )
+    )
+    complete = respx.post("https://bucket.test/complete").respond(200)
+    service = UploadService(bucket_secrets, journal_dir=journal_dir)
+
+    with pytest.raises(FileUploadError):
+        _upload(service, model_file)
+
+    journal = UploadJournal.load(str(model_file), journal_dir)
+    assert journal is not None
+    assert journal.model_id == "model-1"
+    assert journal.upload_id == "upload-1"
+    assert set(journal.completed_parts) == {1, 2}
+
+    parts.reset()
+    parts.respond(200, headers={"ETag": '"etag-3"'})
+    service.resume_upload(journal)
+
+    bucket_secrets.get_multipart_upload_urls.assert_called_with(
+        "secret", "models/model.luml", model_file.stat().st_size, "upload-1"
+    )
+    assert [str(c.request.url) for c in parts.calls] == ["https://bucket.test/part/3"]
+    assert "etag-3" in complete.calls.last.request.content.decode()
+    assert UploadJournal.load(str(model_file), journal_dir) is None
+
+
+@respx.mock
+def test_completed_upload_removes_journal(
+    model_file: Path, tmp_path: Path, bucket_secrets: Mock
+) -> None:
+    journal_dir = tmp_path / "journal"
+    respx.post("https://bucket.test/initiate").respond(200, content=INITIATE_RESPONSE)
+    respx.put(url__regex=r"https://bucket.test/part/\d+").respond(200)
+    respx.post("https://bucket.test/complete").respond(200)
+
+    _upload(UploadService(bucket_secrets, journal_dir=journal_dir), model_file)
+
+    assert list(journal_dir.iterdir()) == []
+
+
+def test_resume_rejects_changed_part_layout(
+    model_file: Path, tmp_path: Path, bucket_secrets: Mock
+) -> None:
+    journal = UploadJournal.start(
+        str(model_file),
+        UPLOAD_DETAILS,
+        upload_id="upload-1",
+        part_size=PART_SIZE * 2,
+        journal_dir=tmp_path / "journal",
+    )
+
+    with pytest.raises(FileUploadError, match="part size changed"):
+        UploadService(bucket_secrets).resume_upload(journal)
+
+
+def test_journal_is_not_found_for_modified_file(
+    model_file: Path, tmp_path: Path
+) -> None:
+    UploadJournal.start(
+        str(model_file),
+        UPLOAD_DETAILS,
+        upload_id="upload-1",
+        part_size=PART_SIZE,
+        journal_dir=tmp_path,
+    )
+    assert UploadJournal.load(str(model_file), tmp_path) is not None
+
+    model_file.write_bytes(b"changed")
+    assert UploadJournal.load(str(model_file), tmp_path) is None
@@ -0,0 +1,16 @@
+from pathlib import Path
+
+import pytest
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+
+
+@pytest.fixture
+def backend(tmp_path: Path) -> SQLiteBackend:
+    return SQLiteBackend(str(tmp_path / "experiments"))
+
+
+@pytest.fixture
+def experiment_id(backend: SQLiteBackend) -> str:
+    backend.initialize_experiment("exp-1", name="Experiment 1")
+    return "exp-1"
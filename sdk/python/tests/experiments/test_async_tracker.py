@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from luml.experiments.tracker import AsyncExperimentTracker
+
+
+@pytest_asyncio.fixture
+async def tracker(tmp_path: Path) -> AsyncIterator[AsyncExperimentTracker]:
+    async with AsyncExperimentTracker(f"sqlite://{tmp_path / 'experiments'}") as t:
+        yield t
+
+
+@pytest.mark.asyncio
+async def test_reads_see_earlier_writes(tracker: AsyncExperimentTracker) -> None:
+    exp_id = await tracker.start_experiment(name="async")
+    await tracker.log_static("lr", 0.1)
+    for step in range(5):
+        await tracker.log_dynamic("loss", 1 / (step + 1), step=step)
+    await tracker.log_spans(
+        iter(
+            [
+                {
+                    "trace_id": "t",
+                    "span_id": "s",
+                    "name": "root",
+                    "start_time_unix_nano": 0,
+                    "end_time_unix_nano": 1,
+                }
+            ]
+        )
+    )
+
+    data = await tracker.get_experiment(exp_id)
+    assert data["static_params"]["lr"] == 0.1
+    assert len(data["dynamic_metrics"]["loss"]) == 5
+    assert (await tracker.get_trace("t"))["span_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_logging_does_not_wait_for_the_database(
+    tracker: AsyncExperimentTracker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await tracker.start_experiment()
+    release = threading.Event()
+    log_static = tracker.backend.log_static
+
+    def slow_log_static(*args: object) -> None:
+        release.wait(5)
+        log_static(*args)
+
+    monkeypatch.setattr(tracker.backend, "log_static", slow_log_static)
+
+    started = time.perf_counter()
+    for i in range(10):
+        await tracker.log_static(f"p{i}", i)
+    assert time.perf_counter() - started < 1
+
+    release.set()
+    await tracker.flush()
+    data = await tracker.get_experiment(tracker.current_experiment_id)
+    assert len(data["static_params"]) == 10
+
+
+@pytest.mark.asyncio
+async def test_write_errors_are_reported_by_flush(
+    tracker: AsyncExperimentTracker,
+) -> None:
+    await tracker.log_static("lr", 0.1)
+
+    with pytest.raises(ValueError, match="No active experiment"):
+        await tracker.flush()
+    await tracker.flush()
+
+    with pytest.raises(ValueError, match="No active experiment"):
+        await tracker.end_experiment()
+
+
+@pytest.mark.asyncio
+async def test_pending_writes_are_bounded(tmp_path: Path) -> None:
+    tracker = AsyncExperimentTracker(
+        f"sqlite://{tmp_path / 'experiments'}", max_pending_writes=2
+    )
+    await tracker.start_experiment()
+
+    await asyncio.gather(*(tracker.log_dynamic("x", i, step=i) for i in range(50)))
+    assert len(tracker._pending) <= 2
+
+    await tracker.aclose()
+    with pytest.raises(RuntimeError, match="closed"):
+        await tracker.log_static("late", 1)
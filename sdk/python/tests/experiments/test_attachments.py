@@ -0,0 +1,73 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+
+
+def test_attachments_are_deduplicated_across_experiments(
+    backend: SQLiteBackend, experiment_id: str, tmp_path: Path
+) -> None:
+    source = tmp_path / "vocab.txt"
+    source.write_bytes(b"token\n" * 1000)
+    backend.initialize_experiment("exp-2")
+
+    backend.log_attachment_file(experiment_id, "vocab.txt", source)
+    backend.log_attachment_file("exp-2", "tokenizer/vocab.txt", str(source))
+
+    first = backend.get_attachment_path(experiment_id, "vocab.txt")
+    second = backend.get_attachment_path("exp-2", "tokenizer/vocab.txt")
+    assert first.stat().st_ino == second.stat().st_ino
+    assert len(list(backend.blobs.root.glob("*/*"))) == 1
+
+    data = backend.get_experiment_data(experiment_id)["attachments"]["vocab.txt"]
+    assert data["size"] == 6000
+    assert len(data["sha256"]) == 64
+
+
+def test_attachment_reads(backend: SQLiteBackend, experiment_id: str) -> None:
+    backend.log_attachment(experiment_id, "notes.txt", "hello")
+    backend.log_attachment_file(experiment_id, "blob.bin", io.BytesIO(b"\x00\x01"))
+
+    assert backend.get_attachment(experiment_id, "notes.txt") == b"hello"
+    with backend.open_attachment(experiment_id, "blob.bin") as f:
+        assert f.read() == b"\x00\x01"
+    mapped = backend.map_attachment(experiment_id, "notes.txt")
+    assert mapped[:] == b"hello"
+    mapped.close()
+
+    with pytest.raises(ValueError, match="not found"):
+        backend.open_attachment(experiment_id, "missing.txt")
+
+
+def test_unreferenced_blobs_are_released(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    backend.initialize_experiment("exp-2")
+    backend.log_attachment(experiment_id, "shared.txt", "shared")
+    backend.log_attachment("exp-2", "shared.txt", "shared")
+    backend.log_attachment(experiment_id, "own.txt", "v1")
+
+    # replacing an attachment drops the old content's blob
+    backend.log_attachment(experiment_id, "own.txt", "v2")
+    assert len(list(backend.blobs.root.glob("*/*"))) == 2
+
+    backend.delete_experiment(experiment_id)
+    assert len(list(backend.blobs.root.glob("*/*"))) == 1
+    assert backend.get_attachment("exp-2", "shared.txt") == b"shared"
+
+
+def test_duplicate_attachments_export_as_regular_files(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    backend.log_attachment(experiment_id, "a.txt", "same")
+    backend.log_attachment(experiment_id, "b.txt", "same")
+
+    tar_artifact, index_artifact = backend.export_attachments(experiment_id)
+    index = index_artifact.get_artifact()
+    assert {Path(name).name for name in json.loads(index)} == {
+        "a.txt",
+        "b.txt",
+    }
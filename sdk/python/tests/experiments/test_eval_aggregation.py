@@ -0,0 +1,65 @@
+import pytest
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+
+
+@pytest.fixture
+def evals_backend(backend: SQLiteBackend, experiment_id: str) -> SQLiteBackend:
+    backend.log_eval_samples(
+        experiment_id,
+        [
+            {
+                "eval_id": f"e{i}",
+                "dataset_id": "qa" if i < 100 else "chat",
+                "inputs": {"q": i},
+                "scores": {
+                    "accuracy": i % 100,
+                    "exact.match": i % 2 == 0,
+                    "label": "text scores are ignored",
+                },
+            }
+            for i in range(150)
+        ],
+    )
+    return backend
+
+
+def test_aggregate_evals_per_dataset_and_key(
+    evals_backend: SQLiteBackend, experiment_id: str
+) -> None:
+    stats = evals_backend.aggregate_evals(experiment_id, percentiles=(50, 99.5))
+
+    assert set(stats) == {"qa", "chat"}
+    assert set(stats["qa"]) == {"accuracy", "exact.match"}
+    assert stats["qa"]["accuracy"] == {
+        "count": 100,
+        "mean": 49.5,
+        "min": 0,
+        "max": 99,
+        "p50": 49,
+        "p99.5": 99,
+    }
+    assert stats["chat"]["exact.match"]["mean"] == 0.5
+    assert stats["chat"]["accuracy"]["count"] == 50
+
+
+def test_materialized_scores_give_same_results(
+    evals_backend: SQLiteBackend, experiment_id: str
+) -> None:
+    expected = evals_backend.aggregate_evals(experiment_id)
+
+    evals_backend.materialize_eval_scores(experiment_id, ["accuracy", "exact.match"])
+    evals_backend.materialize_eval_scores(experiment_id, ["accuracy"])
+    evals_backend.log_eval_sample(
+        experiment_id, "late", "chat", {"q": 0}, scores={"accuracy": 1000}
+    )
+
+    stats = evals_backend.aggregate_evals(experiment_id)
+    assert stats["qa"] == expected["qa"]
+    assert stats["chat"]["accuracy"]["max"] == 1000
+    assert stats["chat"]["accuracy"]["count"] == 51
+
+    filtered = evals_backend.aggregate_evals(
+        experiment_id, dataset_id="qa", score_keys=["exact.match"]
+    )
+    assert filtered == {"qa": {"exact.match": expected["qa"]["exact.match"]}}
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+
+
+def test_metrics_since_returns_only_new_points(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    backend.log_dynamic_series(experiment_id, "loss", [1.0, 0.5])
+    backend.log_dynamic(experiment_id, "acc", 0.1)
+
+    first = backend.get_metrics_since(experiment_id)
+    assert [p["step"] for p in first["items"]["loss"]] == [0, 1]
+    assert first["cursor"] == {"loss": 1, "acc": 0}
+
+    backend.log_dynamic(experiment_id, "loss", 0.25)
+    backend.log_dynamic(experiment_id, "lr", 0.01)
+
+    second = backend.get_metrics_since(experiment_id, first["cursor"])
+    assert second["items"] == {
+        "loss": [{"value": 0.25, "step": 2}],
+        "lr": [{"value": 0.01, "step": 0}],
+    }
+    assert second["cursor"] == {"loss": 2, "acc": 0, "lr": 0}
+
+    assert backend.get_metrics_since(experiment_id, second["cursor"])["items"] == {}
+
+
+def test_metrics_since_flushes_buffer(tmp_path: Path) -> None:
+    backend = SQLiteBackend(str(tmp_path), buffered=True, flush_size=100)
+    backend.initialize_experiment("exp-1")
+    backend.log_dynamic("exp-1", "loss", 1.0)
+
+    assert backend.get_metrics_since("exp-1")["cursor"] == {"loss": 0}
+
+
+def test_spans_since_uses_ingest_order(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    def span(span_id: str, start: int, parent: str | None = None) -> dict:
+        return {
+            "trace_id": "t" * 32,
+            "span_id": span_id,
+            "name": span_id,
+            "start_time_unix_nano": start,
+            "end_time_unix_nano": start + 10,
+            "parent_span_id": parent,
+        }
+
+    backend.log_spans(experiment_id, [span("child", 200, parent="root")])
+    first = backend.get_spans_since(experiment_id)
+    assert [s["span_id"] for s in first["items"]] == ["child"]
+
+    # the parent ends last and is stored after its child despite starting earlier
+    backend.log_spans(experiment_id, [span("root", 100)])
+    second = backend.get_spans_since(experiment_id, first["cursor"])
+    assert [s["span_id"] for s in second["items"]] == ["root"]
+
+    empty = backend.get_spans_since(experiment_id, second["cursor"])
+    assert empty == {"items": [], "cursor": second["cursor"]}
+
+
+def test_evals_since_pages_and_filters(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    backend.log_eval_samples(
+        experiment_id,
+        [
+            {
+                "eval_id": f"e{i}",
+                "dataset_id": "a" if i % 2 else "b",
+                "inputs": {"i": i},
+            }
+            for i in range(5)
+        ],
+    )
+
+    page = backend.get_evals_since(experiment_id, limit=3)
+    assert [e["eval_id"] for e in page["items"]] == ["e0", "e1", "e2"]
+    rest = backend.get_evals_since(experiment_id, page["cursor"])
+    assert [e["eval_id"] for e in rest["items"]] == ["e3", "e4"]
+    assert rest["items"][0]["inputs"] == {"i": 3}
+
+    only_a = backend.get_evals_since(experiment_id, dataset_id="a")
+    assert [e["eval_id"] for e in only_a["items"]] == ["e1", "e3"]
@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+
+
+@pytest.fixture
+def runs(backend: SQLiteBackend) -> SQLiteBackend:
+    for i, (group, tags) in enumerate(
+        [("a", ["baseline"]), ("a", ["tuned", "gpu"]), ("b", ["tuned"]), ("b", None)]
+    ):
+        exp_id = f"run-{i}"
+        backend.initialize_experiment(exp_id, group=group, tags=tags)
+        backend.log_dynamic_series(exp_id, "loss", [1.0, 0.1 * (i + 1), 0.5])
+    backend.end_experiment("run-0")
+    return backend
+
+
+def test_list_experiments_filters(runs: SQLiteBackend) -> None:
+    assert [e["id"] for e in runs.list_experiments(group="a")] == ["run-0", "run-1"]
+    assert [e["id"] for e in runs.list_experiments(tags=["tuned"])] == [
+        "run-1",
+        "run-2",
+    ]
+    assert [e["id"] for e in runs.list_experiments(tags=["tuned", "gpu"])] == ["run-1"]
+    assert [e["id"] for e in runs.list_experiments(status="completed")] == ["run-0"]
+
+
+def test_list_experiments_keyset_pagination(runs: SQLiteBackend) -> None:
+    first = runs.list_experiments(limit=3, descending=True)
+    assert [e["id"] for e in first] == ["run-3", "run-2", "run-1"]
+    rest = runs.list_experiments(limit=3, descending=True, start_after=first[-1]["id"])
+    assert [e["id"] for e in rest] == ["run-0"]
+
+
+def test_list_experiments_orders_by_metric_summary(runs: SQLiteBackend) -> None:
+    runs.initialize_experiment("no-metrics")
+
+    leaderboard = runs.list_experiments(
+        order_by_metric="loss", metric_summary="min", limit=2
+    )
+    assert [e["id"] for e in leaderboard] == ["run-0", "run-1"]
+    assert leaderboard[0]["metrics"]["loss"] == pytest.approx(
+        {"last": 0.5, "min": 0.1, "max": 1.0}
+    )
+
+    rest = runs.list_experiments(
+        order_by_metric="loss", metric_summary="min", start_after="run-1"
+    )
+    assert [e["id"] for e in rest] == ["run-2", "run-3"]
+
+    with pytest.raises(ValueError, match="Unknown metric summary"):
+        runs.list_experiments(order_by_metric="loss", metric_summary="median")
+
+
+def test_metric_summaries_follow_logging(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    backend.log_dynamic(experiment_id, "acc", 0.4)
+    backend.log_dynamic_many(experiment_id, {"acc": 0.9, "lr": 0.01})
+    backend.log_dynamic(experiment_id, "acc", 0.2, step=0)
+
+    (experiment,) = backend.list_experiments()
+    # "last" tracks the highest step, not the most recent write
+    assert experiment["metrics"]["acc"] == {"last": 0.9, "min": 0.2, "max": 0.9}
+    assert experiment["metrics"]["lr"] == {"last": 0.01, "min": 0.01, "max": 0.01}
+
+    backend.delete_experiment(experiment_id)
+    conn = backend._get_meta_connection()
+    assert conn.execute("SELECT COUNT(*) FROM metric_summaries").fetchone() == (0,)
+
+
+def test_overwritten_step_updates_min_and_max(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    backend.log_dynamic_series(experiment_id, "loss", [0.4, 0.9, 0.6])
+    backend.log_dynamic(experiment_id, "loss", 0.5, step=1)
+    backend.log_dynamic(experiment_id, "loss", 0.7, step=0)
+
+    (experiment,) = backend.list_experiments()
+    assert experiment["metrics"]["loss"] == {"last": 0.6, "min": 0.5, "max": 0.7}
+    leaderboard = backend.list_experiments(order_by_metric="loss", metric_summary="max")
+    assert leaderboard[0]["metrics"]["loss"]["max"] == 0.7
+
+
+def test_logging_does_not_wait_for_meta_db(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    release = threading.Event()
+    meta_writer = backend.pool.get_writer(backend.meta_db_path)
+    blocked = meta_writer.submit(lambda conn: release.wait(5))
+
+    backend.log_dynamic(experiment_id, "acc", 0.4)
+    backend.log_dynamic_many(experiment_id, {"acc": 0.9, "lr": 0.01})
+    assert not blocked.done()
+
+    release.set()
+    (experiment,) = backend.list_experiments()
+    assert experiment["metrics"]["acc"] == {"last": 0.9, "min": 0.4, "max": 0.9}
@@ -0,0 +1,48 @@
+import pytest
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+
+np = pytest.importorskip("numpy")
+
+
+def test_get_metric_arrays_full_resolution(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    backend.log_dynamic_series(experiment_id, "loss", np.arange(100, dtype=float))
+    backend.log_dynamic_series(experiment_id, "acc", [0.1, 0.2, 0.3])
+
+    arrays = backend.get_metric_arrays(experiment_id)
+
+    assert set(arrays) == {"loss", "acc"}
+    assert arrays["loss"]["steps"].dtype == np.int64
+    np.testing.assert_array_equal(arrays["loss"]["values"], np.arange(100))
+    np.testing.assert_array_equal(arrays["acc"]["steps"], [0, 1, 2])
+
+
+def test_get_metric_arrays_step_range(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    backend.log_dynamic_series(experiment_id, "loss", np.arange(100, dtype=float))
+
+    arrays = backend.get_metric_arrays(experiment_id, ["loss"], step_range=(10, 20))
+
+    np.testing.assert_array_equal(arrays["loss"]["steps"], np.arange(10, 20))
+
+
+def test_get_metric_arrays_downsampling_keeps_extremes(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    values = np.sin(np.linspace(0, 20, 100_000))
+    values[54_321] = 10.0
+    values[77_777] = -10.0
+    backend.log_dynamic_series(experiment_id, "signal", values)
+
+    arrays = backend.get_metric_arrays(experiment_id, ["signal"], max_points=500)
+    steps, downsampled = arrays["signal"]["steps"], arrays["signal"]["values"]
+
+    assert len(steps) <= 500
+    assert np.all(np.diff(steps) > 0)
+    assert downsampled.max() == 10.0
+    assert downsampled.min() == -10.0
+    assert 54_321 in steps
+    assert 77_777 in steps
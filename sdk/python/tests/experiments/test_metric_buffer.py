@@ -0,0 +1,32 @@
+import pytest
+
+from luml.experiments.backends._buffer import MetricBuffer, MetricRow
+
+
+def test_failed_flush_keeps_rows_pending() -> None:
+    written: dict[str, list[MetricRow]] = {}
+    failing = {"exp-1"}
+
+    def flush_fn(experiment_id: str, rows: list[MetricRow]) -> None:
+        if experiment_id in failing:
+            raise OSError("disk full")
+        written.setdefault(experiment_id, []).extend(rows)
+
+    buffer = MetricBuffer(flush_fn, flush_interval=60)
+    buffer.add("exp-1", "loss", 1.0, 0)
+    buffer.add("exp-2", "loss", 2.0, 0)
+    buffer.add("exp-3", "loss", 3.0, 0)
+
+    with pytest.raises(OSError, match="disk full"):
+        buffer.flush()
+
+    # the other experiments are written despite the failure
+    assert written == {"exp-2": [("loss", 2.0, 0)], "exp-3": [("loss", 3.0, 0)]}
+    assert buffer.pending() == 1
+
+    buffer.add("exp-1", "loss", 0.5, 1)
+    failing.clear()
+    buffer.close()
+
+    assert written["exp-1"] == [("loss", 1.0, 0), ("loss", 0.5, 1)]
+    assert buffer.pending() == 0
@@ -0,0 +1,91 @@
+import io
+import sqlite3
+import tarfile
+import threading
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+from luml.experiments.tracker import ExperimentTracker
+from luml.modelref import ModelReference
+
+
+@pytest.fixture
+def tracker(tmp_path: Path) -> ExperimentTracker:
+    tracker = ExperimentTracker(f"sqlite://{tmp_path / 'experiments'}")
+    tracker.start_experiment("exp-1")
+    tracker.log_dynamic_series("loss", [1.0, 0.5, 0.25])
+    tracker.log_attachment("notes.txt", "hello")
+    return tracker
+
+
+def _linked_member(model_path: Path, suffix: str) -> bytes:
+    with tarfile.open(model_path) as tar:
+        (name,) = [n for n in tar.getnames() if n.endswith(suffix)]
+        member = tar.extractfile(name)
+        assert member is not None
+        return member.read()
+
+
+def _count_metrics(db_bytes: bytes, tmp_path: Path) -> int:
+    db_path = tmp_path / "restored.db"
+    db_path.write_bytes(db_bytes)
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM dynamic_metrics").fetchone()[0]
+
+
+@pytest.mark.parametrize(
+    ("compression", "compress_type"),
+    [("deflate", zipfile.ZIP_DEFLATED), ("none", zipfile.ZIP_STORED)],
+)
+def test_link_to_model_zip_snapshot(
+    tracker: ExperimentTracker, tmp_path: Path, compression: str, compress_type: int
+) -> None:
+    model_path = tmp_path / "model.luml"
+    tarfile.open(model_path, "w").close()
+
+    tracker.link_to_model(ModelReference(str(model_path)), compression=compression)
+
+    with zipfile.ZipFile(io.BytesIO(_linked_member(model_path, "exp.db.zip"))) as zf:
+        assert zf.getinfo("exp.db").compress_type == compress_type
+        assert _count_metrics(zf.read("exp.db"), tmp_path) == 3
+
+
+def test_link_to_model_zstd_snapshot(
+    tracker: ExperimentTracker, tmp_path: Path
+) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    model_path = tmp_path / "model.luml"
+    tarfile.open(model_path, "w").close()
+
+    tracker.link_to_model(ModelReference(str(model_path)), compression="zstd")
+
+    compressed = _linked_member(model_path, "exp.db.zst")
+    with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(compressed)) as reader:
+        assert _count_metrics(reader.read(), tmp_path) == 3
+
+
+def test_snapshot_while_writing(
+    backend: SQLiteBackend, experiment_id: str, tmp_path: Path
+) -> None:
+    stop = threading.Event()
+
+    def log_metrics() -> None:
+        while not stop.is_set():
+            backend.log_dynamic(experiment_id, "loss", 1.0)
+
+    writer = threading.Thread(target=log_metrics)
+    writer.start()
+    try:
+        snapshot = backend.snapshot_experiment_db(experiment_id, tmp_path / "snap.db")
+    finally:
+        stop.set()
+        writer.join()
+
+    with sqlite3.connect(snapshot.path) as conn:
+        assert conn.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+        steps = [row[0] for row in conn.execute("SELECT step FROM dynamic_metrics")]
+    # a consistent snapshot holds a gap-free prefix of the logged steps
+    assert steps == list(range(len(steps)))
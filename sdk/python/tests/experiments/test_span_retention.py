@@ -0,0 +1,118 @@
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+
+
+def _trace(trace_id: str, start: int, spans: int = 2, error: bool = False) -> list:
+    return [
+        {
+            "trace_id": trace_id,
+            "span_id": f"{trace_id}-{i}",
+            "name": "step",
+            "start_time_unix_nano": start + i,
+            "end_time_unix_nano": start + i + 1,
+            "parent_span_id": None if i == 0 else f"{trace_id}-0",
+            "status_code": 2 if error and i == spans - 1 else 1,
+            "attributes": {"gen_ai.prompt.0.content": "x" * 500, "i": i},
+        }
+        for i in range(spans)
+    ]
+
+
+def _trace_ids(backend: SQLiteBackend) -> set[str]:
+    return {t["trace_id"] for t in backend.list_traces("exp-1", limit=1000)["items"]}
+
+
+def test_compressed_spans_round_trip(tmp_path: Path) -> None:
+    pytest.importorskip("zstandard")
+    backend = SQLiteBackend(
+        str(tmp_path / "experiments"), span_compression=True, span_search=True
+    )
+    backend.initialize_experiment("exp-1")
+    spans = _trace("t1", 0)
+    backend.log_spans("exp-1", spans)
+
+    [stored] = backend.query_spans("exp-1", trace_id="t1", limit=1)["items"]
+    assert stored["attributes"] == spans[0]["attributes"]
+    assert backend.search_spans("exp-1", "x" * 500)
+
+    conn = sqlite3.connect(backend._get_experiment_db_path("exp-1"))
+    [(kind,)] = conn.execute("SELECT DISTINCT typeof(attributes) FROM spans")
+    assert kind == "blob"
+    conn.close()
+
+
+def test_retention_by_span_budget_and_age(tmp_path: Path) -> None:
+    now = time.time_ns()
+    backend = SQLiteBackend(
+        str(tmp_path / "experiments"),
+        retention_max_age="3600",
+        retention_max_spans="4",
+        retention_interval="0",
+    )
+    backend.initialize_experiment("exp-1")
+    backend.log_spans("exp-1", _trace("ancient", now - 2 * 3600 * 10**9))
+    for i in range(3):
+        backend.log_spans("exp-1", _trace(f"t{i}", now + i))
+
+    assert _trace_ids(backend) == {"t1", "t2"}
+    with pytest.raises(ValueError, match="not found"):
+        backend.get_trace("exp-1", "t0")
+
+
+def test_retention_samples_only_successful_traces(tmp_path: Path) -> None:
+    backend = SQLiteBackend(
+        str(tmp_path / "experiments"), retention_success_sample_rate="0.3"
+    )
+    backend.initialize_experiment("exp-1")
+    for i in range(200):
+        backend.log_spans("exp-1", _trace(f"t{i}", i, error=i % 10 == 0))
+
+    pruned = backend.apply_retention("exp-1")
+    kept = _trace_ids(backend)
+    assert len(kept) + pruned == 200
+    assert {f"t{i}" for i in range(0, 200, 10)} <= kept
+    assert 30 < len(kept) - 20 < 80
+    assert backend.apply_retention("exp-1") == 0
+
+
+def test_retention_returns_pages_to_the_filesystem(tmp_path: Path) -> None:
+    path = str(tmp_path / "experiments")
+    backend = SQLiteBackend(path)
+    backend.initialize_experiment("exp-1")
+    backend.log_spans(
+        "exp-1", [span for i in range(300) for span in _trace(f"t{i}", i)]
+    )
+    db_path = backend._get_experiment_db_path("exp-1")
+    backend.export_experiment_db("exp-1")
+    size = db_path.stat().st_size
+    backend.end_experiment("exp-1")
+
+    pruning = SQLiteBackend(path, retention_max_spans="2")
+    pruning.initialize_experiment("exp-1")
+    pruning.log_spans("exp-1", _trace("last", 1000))
+    pruning.export_experiment_db("exp-1")
+
+    assert _trace_ids(pruning) == {"last"}
+    assert db_path.stat().st_size < size / 2
+
+
+def test_spans_since_after_retention_removed_the_newest_rows(tmp_path: Path) -> None:
+    now = time.time_ns()
+    backend = SQLiteBackend(str(tmp_path / "experiments"), retention_max_age="3600")
+    backend.initialize_experiment("exp-1")
+    backend.log_spans("exp-1", _trace("t1", now))
+    # ingested last, so its spans hold the highest rowids
+    backend.log_spans("exp-1", _trace("ancient", now - 2 * 3600 * 10**9))
+    first = backend.get_spans_since("exp-1")
+    assert {s["trace_id"] for s in first["items"]} == {"t1", "ancient"}
+
+    assert backend.apply_retention("exp-1") == 1
+    backend.log_spans("exp-1", _trace("t2", now + 10))
+
+    second = backend.get_spans_since("exp-1", since=first["cursor"])
+    assert [s["span_id"] for s in second["items"]] == ["t2-0", "t2-1"]
@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import pytest
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+
+
+def _span(span_id: str, name: str, **fields: object) -> dict:
+    return {
+        "trace_id": "t" * 32,
+        "span_id": span_id,
+        "name": name,
+        "start_time_unix_nano": int(span_id),
+        "end_time_unix_nano": int(span_id) + 10,
+        **fields,
+    }
+
+
+SPANS = [
+    _span(
+        "1",
+        "chat",
+        attributes={
+            "gen_ai.prompt.0.content": "What is the capital of France?",
+            "gen_ai.completion.0.content": "Paris",
+            "http.url": "https://example.com/hidden",
+        },
+    ),
+    _span("2", "execute_tool", attributes={"gen_ai.tool.name": "weather_lookup"}),
+    _span(
+        "3",
+        "retrieve",
+        status_code=2,
+        events=[
+            {
+                "name": "exception",
+                "timestamp": 3,
+                "attributes": {"exception.message": "connection refused"},
+            }
+        ],
+    ),
+]
+
+
+@pytest.fixture
+def search_backend(tmp_path: Path) -> SQLiteBackend:
+    backend = SQLiteBackend(str(tmp_path / "experiments"), span_search=True)
+    backend.initialize_experiment("exp-1")
+    backend.log_spans("exp-1", SPANS)
+    return backend
+
+
+def test_search_spans_matches_selected_fields(search_backend: SQLiteBackend) -> None:
+    [span] = search_backend.search_spans("exp-1", "capital france")
+    assert span["span_id"] == "1"
+    assert "[capital]" in span["snippet"]
+
+    assert [s["span_id"] for s in search_backend.search_spans("exp-1", "weather*")] == [
+        "2"
+    ]
+    assert [s["span_id"] for s in search_backend.search_spans("exp-1", "refused")] == [
+        "3"
+    ]
+    assert [
+        s["span_id"] for s in search_backend.search_spans("exp-1", "name:retrieve")
+    ] == ["3"]
+    assert search_backend.search_spans("exp-1", "hidden") == []
+    assert search_backend.search_spans("exp-1", "paris", trace_id="other") == []
+
+
+def test_search_index_follows_replaced_spans(search_backend: SQLiteBackend) -> None:
+    search_backend.log_span(
+        "exp-1",
+        **_span("1", "chat", attributes={"gen_ai.prompt.0.content": "Berlin"}),
+    )
+
+    assert search_backend.search_spans("exp-1", "france") == []
+    assert [s["span_id"] for s in search_backend.search_spans("exp-1", "berlin")] == [
+        "1"
+    ]
+
+
+def test_search_index_is_built_for_existing_spans(tmp_path: Path) -> None:
+    path = str(tmp_path / "experiments")
+    backend = SQLiteBackend(path)
+    backend.initialize_experiment("exp-1")
+    backend.log_spans("exp-1", SPANS)
+    with pytest.raises(ValueError, match="not enabled"):
+        backend.search_spans("exp-1", "paris")
+
+    searchable = SQLiteBackend(path, span_search="true")
+    searchable.initialize_experiment("exp-1")
+    assert [s["span_id"] for s in searchable.search_spans("exp-1", "paris")] == ["1"]
+
+
+def test_invalid_search_query(search_backend: SQLiteBackend) -> None:
+    with pytest.raises(ValueError, match="Invalid search query"):
+        search_backend.search_spans("exp-1", '"unterminated')
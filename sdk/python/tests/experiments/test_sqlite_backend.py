@@ -0,0 +1,237 @@
+import gc
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from luml.experiments.backends import BackendRegistry
+from luml.experiments.backends.sqlite import SQLiteBackend
+from luml.experiments.tracker import ExperimentTracker
+
+
+def test_log_dynamic_auto_increments_step(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    for value in (0.5, 0.4, 0.3):
+        backend.log_dynamic(experiment_id, "loss", value)
+
+    data = backend.get_experiment_data(experiment_id)
+    assert [p["step"] for p in data["dynamic_metrics"]["loss"]] == [0, 1, 2]
+
+
+def test_buffered_log_dynamic_flushes_on_read(tmp_path: Path) -> None:
+    backend = SQLiteBackend(str(tmp_path / "experiments"), buffered="true")
+    backend.initialize_experiment("exp-1")
+
+    backend.log_dynamic("exp-1", "loss", 1.0, step=5)
+    backend.log_dynamic("exp-1", "loss", 0.9)
+    backend.log_dynamic("exp-1", "acc", 0.1)
+    assert backend._buffer is not None
+    assert backend._buffer.pending("exp-1") == 3
+
+    data = backend.get_experiment_data("exp-1")
+    assert backend._buffer.pending() == 0
+    assert data["dynamic_metrics"]["loss"] == [
+        {"value": 1.0, "step": 5},
+        {"value": 0.9, "step": 6},
+    ]
+    assert data["dynamic_metrics"]["acc"] == [{"value": 0.1, "step": 0}]
+
+
+def test_buffered_log_dynamic_flushes_on_size(tmp_path: Path) -> None:
+    backend = SQLiteBackend(str(tmp_path / "experiments"), buffered=True, flush_size=10)
+    backend.initialize_experiment("exp-1")
+
+    for i in range(25):
+        backend.log_dynamic("exp-1", "loss", float(i))
+
+    assert backend._buffer is not None
+    assert backend._buffer.pending() == 5
+    conn = backend._get_experiment_connection("exp-1")
+    assert conn.execute("SELECT COUNT(*) FROM dynamic_metrics").fetchone()[0] == 20
+
+
+def test_buffered_tracker_end_experiment_flushes(tmp_path: Path) -> None:
+    tracker = ExperimentTracker(
+        f"sqlite://{tmp_path / 'experiments'}?buffered=1&flush_interval=60"
+    )
+    exp_id = tracker.start_experiment()
+    for i in range(3):
+        tracker.log_dynamic("loss", 1.0 / (i + 1))
+    tracker.end_experiment()
+
+    data = tracker.get_experiment(exp_id)
+    assert len(data["dynamic_metrics"]["loss"]) == 3
+    assert data["metadata"]["status"] == "completed"
+
+
+def test_dropped_backend_stops_its_threads(tmp_path: Path) -> None:
+    path = tmp_path / "experiments"
+    backend = SQLiteBackend(str(path), buffered=True, flush_interval=60)
+    backend.initialize_experiment("exp-1")
+    backend.log_dynamic("exp-1", "loss", 0.5)
+    threads = [t for t in threading.enumerate() if str(path) in t.name]
+    assert backend._buffer is not None
+    assert backend._buffer._thread is not None
+    threads.append(backend._buffer._thread)
+    assert len(threads) == 3
+    assert all(t.is_alive() for t in threads)
+
+    del backend
+    gc.collect()
+
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    # pending metrics are flushed when the backend is collected
+    data = SQLiteBackend(str(path)).get_experiment_data("exp-1")
+    assert data["dynamic_metrics"]["loss"] == [{"value": 0.5, "step": 0}]
+
+
+def test_unknown_backend_option_raises(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Invalid options for backend 'sqlite'"):
+        BackendRegistry.from_connection_string(f"sqlite://{tmp_path}?bogus=1")
+
+
+def test_pragma_profile_from_connection_string(tmp_path: Path) -> None:
+    backend = BackendRegistry.from_connection_string(
+        f"sqlite://{tmp_path / 'experiments'}?pragma_profile=fast&pool_size=3"
+    )
+    assert isinstance(backend, SQLiteBackend)
+    backend.initialize_experiment("exp-1")
+    conn = backend._get_experiment_connection("exp-1")
+    assert conn.execute("PRAGMA temp_store").fetchone() == (2,)
+    synchronous = backend._write(
+        backend._get_experiment_db_path("exp-1"),
+        lambda conn: conn.execute("PRAGMA synchronous").fetchone(),
+        transactional=False,
+    )
+    assert synchronous == (1,)
+
+    with pytest.raises(ValueError, match="Unknown pragma profile"):
+        SQLiteBackend(str(tmp_path / "other"), pragma_profile="reckless")
+
+
+def test_pool_evicts_least_recently_used(tmp_path: Path) -> None:
+    backend = SQLiteBackend(str(tmp_path / "experiments"), pool_size=3)
+    for exp_id in ("a", "b", "c"):
+        backend.initialize_experiment(exp_id)
+        backend.end_experiment(exp_id)
+    paths = {e: str(backend._get_experiment_db_path(e)) for e in ("a", "b", "c")}
+
+    backend._get_experiment_connection("a")
+    backend._get_experiment_connection("b")
+    backend._get_experiment_connection("a")
+    backend._get_experiment_connection("c")
+
+    open_paths = backend.pool.get_stats()["connections"]
+    assert paths["b"] not in open_paths
+    assert paths["a"] in open_paths
+    assert str(backend.meta_db_path) in open_paths
+
+
+def test_pool_never_evicts_active_experiments(tmp_path: Path) -> None:
+    backend = SQLiteBackend(str(tmp_path / "experiments"), pool_size=2)
+    exp_ids = [f"exp-{i}" for i in range(4)]
+    for exp_id in exp_ids:
+        backend.initialize_experiment(exp_id)
+    writers = {
+        e: backend.pool.get_writer(backend._get_experiment_db_path(e)) for e in exp_ids
+    }
+
+    for step in range(3):
+        for exp_id in exp_ids:
+            backend.log_static(exp_id, "step", step)
+            backend.log_dynamic(exp_id, "loss", 1.0 / (step + 1), step)
+
+    stats = backend.pool.get_stats()
+    assert stats["total_connections"] == len(exp_ids) + 1
+    for exp_id in exp_ids:
+        path = backend._get_experiment_db_path(exp_id)
+        assert backend.pool.get_writer(path) is writers[exp_id]
+        assert backend.get_experiment_data(exp_id)["static_params"]["step"] == 2
+
+    for exp_id in exp_ids:
+        backend.end_experiment(exp_id)
+    assert backend.pool.get_stats()["total_connections"] <= 2
+
+
+def test_failed_reader_is_reopened(backend: SQLiteBackend, experiment_id: str) -> None:
+    conn = backend._get_experiment_connection(experiment_id)
+    assert backend._get_experiment_connection(experiment_id) is conn
+
+    conn.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+    reopened = backend._get_experiment_connection(experiment_id)
+    assert reopened is not conn
+    assert reopened.execute("SELECT COUNT(*) FROM dynamic_metrics").fetchone() == (0,)
+
+
+def test_bulk_logging(backend: SQLiteBackend, experiment_id: str) -> None:
+    np = pytest.importorskip("numpy")
+
+    backend.log_static_many(experiment_id, {"lr": 0.01, "layers": [64, 32]})
+    backend.log_dynamic_many(experiment_id, {"loss": 1.0, "acc": 0.5})
+    backend.log_dynamic_many(experiment_id, {"loss": 0.8, "acc": 0.6})
+    backend.log_dynamic_series(experiment_id, "lr", np.linspace(0.1, 0.0, 1000))
+    backend.log_dynamic_series(experiment_id, "val", [0.1, 0.2], steps=[10, 20])
+    backend.log_eval_samples(
+        experiment_id,
+        [
+            {"eval_id": str(i), "dataset_id": "ds", "inputs": {"q": i}}
+            for i in range(100)
+        ],
+    )
+
+    data = backend.get_experiment_data(experiment_id)
+    assert data["static_params"] == {"lr": 0.01, "layers": [64, 32]}
+    assert data["dynamic_metrics"]["loss"] == [
+        {"value": 1.0, "step": 0},
+        {"value": 0.8, "step": 1},
+    ]
+    assert len(data["dynamic_metrics"]["lr"]) == 1000
+    assert data["dynamic_metrics"]["lr"][-1]["step"] == 999
+    assert [p["step"] for p in data["dynamic_metrics"]["val"]] == [10, 20]
+    conn = backend._get_experiment_connection(experiment_id)
+    assert conn.execute("SELECT COUNT(*) FROM evals").fetchone()[0] == 100
+
+
+def test_log_dynamic_series_length_mismatch(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    with pytest.raises(ValueError, match="same length"):
+        backend.log_dynamic_series(experiment_id, "loss", [1.0, 2.0], steps=[1])
+
+
+def test_concurrent_logging_from_threads(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    def worker(worker_id: int) -> None:
+        for _ in range(50):
+            backend.log_dynamic(experiment_id, f"worker_{worker_id % 2}", 1.0)
+        backend.log_static(experiment_id, f"param_{worker_id}", worker_id)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    data = backend.get_experiment_data(experiment_id)
+    for key in ("worker_0", "worker_1"):
+        steps = [p["step"] for p in data["dynamic_metrics"][key]]
+        assert steps == list(range(200))
+    assert len(data["static_params"]) == 8
+
+
+def test_failed_write_does_not_affect_other_writes(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    with pytest.raises(ValueError, match="not found"):
+        backend.link_eval_sample_to_trace(experiment_id, "ds", "missing", "trace")
+    backend.log_static(experiment_id, "lr", 0.1)
+
+    assert backend.get_experiment_data(experiment_id)["static_params"] == {"lr": 0.1}
@@ -0,0 +1,95 @@
+import gc
+import multiprocessing
+import sys
+import time
+import weakref
+from pathlib import Path
+
+import pytest
+
+from luml.experiments.backends import BackendRegistry
+from luml.experiments.backends.sqlite_mp import MultiProcessSQLiteBackend
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="sqlite-mp requires Unix domain sockets"
+)
+
+
+def _log_rank(connection_string: str, rank: int, steps: int) -> None:
+    backend = BackendRegistry.from_connection_string(connection_string)
+    for step in range(steps):
+        backend.log_dynamic("exp-1", f"loss/rank{rank}", 1.0 / (step + 1), step)
+    backend.log_dynamic_many("exp-1", {"shared": float(rank)})
+    backend.flush()
+    backend.close()
+
+
+def test_ranks_log_through_one_collector(tmp_path: Path) -> None:
+    connection_string = f"sqlite-mp://{tmp_path / 'experiments'}?idle_timeout=1"
+    backend = BackendRegistry.from_connection_string(connection_string)
+    assert isinstance(backend, MultiProcessSQLiteBackend)
+    backend.initialize_experiment("exp-1", name="ddp")
+
+    ctx = multiprocessing.get_context("spawn")
+    ranks = [
+        ctx.Process(target=_log_rank, args=(connection_string, rank, 200))
+        for rank in range(4)
+    ]
+    for process in ranks:
+        process.start()
+    for process in ranks:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    data = backend.get_experiment_data("exp-1")
+    for rank in range(4):
+        assert len(data["dynamic_metrics"][f"loss/rank{rank}"]) == 200
+    # auto steps are assigned by the collector, so ranks never collide
+    shared_steps = sorted(p["step"] for p in data["dynamic_metrics"]["shared"])
+    assert shared_steps == [0, 1, 2, 3]
+    backend.close()
+
+
+def test_batched_write_errors_surface_on_flush(tmp_path: Path) -> None:
+    backend = MultiProcessSQLiteBackend(str(tmp_path / "experiments"), idle_timeout=1)
+    backend.log_static("missing", "lr", 0.1)
+
+    with pytest.raises(ValueError, match="not initialized"):
+        backend.flush()
+    backend.close()
+
+
+def test_dropped_backend_is_collected(tmp_path: Path) -> None:
+    path = tmp_path / "experiments"
+    reader = MultiProcessSQLiteBackend(str(path), idle_timeout=1)
+    reader.initialize_experiment("exp-1")
+    backend = MultiProcessSQLiteBackend(str(path), idle_timeout=1)
+    backend.log_static("exp-1", "lr", 0.1)
+    sender = backend._sender
+    assert sender is not None
+    ref = weakref.ref(backend)
+
+    del backend
+    gc.collect()
+
+    assert ref() is None
+    sender.join(timeout=5)
+    assert not sender.is_alive()
+    # the pending batch is sent when the backend is collected
+    deadline = time.monotonic() + 5
+    while "lr" not in reader.get_experiment_data("exp-1")["static_params"]:
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    reader.close()
+
+
+def test_collector_rejects_other_options(tmp_path: Path) -> None:
+    path = tmp_path / "experiments"
+    backend = MultiProcessSQLiteBackend(str(path), idle_timeout=1, buffered="true")
+    backend.initialize_experiment("exp-1")
+
+    other = MultiProcessSQLiteBackend(str(path), idle_timeout=1)
+    with pytest.raises(ValueError, match="running with options"):
+        other.initialize_experiment("exp-2")
+    other.close()
+    backend.close()
@@ -0,0 +1,201 @@
+import pytest
+
+from luml.experiments.backends.sqlite import SQLiteBackend
+from luml.experiments.utils import SpanType
+
+
+def _span(
+    trace_id: str,
+    span_id: str,
+    start: int,
+    parent_span_id: str | None = None,
+    status_code: int = 0,
+    attributes: dict | None = None,
+) -> dict:
+    return {
+        "trace_id": trace_id,
+        "span_id": span_id,
+        "name": f"span-{span_id}",
+        "start_time_unix_nano": start,
+        "end_time_unix_nano": start + 100,
+        "parent_span_id": parent_span_id,
+        "status_code": status_code,
+        "attributes": attributes,
+    }
+
+
+@pytest.fixture
+def traced_backend(backend: SQLiteBackend, experiment_id: str) -> SQLiteBackend:
+    spans = []
+    for t in range(5):
+        trace_id = f"{t:032x}"
+        base = t * 1000
+        spans.append(_span(trace_id, f"{t}0", base))
+        spans.append(
+            _span(
+                trace_id,
+                f"{t}1",
+                base + 10,
+                parent_span_id=f"{t}0",
+                attributes={"gen_ai.operation.name": "chat"},
+            )
+        )
+        spans.append(
+            _span(
+                trace_id,
+                f"{t}2",
+                base + 20,
+                parent_span_id=f"{t}1",
+                status_code=2 if t == 3 else 1,
+            )
+        )
+    backend.log_spans(experiment_id, spans)
+    return backend
+
+
+def test_get_trace_reconstructs_tree(
+    traced_backend: SQLiteBackend, experiment_id: str
+) -> None:
+    trace = traced_backend.get_trace(experiment_id, f"{1:032x}")
+
+    assert trace["span_count"] == 3
+    [root] = trace["spans"]
+    assert root["span_id"] == "10"
+    [child] = root["children"]
+    assert child["dfs_span_type"] == SpanType.CHAT.value
+    assert [c["span_id"] for c in child["children"]] == ["12"]
+
+
+def test_get_trace_missing(backend: SQLiteBackend, experiment_id: str) -> None:
+    with pytest.raises(ValueError, match="not found"):
+        backend.get_trace(experiment_id, "missing")
+
+
+def test_query_spans_filters_and_paginates(
+    traced_backend: SQLiteBackend, experiment_id: str
+) -> None:
+    errors = traced_backend.query_spans(experiment_id, status_code=2)
+    assert [s["span_id"] for s in errors["items"]] == ["32"]
+
+    chat = traced_backend.query_spans(experiment_id, span_type=SpanType.CHAT)
+    assert len(chat["items"]) == 5
+
+    children = traced_backend.query_spans(experiment_id, parent_span_id="20")
+    assert [s["span_id"] for s in children["items"]] == ["21"]
+
+    seen = []
+    start_after = None
+    while True:
+        page = traced_backend.query_spans(
+            experiment_id, start_time_from=1000, limit=4, start_after=start_after
+        )
+        seen.extend(s["span_id"] for s in page["items"])
+        start_after = page["cursor"]
+        if start_after is None:
+            break
+    assert len(seen) == 12
+    assert seen[0] == "10"
+
+
+def test_list_traces(traced_backend: SQLiteBackend, experiment_id: str) -> None:
+    page = traced_backend.list_traces(experiment_id, limit=3)
+    assert [t["trace_id"] for t in page["items"]] == [f"{t:032x}" for t in (4, 3, 2)]
+    assert page["items"][0]["span_count"] == 3
+
+    page = traced_backend.list_traces(
+        experiment_id, limit=3, start_after=page["cursor"]
+    )
+    assert [t["trace_id"] for t in page["items"]] == [f"{t:032x}" for t in (1, 0)]
+    assert page["cursor"] is None
+
+    window = traced_backend.list_traces(
+        experiment_id, start_time_from=1000, start_time_to=3000
+    )
+    assert len(window["items"]) == 2
+
+
+def _usage(model: str, prompt: int, completion: int) -> dict:
+    return {
+        "gen_ai.operation.name": "chat",
+        "gen_ai.request.model": model,
+        "gen_ai.usage.input_tokens": prompt,
+        "gen_ai.usage.output_tokens": completion,
+    }
+
+
+def test_list_traces_rollups_across_batches(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    trace_id = "a" * 32
+    # children arrive before the root, as with a batching span processor
+    backend.log_spans(
+        experiment_id,
+        [
+            _span(trace_id, "1", 50, "0", attributes=_usage("gpt", 10, 5)),
+            _span(trace_id, "2", 60, "0", status_code=2),
+        ],
+    )
+    assert backend.list_traces(experiment_id)["items"] == []
+
+    backend.log_span(
+        experiment_id, **_span(trace_id, "3", 70, "0", attributes=_usage("gpt", 1, 2))
+    )
+    backend.log_spans(
+        experiment_id,
+        [
+            _span(trace_id, "4", 80, "0", attributes=_usage("claude", 7, 3)),
+            _span(trace_id, "0", 0, status_code=1),
+        ],
+    )
+
+    [trace] = backend.list_traces(experiment_id)["items"]
+    assert trace["root_span_id"] == "0"
+    assert trace["status_code"] == 1
+    assert trace["start_time_unix_nano"] == 0
+    assert trace["duration_nano"] == 180
+    assert trace["span_count"] == 5
+    assert trace["error_count"] == 1
+    assert trace["prompt_tokens"] == 18
+    assert trace["completion_tokens"] == 10
+    assert trace["token_usage"] == {
+        "gpt": {"prompt_tokens": 11, "completion_tokens": 7},
+        "claude": {"prompt_tokens": 7, "completion_tokens": 3},
+    }
+
+
+def test_relogged_span_is_not_counted_twice(
+    backend: SQLiteBackend, experiment_id: str
+) -> None:
+    trace_id = "b" * 32
+    backend.log_spans(
+        experiment_id,
+        [
+            _span(trace_id, "0", 0),
+            _span(trace_id, "1", 10, "0", attributes=_usage("gpt", 10, 5)),
+        ],
+    )
+    backend.log_spans(
+        experiment_id,
+        [_span(trace_id, "1", 10, "0", status_code=2, attributes=_usage("gpt", 20, 5))],
+    )
+
+    [trace] = backend.list_traces(experiment_id)["items"]
+    assert trace["span_count"] == 2
+    assert trace["error_count"] == 1
+    assert trace["token_usage"] == {
+        "gpt": {"prompt_tokens": 20, "completion_tokens": 5}
+    }
+
+
+def test_trace_summaries_are_built_for_existing_databases(
+    traced_backend: SQLiteBackend, experiment_id: str
+) -> None:
+    expected = traced_backend.list_traces(experiment_id)
+    traced_backend._write(
+        traced_backend._get_experiment_db_path(experiment_id),
+        lambda conn: conn.execute("DELETE FROM trace_summaries"),
+    )
+
+    reopened = SQLiteBackend(str(traced_backend.base_path))
+    reopened.initialize_experiment(experiment_id)
+    assert reopened.list_traces(experiment_id) == expected
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+
+from luml.experiments.tracing.processor import (  # noqa: E402
+    DropPolicy,
+    LumlBatchSpanProcessor,
+)
+from luml.experiments.tracing.span_exporter import LumlSpanExporter  # noqa: E402
+from luml.experiments.tracker import ExperimentTracker  # noqa: E402
+
+
+@pytest.fixture
+def tracker(tmp_path: Path) -> ExperimentTracker:
+    tracker = ExperimentTracker(f"sqlite://{tmp_path / 'experiments'}")
+    tracker.start_experiment("exp-1")
+    return tracker
+
+
+def _count_spans(tracker: ExperimentTracker) -> int:
+    conn = tracker.backend._get_experiment_connection("exp-1")  # type: ignore[attr-defined]
+    return conn.execute("SELECT COUNT(*) FROM spans").fetchone()[0]
+
+
+def test_batch_processor_exports_on_force_flush(tracker: ExperimentTracker) -> None:
+    exporter = LumlSpanExporter(
+        log_fn=tracker.log_span, batch_size=10, log_batch_fn=tracker.log_spans
+    )
+    processor = LumlBatchSpanProcessor(exporter, schedule_delay_millis=60_000)
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    tracer = provider.get_tracer("test")
+
+    with tracer.start_as_current_span("root"):
+        for i in range(25):
+            with tracer.start_as_current_span(f"child-{i}") as span:
+                span.set_attribute("gen_ai.operation.name", "chat")
+
+    assert processor.force_flush()
+    assert _count_spans(tracker) == 26
+    provider.shutdown()
+
+
+def test_batch_processor_drop_newest(tracker: ExperimentTracker) -> None:
+    exporter = LumlSpanExporter(log_fn=tracker.log_span)
+    processor = LumlBatchSpanProcessor(
+        exporter,
+        max_queue_size=5,
+        max_export_batch_size=100,
+        schedule_delay_millis=60_000,
+        drop_policy=DropPolicy.DROP_NEWEST,
+    )
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    tracer = provider.get_tracer("test")
+
+    for i in range(8):
+        with tracer.start_as_current_span(f"span-{i}"):
+            pass
+
+    assert processor.dropped_spans == 3
+    provider.shutdown()
+    assert _count_spans(tracker) == 5
@@ -0,0 +1,56 @@
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from luml.modelref import ArtifactMap, DiskArtifact, MemoryArtifact, ModelReference
+
+
+def test_artifacts_expose_size_and_stream(tmp_path: Path) -> None:
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"x" * 4096)
+
+    disk = DiskArtifact(path)
+    assert disk.size() == 4096
+    with disk.open() as stream:
+        assert stream.read() == b"x" * 4096
+
+    memory = MemoryArtifact(b"abc")
+    assert memory.size() == 3
+    with memory.open() as stream:
+        assert stream.read() == b"abc"
+
+
+def test_append_metadata_streams_artifacts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    model_path = tmp_path / "model.luml"
+    with tarfile.open(model_path, "w"):
+        pass
+    large = tmp_path / "exp.db"
+    large.write_bytes(bytes(range(256)) * 20_000)
+
+    def fail(self: DiskArtifact) -> bytes:
+        raise AssertionError("artifact was read into memory")
+
+    monkeypatch.setattr(DiskArtifact, "get_artifact", fail)
+
+    ModelReference(str(model_path))._append_metadata(
+        idx="snapshot",
+        tags=["test"],
+        payload={},
+        data=[
+            ArtifactMap(artifact=DiskArtifact(large), remote_path="exp.db"),
+            ArtifactMap(artifact=MemoryArtifact(b"{}"), remote_path="index.json"),
+        ],
+    )
+
+    with tarfile.open(model_path) as tar:
+        member = tar.getmember("meta_artifacts/snapshot/exp.db")
+        assert member.size == large.stat().st_size
+        extracted = tar.extractfile(member)
+        assert extracted is not None
+        assert extracted.read() == large.read_bytes()
+        index = tar.extractfile("meta_artifacts/snapshot/index.json")
+        assert index is not None
+        assert index.read() == b"{}"
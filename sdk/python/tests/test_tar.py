@@ -0,0 +1,69 @@
+import hashlib
+import json
+import tarfile
+from pathlib import Path
+from typing import IO, Any
+
+import pytest
+
+from luml.utils import tar as tar_module
+from luml.utils.tar import create_and_index_tar, generate_index, write_indexed_tar
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "attachments"
+    (root / "plots" / "nested").mkdir(parents=True)
+    (root / "empty.txt").write_bytes(b"")
+    (root / "block.bin").write_bytes(b"b" * tarfile.BLOCKSIZE)
+    (root / "plots" / "loss.png").write_bytes(b"\x89PNG" * 1000)
+    (root / "plots" / "nested" / ("long-name-" * 20 + ".txt")).write_text("pax")
+    (root / "hardlink.bin").hardlink_to(root / "block.bin")
+    return root
+
+
+def test_index_matches_archive(source_dir: Path, tmp_path: Path) -> None:
+    tar_path = tmp_path / "out.tar"
+    index = write_indexed_tar(source_dir, tar_path)
+
+    with tarfile.open(tar_path) as tar:
+        assert index == generate_index(tar)
+        for name, (offset, size) in index.items():
+            member = tar.extractfile(name)
+            assert member is not None
+            with open(tar_path, "rb") as raw:
+                raw.seek(offset)
+                assert raw.read(size) == member.read()
+
+
+def test_parallel_hashing(source_dir: Path) -> None:
+    tar_artifact, index_artifact = create_and_index_tar(source_dir, hash_workers=4)
+
+    index = json.loads(index_artifact.get_artifact())
+    loss = (source_dir / "plots" / "loss.png").read_bytes()
+    offset, size, digest = index["attachments/plots/loss.png"]
+    assert size == len(loss)
+    assert digest == hashlib.sha256(loss).hexdigest()
+    with tar_artifact.open() as f:
+        f.seek(offset)
+        assert f.read(size) == loss
+
+
+def test_hashing_reads_each_file_once(
+    source_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    opened: list[Path] = []
+
+    def counting_open(path: Path, *args: Any, **kwargs: Any) -> IO:  # noqa: ANN401
+        opened.append(path)
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(tar_module, "open", counting_open, raising=False)
+
+    index = write_indexed_tar(source_dir, tmp_path / "out.tar", hash_workers=2)
+
+    files = [p for p in source_dir.rglob("*") if p.is_file()]
+    assert sorted(opened) == sorted(files)
+    for path in files:
+        name = (Path(source_dir.name) / path.relative_to(source_dir)).as_posix()
+        assert index[name][2] == hashlib.sha256(path.read_bytes()).hexdigest()